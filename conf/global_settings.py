@@ -186,6 +186,10 @@ DATABASES = {}
 # Classes used to implement DB routing behavior.
 DATABASE_ROUTERS = []
 
+# The maximum number of threads running the queries of the awaitable QuerySet
+# methods, each on its own database connections.
+DATABASE_ASYNC_MAX_WORKERS = 8
+
 # The email backend to use. For possible shortcuts see django.core.mail.
 # The default is to use the SMTP backend.
 # Third-party backends can be specified by providing a Python path
@@ -491,6 +495,30 @@ CACHES = {
 CACHE_MIDDLEWARE_KEY_PREFIX = ''
 CACHE_MIDDLEWARE_SECONDS = 600
 CACHE_MIDDLEWARE_ALIAS = 'default'
+# Number of seconds a page stays cached after it went stale. During that time
+# one request regenerates it while the others are served the stale page.
+CACHE_MIDDLEWARE_STALE_SECONDS = 0
+# Weight of the probabilistic early regeneration of cached pages (1 is a good
+# value to start with). 0 only regenerates pages once they are stale.
+CACHE_MIDDLEWARE_EARLY_EXPIRATION = 0
+
+###############
+# COMPRESSION #
+###############
+
+# Content codings used by CompressionMiddleware, preferred first. br and zstd
+# require the brotli and zstandard modules and are skipped if they're missing.
+COMPRESSION_ENCODINGS = ['br', 'zstd', 'gzip', 'deflate']
+# Compression level of each content coding, e.g. {'gzip': 9}. The defaults
+# are 4 for br, 3 for zstd and 6 for gzip and deflate.
+COMPRESSION_LEVELS = {}
+# Responses shorter than this number of bytes aren't compressed.
+COMPRESSION_MIN_LENGTH = 200
+# Maximum number of bytes of a streaming response buffered by the compressor.
+COMPRESSION_STREAMING_BUFFER_SIZE = 64 * 1024
+# Alias of the cache in which compressed pages of the cache middleware are
+# kept, or None not to keep them.
+COMPRESSION_CACHE_ALIAS = None
 
 ##################
 # AUTHENTICATION #
@@ -614,6 +642,11 @@ STATICFILES_FINDERS = [
 # Migration module overrides for apps, by app label.
 MIGRATION_MODULES = {}
 
+# Directory in which the project states built from the migrations are kept,
+# so that later commands only replay the migrations added since. None disables
+# the snapshots.
+MIGRATION_STATE_CACHE_DIR = None
+
 #################
 # SYSTEM CHECKS #
 #################
@@ -26,8 +26,8 @@ class BrinIndex(MaxLengthMixin, Index):
             kwargs['pages_per_range'] = self.pages_per_range
         return path, args, kwargs
 
-    def create_sql(self, model, schema_editor, using=''):
-        statement = super().create_sql(model, schema_editor, using=' USING brin')
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        statement = super().create_sql(model, schema_editor, using=' USING brin', **kwargs)
         if self.pages_per_range is not None:
             statement.parts['extra'] = ' WITH (pages_per_range={})'.format(
                 schema_editor.quote_value(self.pages_per_range)
@@ -51,8 +51,8 @@ class GinIndex(Index):
             kwargs['gin_pending_list_limit'] = self.gin_pending_list_limit
         return path, args, kwargs
 
-    def create_sql(self, model, schema_editor, using=''):
-        statement = super().create_sql(model, schema_editor, using=' USING gin')
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        statement = super().create_sql(model, schema_editor, using=' USING gin', **kwargs)
         with_params = []
         if self.gin_pending_list_limit is not None:
             with_params.append('gin_pending_list_limit = %d' % self.gin_pending_list_limit)
@@ -79,8 +79,8 @@ class GistIndex(MaxLengthMixin, Index):
             kwargs['fillfactor'] = self.fillfactor
         return path, args, kwargs
 
-    def create_sql(self, model, schema_editor):
-        statement = super().create_sql(model, schema_editor, using=' USING gist')
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        statement = super().create_sql(model, schema_editor, using=' USING gist', **kwargs)
         with_params = []
         if self.buffering is not None:
             with_params.append('buffering = {}'.format('on' if self.buffering else 'off'))
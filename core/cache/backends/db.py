@@ -6,6 +6,7 @@ from datetime import datetime
 from django.conf import settings
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 from django.db import DatabaseError, connections, models, router, transaction
+from django.db.models.constants import OnConflict
 from django.utils import timezone
 from django.utils.encoding import force_bytes
 from django.utils.inspect import func_supports_parameter
@@ -61,15 +62,7 @@ class DatabaseCache(BaseDatabaseCache):
         if row is None:
             return default
 
-        expires = row[2]
-        expression = models.Expression(output_field=models.DateTimeField())
-        for converter in (connection.ops.get_db_converters(expression) +
-                          expression.get_db_converters(connection)):
-            if func_supports_parameter(converter, 'context'):  # RemovedInDjango30Warning
-                expires = converter(expires, expression, connection, {})
-            else:
-                expires = converter(expires, expression, connection)
-
+        expires = self._convert_expires(connection, row[2])
         if expires < timezone.now():
             db = router.db_for_write(self.cache_model_class)
             connection = connections[db]
@@ -102,19 +95,10 @@ class DatabaseCache(BaseDatabaseCache):
             num = cursor.fetchone()[0]
             now = timezone.now()
             now = now.replace(microsecond=0)
-            if timeout is None:
-                exp = datetime.max
-            elif settings.USE_TZ:
-                exp = datetime.utcfromtimestamp(timeout)
-            else:
-                exp = datetime.fromtimestamp(timeout)
-            exp = exp.replace(microsecond=0)
+            exp = self._expiry_datetime(timeout)
             if num > self._max_entries:
                 self._cull(db, cursor, now)
-            pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
-            # The DB column is expecting a string, so make sure the value is a
-            # string, not bytes. Refs #19274.
-            b64encoded = base64.b64encode(pickled).decode('latin1')
+            b64encoded = self._encode(value)
             try:
                 # Note: typecasting for datetimes is needed by some 3rd party
                 # database backends. All core backends work without typecasting,
@@ -126,14 +110,7 @@ class DatabaseCache(BaseDatabaseCache):
                     result = cursor.fetchone()
 
                     if result:
-                        current_expires = result[1]
-                        expression = models.Expression(output_field=models.DateTimeField())
-                        for converter in (connection.ops.get_db_converters(expression) +
-                                          expression.get_db_converters(connection)):
-                            if func_supports_parameter(converter, 'context'):  # RemovedInDjango30Warning
-                                current_expires = converter(current_expires, expression, connection, {})
-                            else:
-                                current_expires = converter(current_expires, expression, connection)
+                        current_expires = self._convert_expires(connection, result[1])
 
                     exp = connection.ops.adapt_datetimefield_value(exp)
                     if result and (mode == 'set' or (mode == 'add' and current_expires < now)):
@@ -150,6 +127,116 @@ class DatabaseCache(BaseDatabaseCache):
             else:
                 return True
 
+    def get_many(self, keys, version=None):
+        key_map = {}
+        for key in keys:
+            made_key = self.make_key(key, version=version)
+            self.validate_key(made_key)
+            key_map[made_key] = key
+        if not key_map:
+            return {}
+
+        db = router.db_for_read(self.cache_model_class)
+        connection = connections[db]
+        table = connection.ops.quote_name(self._table)
+
+        rows = []
+        with connection.cursor() as cursor:
+            for batch in self._in_batches(connection, list(key_map)):
+                cursor.execute(
+                    "SELECT cache_key, value, expires FROM %s "
+                    "WHERE cache_key IN (%s)" % (table, ', '.join(['%s'] * len(batch))),
+                    batch,
+                )
+                rows.extend(cursor.fetchall())
+
+        now = timezone.now()
+        expired_keys = []
+        values = {}
+        for made_key, value, expires in rows:
+            if self._convert_expires(connection, expires) < now:
+                expired_keys.append(made_key)
+                continue
+            value = pickle.loads(base64.b64decode(force_bytes(connection.ops.process_clob(value))))
+            if value is not None:
+                values[key_map[made_key]] = value
+        if expired_keys:
+            self._base_delete_many(expired_keys)
+        return values
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        entries = []
+        for key, value in data.items():
+            made_key = self.make_key(key, version=version)
+            self.validate_key(made_key)
+            entries.append((made_key, self._encode(value)))
+        if not entries:
+            return []
+        timeout = self.get_backend_timeout(timeout)
+        db = router.db_for_write(self.cache_model_class)
+        connection = connections[db]
+        table = connection.ops.quote_name(self._table)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM %s" % table)
+            num = cursor.fetchone()[0]
+            now = timezone.now()
+            now = now.replace(microsecond=0)
+            if num > self._max_entries:
+                self._cull(db, cursor, now)
+            exp = connection.ops.adapt_datetimefield_value(self._expiry_datetime(timeout))
+            try:
+                with transaction.atomic(using=db):
+                    if connection.features.supports_update_conflicts:
+                        self._upsert(connection, cursor, table, entries, exp)
+                    else:
+                        self._update_or_insert(connection, cursor, table, entries, exp)
+            except DatabaseError:
+                # As in set(), failures are silent but the keys are reported.
+                return list(data)
+        return []
+
+    def _upsert(self, connection, cursor, table, entries, exp):
+        """Insert or update the entries with INSERT ... ON CONFLICT."""
+        columns = ['cache_key', 'value', 'expires']
+        suffix = connection.ops.on_conflict_suffix_sql(
+            columns, OnConflict.UPDATE, ['value', 'expires'], ['cache_key'],
+        )
+        batch_size = max(connection.ops.bulk_batch_size(columns, entries), 1)
+        for i in range(0, len(entries), batch_size):
+            batch = entries[i:i + batch_size]
+            values_sql = connection.ops.bulk_insert_sql(columns, [['%s', '%s', '%s']] * len(batch))
+            params = []
+            for key, b64encoded in batch:
+                params.extend([key, b64encoded, exp])
+            cursor.execute(
+                "INSERT INTO %s (cache_key, value, expires) %s %s" % (table, values_sql, suffix),
+                params,
+            )
+
+    def _update_or_insert(self, connection, cursor, table, entries, exp):
+        """Update the entries that exist, then insert the others."""
+        existing = set()
+        for batch in self._in_batches(connection, [key for key, _ in entries]):
+            cursor.execute(
+                "SELECT cache_key FROM %s "
+                "WHERE cache_key IN (%s)" % (table, ', '.join(['%s'] * len(batch))),
+                batch,
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        updates = [[b64encoded, exp, key] for key, b64encoded in entries if key in existing]
+        inserts = [[key, b64encoded, exp] for key, b64encoded in entries if key not in existing]
+        if updates:
+            cursor.executemany(
+                "UPDATE %s SET value = %%s, expires = %%s "
+                "WHERE cache_key = %%s" % table, updates,
+            )
+        if inserts:
+            cursor.executemany(
+                "INSERT INTO %s (cache_key, value, expires) "
+                "VALUES (%%s, %%s, %%s)" % table, inserts,
+            )
+
     def delete(self, key, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
@@ -161,6 +248,28 @@ class DatabaseCache(BaseDatabaseCache):
         with connection.cursor() as cursor:
             cursor.execute("DELETE FROM %s WHERE cache_key = %%s" % table, [key])
 
+    def delete_many(self, keys, version=None):
+        made_keys = []
+        for key in keys:
+            made_key = self.make_key(key, version=version)
+            self.validate_key(made_key)
+            made_keys.append(made_key)
+        self._base_delete_many(made_keys)
+
+    def _base_delete_many(self, keys):
+        if not keys:
+            return
+        db = router.db_for_write(self.cache_model_class)
+        connection = connections[db]
+        table = connection.ops.quote_name(self._table)
+
+        with connection.cursor() as cursor:
+            for batch in self._in_batches(connection, keys):
+                cursor.execute(
+                    "DELETE FROM %s WHERE cache_key IN (%s)" % (table, ', '.join(['%s'] * len(batch))),
+                    batch,
+                )
+
     def has_key(self, key, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
@@ -181,6 +290,42 @@ class DatabaseCache(BaseDatabaseCache):
                            [key, connection.ops.adapt_datetimefield_value(now)])
             return cursor.fetchone() is not None
 
+    def _encode(self, value):
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        # The DB column is expecting a string, so make sure the value is a
+        # string, not bytes. Refs #19274.
+        return base64.b64encode(pickled).decode('latin1')
+
+    def _expiry_datetime(self, timeout):
+        """Return the expiry datetime of a backend timeout."""
+        if timeout is None:
+            exp = datetime.max
+        elif settings.USE_TZ:
+            exp = datetime.utcfromtimestamp(timeout)
+        else:
+            exp = datetime.fromtimestamp(timeout)
+        return exp.replace(microsecond=0)
+
+    def _convert_expires(self, connection, expires):
+        """Convert an expires value read with a cursor to a datetime."""
+        expression = models.Expression(output_field=models.DateTimeField())
+        for converter in (connection.ops.get_db_converters(expression) +
+                          expression.get_db_converters(connection)):
+            if func_supports_parameter(converter, 'context'):  # RemovedInDjango30Warning
+                expires = converter(expires, expression, connection, {})
+            else:
+                expires = converter(expires, expression, connection)
+        return expires
+
+    def _in_batches(self, connection, keys):
+        """Split keys into lists small enough for an IN (...) clause."""
+        batch_size = max(connection.ops.bulk_batch_size(['cache_key'], keys), 1)
+        max_in_list_size = connection.ops.max_in_list_size()
+        if max_in_list_size:
+            batch_size = min(batch_size, max_in_list_size)
+        for i in range(0, len(keys), batch_size):
+            yield keys[i:i + batch_size]
+
     def _cull(self, db, cursor, now):
         if self._cull_frequency == 0:
             self.clear()
@@ -5,8 +5,10 @@ import os
 import pickle
 import random
 import tempfile
+import threading
 import time
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 from django.core.files.move import file_move_safe
@@ -15,6 +17,12 @@ from django.utils.encoding import force_bytes
 
 class FileBasedCache(BaseCache):
     cache_suffix = '.djcache'
+    # Number of threads reading and writing the files of get_many(),
+    # set_many() and delete_many(), shared by all the instances.
+    max_workers = 8
+    _executor = None
+    _executor_pid = None
+    _executor_lock = threading.Lock()
 
     def __init__(self, dir, params):
         super().__init__(params)
@@ -28,7 +36,9 @@ class FileBasedCache(BaseCache):
         return True
 
     def get(self, key, default=None, version=None):
-        fname = self._key_to_file(key, version)
+        return self._read(self._key_to_file(key, version), default)
+
+    def _read(self, fname, default=None):
         try:
             with open(fname, 'rb') as f:
                 if not self._is_expired(f):
@@ -37,10 +47,25 @@ class FileBasedCache(BaseCache):
             pass
         return default
 
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        values = self._map(self._read, [self._key_to_file(key, version) for key in keys])
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
     def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         self._createdir()  # Cache dir can be deleted at any time.
         fname = self._key_to_file(key, version)
         self._cull()  # make some room if necessary
+        self._write(fname, value, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        self._createdir()  # Cache dir can be deleted at any time.
+        files = [(self._key_to_file(key, version), value) for key, value in data.items()]
+        self._cull()  # make some room if necessary
+        self._map(lambda item: self._write(item[0], item[1], timeout), files)
+        return []
+
+    def _write(self, fname, value, timeout):
         fd, tmp_path = tempfile.mkstemp(dir=self._dir)
         renamed = False
         try:
@@ -57,6 +82,10 @@ class FileBasedCache(BaseCache):
     def delete(self, key, version=None):
         self._delete(self._key_to_file(key, version))
 
+    def delete_many(self, keys, version=None):
+        fnames = [self._key_to_file(key, version) for key in keys]
+        self._map(self._delete, fnames)
+
     def _delete(self, fname):
         if not fname.startswith(self._dir) or not os.path.exists(fname):
             return
@@ -91,6 +120,24 @@ class FileBasedCache(BaseCache):
         for fname in filelist:
             self._delete(fname)
 
+    def _map(self, func, items):
+        """
+        Return the results of func applied to each item. Several items are
+        processed concurrently since the work is mostly file I/O.
+        """
+        if len(items) < 2:
+            return [func(item) for item in items]
+        return list(self._get_executor().map(func, items))
+
+    @classmethod
+    def _get_executor(cls):
+        with cls._executor_lock:
+            # Threads don't survive a fork, start a new executor in a child.
+            if cls._executor is None or cls._executor_pid != os.getpid():
+                cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers)
+                cls._executor_pid = os.getpid()
+            return cls._executor
+
     def _createdir(self):
         if not os.path.exists(self._dir):
             try:
@@ -1,99 +1,217 @@
 "Thread-safe in-memory cache backend."
 import pickle
+import threading
 import time
-from contextlib import contextmanager
+from collections import OrderedDict
 
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
-from django.utils.synch import RWLock
 
 # Global in-memory store of cache data. Keyed by name, to provide
 # multiple named local memory caches.
 _caches = {}
 _expire_info = {}
+_expiry_wheels = {}
+_stats = {}
 _locks = {}
 
 
-@contextmanager
-def dummy():
-    """A context manager that does nothing special."""
-    yield
+class ExpiryWheel:
+    """
+    Keys bucketed by the second in which they expire, so that expired keys
+    can be found without scanning the whole cache. Buckets may hold keys that
+    have been set again since; callers must check the current expiry time.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._swept_until = int(time.time())
+
+    def add(self, key, expiry):
+        if expiry is not None:
+            # Keys that already expired are swept in the next second.
+            slot = max(int(expiry), self._swept_until)
+            self._buckets.setdefault(slot, set()).add(key)
+
+    def discard(self, key, expiry):
+        if expiry is not None:
+            slot = max(int(expiry), self._swept_until)
+            bucket = self._buckets.get(slot)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[slot]
+
+    def pop_expired(self, now):
+        """Remove and return the keys of the buckets that are in the past."""
+        now = int(now)
+        if now <= self._swept_until:
+            return []
+        if now - self._swept_until <= len(self._buckets):
+            slots = range(self._swept_until, now)
+        else:
+            slots = [slot for slot in self._buckets if slot < now]
+        self._swept_until = now
+        keys = []
+        for slot in slots:
+            keys.extend(self._buckets.pop(slot, ()))
+        return keys
+
+    def clear(self):
+        self._buckets.clear()
 
 
 class LocMemCache(BaseCache):
+    """
+    An in-process cache of pickled values that evicts the least recently used
+    entries once it holds MAX_ENTRIES entries or, if the MAX_BYTES option is
+    set, once the pickled values add up to more than MAX_BYTES bytes. Values
+    whose pickle is larger than MAX_BYTES aren't stored.
+    """
+
     def __init__(self, name, params):
         BaseCache.__init__(self, params)
-        self._cache = _caches.setdefault(name, {})
+        max_bytes = params.get('max_bytes', params.get('OPTIONS', {}).get('MAX_BYTES'))
+        self._max_bytes = None if max_bytes is None else int(max_bytes)
+        self._cache = _caches.setdefault(name, OrderedDict())
         self._expire_info = _expire_info.setdefault(name, {})
-        self._lock = _locks.setdefault(name, RWLock())
+        self._expiry_wheel = _expiry_wheels.setdefault(name, ExpiryWheel())
+        self._stats = _stats.setdefault(name, {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'bytes': 0,
+        })
+        self._lock = _locks.setdefault(name, threading.Lock())
 
     def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
         pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
-        with self._lock.writer():
+        with self._lock:
             if self._has_expired(key):
                 self._set(key, pickled, timeout)
                 return True
             return False
 
-    def get(self, key, default=None, version=None, acquire_lock=True):
+    def get(self, key, default=None, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
-        pickled = None
-        with (self._lock.reader() if acquire_lock else dummy()):
-            if not self._has_expired(key):
-                pickled = self._cache[key]
+        with self._lock:
+            pickled = self._get(key)
         if pickled is not None:
             try:
                 return pickle.loads(pickled)
             except pickle.PickleError:
-                return default
+                pass
+        return default
 
-        with (self._lock.writer() if acquire_lock else dummy()):
+    def _get(self, key):
+        """
+        Return the pickled value of the key and mark it as the most recently
+        used, or return None if it's missing or expired. Must be called with
+        the lock held.
+        """
+        if self._has_expired(key):
+            if key in self._expire_info:
+                self._delete(key)
+                self._stats['expirations'] += 1
+            self._stats['misses'] += 1
+            return None
+        self._cache.move_to_end(key)
+        self._stats['hits'] += 1
+        return self._cache[key]
+
+    def get_many(self, keys, version=None):
+        key_map = {}
+        for key in keys:
+            made_key = self.make_key(key, version=version)
+            self.validate_key(made_key)
+            key_map[made_key] = key
+        pickled_values = {}
+        with self._lock:
+            for made_key in key_map:
+                pickled = self._get(made_key)
+                if pickled is not None:
+                    pickled_values[made_key] = pickled
+        values = {}
+        for made_key, pickled in pickled_values.items():
             try:
-                del self._cache[key]
-                del self._expire_info[key]
-            except KeyError:
-                pass
-            return default
+                value = pickle.loads(pickled)
+            except pickle.PickleError:
+                continue
+            if value is not None:
+                values[key_map[made_key]] = value
+        return values
 
     def _set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self._delete_expired()
+        if key in self._cache:
+            self._delete(key)
+        if self._max_bytes is not None:
+            if len(value) > self._max_bytes:
+                # The value can't fit, even in an empty cache. Don't store it
+                # rather than evicting everything else.
+                return
+            self._make_room(len(value))
         if len(self._cache) >= self._max_entries:
             self._cull()
+        expiry = self.get_backend_timeout(timeout)
         self._cache[key] = value
-        self._expire_info[key] = self.get_backend_timeout(timeout)
+        self._expire_info[key] = expiry
+        self._expiry_wheel.add(key, expiry)
+        self._stats['bytes'] += len(value)
 
     def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
         pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
-        with self._lock.writer():
+        with self._lock:
             self._set(key, pickled, timeout)
 
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        entries = []
+        for key, value in data.items():
+            made_key = self.make_key(key, version=version)
+            self.validate_key(made_key)
+            entries.append((made_key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)))
+        with self._lock:
+            for made_key, pickled in entries:
+                self._set(made_key, pickled, timeout)
+        return []
+
     def incr(self, key, delta=1, version=None):
-        with self._lock.writer():
-            value = self.get(key, version=version, acquire_lock=False)
+        made_key = self.make_key(key, version=version)
+        self.validate_key(made_key)
+        with self._lock:
+            pickled = self._get(made_key)
+            value = None if pickled is None else pickle.loads(pickled)
             if value is None:
                 raise ValueError("Key '%s' not found" % key)
             new_value = value + delta
-            key = self.make_key(key, version=version)
             pickled = pickle.dumps(new_value, pickle.HIGHEST_PROTOCOL)
-            self._cache[key] = pickled
+            # Take the old value out so that it isn't evicted to make room
+            # for the new one.
+            self._stats['bytes'] -= len(self._cache.pop(made_key))
+            if self._max_bytes is not None:
+                if len(pickled) > self._max_bytes:
+                    self._delete(made_key)
+                    return new_value
+                self._make_room(len(pickled))
+            self._cache[made_key] = pickled
+            self._stats['bytes'] += len(pickled)
         return new_value
 
     def has_key(self, key, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
-        with self._lock.reader():
+        with self._lock:
             if not self._has_expired(key):
+                self._cache.move_to_end(key)
                 return True
-
-        with self._lock.writer():
-            try:
-                del self._cache[key]
-                del self._expire_info[key]
-            except KeyError:
-                pass
+            if key in self._expire_info:
+                self._delete(key)
+                self._stats['expirations'] += 1
             return False
 
     def _has_expired(self, key):
@@ -102,30 +220,81 @@ class LocMemCache(BaseCache):
             return False
         return True
 
+    def _delete_expired(self):
+        """Delete the keys that expired since the last call."""
+        for key in self._expiry_wheel.pop_expired(time.time()):
+            if key in self._expire_info and self._has_expired(key):
+                self._delete(key)
+                self._stats['expirations'] += 1
+
+    def _evict(self):
+        """Delete the least recently used key."""
+        key = next(iter(self._cache))
+        self._delete(key)
+        self._stats['evictions'] += 1
+
+    def _make_room(self, size):
+        """
+        Evict the least recently used keys until a value of size bytes fits
+        under MAX_BYTES.
+        """
+        while self._stats['bytes'] + size > self._max_bytes and self._cache:
+            self._evict()
+
     def _cull(self):
         if self._cull_frequency == 0:
-            self.clear()
+            self._stats['evictions'] += len(self._cache)
+            self._clear()
         else:
-            doomed = [k for (i, k) in enumerate(self._cache) if i % self._cull_frequency == 0]
-            for k in doomed:
-                self._delete(k)
+            for _ in range(max(len(self._cache) // self._cull_frequency, 1)):
+                self._evict()
 
     def _delete(self, key):
         try:
-            del self._cache[key]
+            pickled = self._cache.pop(key)
         except KeyError:
             pass
+        else:
+            self._stats['bytes'] -= len(pickled)
         try:
-            del self._expire_info[key]
+            expiry = self._expire_info.pop(key)
         except KeyError:
             pass
+        else:
+            self._expiry_wheel.discard(key, expiry)
 
     def delete(self, key, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
-        with self._lock.writer():
+        with self._lock:
             self._delete(key)
 
+    def delete_many(self, keys, version=None):
+        made_keys = []
+        for key in keys:
+            made_key = self.make_key(key, version=version)
+            self.validate_key(made_key)
+            made_keys.append(made_key)
+        with self._lock:
+            for made_key in made_keys:
+                self._delete(made_key)
+
     def clear(self):
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
         self._cache.clear()
         self._expire_info.clear()
+        self._expiry_wheel.clear()
+        self._stats['bytes'] = 0
+
+    def get_stats(self):
+        """
+        Return a dict of the hit, miss, eviction and expiration counters along
+        with the number of entries and the size in bytes of the cache.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._cache)
+        return stats
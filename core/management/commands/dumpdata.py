@@ -64,6 +64,10 @@ class Command(BaseCommand):
             '-o', '--output', default=None, dest='output',
             help='Specifies file to which the output is written.'
         )
+        parser.add_argument(
+            '--chunk-size', default=2000, dest='chunk_size', type=int,
+            help='Number of rows fetched from the database at a time. Defaults to 2000.',
+        )
 
     def handle(self, *app_labels, **options):
         format = options['format']
@@ -76,6 +80,7 @@ class Command(BaseCommand):
         use_natural_primary_keys = options['use_natural_primary_keys']
         use_base_manager = options['use_base_manager']
         pks = options['primary_keys']
+        chunk_size = options['chunk_size']
 
         if pks:
             primary_keys = [pk.strip() for pk in pks.split(',')]
@@ -166,7 +171,7 @@ class Command(BaseCommand):
                     if count_only:
                         yield queryset.order_by().count()
                     else:
-                        yield from queryset.iterator()
+                        yield from queryset.iterator(chunk_size=chunk_size)
 
         try:
             self.stdout.ending = None
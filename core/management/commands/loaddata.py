@@ -18,6 +18,7 @@ from django.db import (
     DEFAULT_DB_ALIAS, DatabaseError, IntegrityError, connections, router,
     transaction,
 )
+from django.db.models import signals
 from django.utils.functional import cached_property
 
 try:
@@ -27,6 +28,8 @@ except ImportError:
     has_bz2 = False
 
 READ_STDIN = '-'
+# Maximum number of objects of a model queued before they're saved in bulk.
+BULK_BATCH_SIZE = 1000
 
 
 class Command(BaseCommand):
@@ -86,6 +89,7 @@ class Command(BaseCommand):
         self.loaded_object_count = 0
         self.fixture_object_count = 0
         self.models = set()
+        self.pending_objects = []
 
         self.serialization_formats = serializers.get_public_serializer_formats()
         # Forcing binary mode may be revisited after dropping Python 2 support (see #22399)
@@ -173,21 +177,13 @@ class Command(BaseCommand):
                     if router.allow_migrate_model(self.using, obj.object.__class__):
                         loaded_objects_in_fixture += 1
                         self.models.add(obj.object.__class__)
-                        try:
-                            obj.save(using=self.using)
-                            if show_progress:
-                                self.stdout.write(
-                                    '\rProcessed %i object(s).' % loaded_objects_in_fixture,
-                                    ending=''
-                                )
-                        except (DatabaseError, IntegrityError) as e:
-                            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
-                                'app_label': obj.object._meta.app_label,
-                                'object_name': obj.object._meta.object_name,
-                                'pk': obj.object.pk,
-                                'error_msg': e,
-                            },)
-                            raise
+                        self.add_object(obj)
+                        if show_progress:
+                            self.stdout.write(
+                                '\rProcessed %i object(s).' % loaded_objects_in_fixture,
+                                ending=''
+                            )
+                self.flush_objects()
                 if objects and show_progress:
                     self.stdout.write('')  # add a newline after progress indicator
                 self.loaded_object_count += loaded_objects_in_fixture
@@ -207,6 +203,98 @@ class Command(BaseCommand):
                     RuntimeWarning
                 )
 
+    def add_object(self, obj):
+        """
+        Queue a deserialized object for saving. Consecutive objects of a model
+        that can be inserted in bulk are saved in batches; the queue is flushed
+        whenever the model changes so that objects are saved in fixture order.
+        """
+        model = type(obj.object)
+        if self.pending_objects and type(self.pending_objects[0].object) is not model:
+            self.flush_objects()
+        if obj.object.pk is None or not self.can_bulk_insert(model):
+            # Save the queued objects first to keep the fixture order.
+            self.flush_objects()
+            self.save_object(obj)
+            return
+        self.pending_objects.append(obj)
+        if len(self.pending_objects) >= BULK_BATCH_SIZE:
+            self.flush_objects()
+
+    def flush_objects(self):
+        """Save the queued objects."""
+        objs, self.pending_objects = self.pending_objects, []
+        if not objs:
+            return
+        concrete_model = objs[0].object._meta.concrete_model
+        fields = concrete_model._meta.local_concrete_fields
+        ops = connections[self.using].ops
+        batch_size = max(ops.bulk_batch_size(fields, objs), 1)
+        for i in range(0, len(objs), batch_size):
+            self.save_objects_batch(concrete_model, fields, objs[i:i + batch_size])
+
+    def save_objects_batch(self, concrete_model, fields, objs):
+        queryset = concrete_model._base_manager.using(self.using)
+        # Like Model.save_base(), update the rows that already exist.
+        existing = set(queryset.filter(pk__in=[obj.object.pk for obj in objs]).values_list('pk', flat=True))
+        new_objs = [obj for obj in objs if obj.object.pk not in existing]
+        if new_objs:
+            try:
+                with transaction.atomic(using=self.using):
+                    queryset._batched_insert(
+                        [obj.object for obj in new_objs], fields, batch_size=len(new_objs), raw=True,
+                    )
+            except DatabaseError:
+                # Save the objects again one at a time to report the one that
+                # couldn't be loaded.
+                for obj in new_objs:
+                    self.save_object(obj)
+            else:
+                for obj in new_objs:
+                    obj.object._state.adding = False
+                    obj.object._state.db = self.using
+                    if obj.m2m_data:
+                        # The rows were just inserted, so there are no
+                        # existing relations to clear.
+                        obj.m2m_data = {
+                            accessor_name: object_list
+                            for accessor_name, object_list in obj.m2m_data.items() if object_list
+                        }
+                    obj.save_m2m()
+        for obj in objs:
+            if obj.object.pk in existing:
+                self.save_object(obj)
+
+    def save_object(self, obj):
+        try:
+            obj.save(using=self.using)
+        except (DatabaseError, IntegrityError) as e:
+            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
+                'app_label': obj.object._meta.app_label,
+                'object_name': obj.object._meta.object_name,
+                'pk': obj.object.pk,
+                'error_msg': e,
+            },)
+            raise
+
+    @functools.lru_cache(maxsize=None)
+    def can_bulk_insert(self, model):
+        """
+        Return whether objects of the model can be inserted in bulk without
+        changing what saving them one at a time does: they can't be split
+        across multi-table inheritance parents and there must be no pre_save
+        or post_save receivers to notify. Neither can the model have natural
+        keys, as the next objects of the fixture may refer to the queued ones
+        by natural key, which is looked up in the database when they're
+        deserialized.
+        """
+        return not (
+            model._meta.concrete_model._meta.parents or
+            hasattr(model._default_manager, 'get_by_natural_key') or
+            signals.pre_save.has_listeners(model) or
+            signals.post_save.has_listeners(model)
+        )
+
     @functools.lru_cache(maxsize=None)
     def find_fixtures(self, fixture_label):
         """Find fixture files for a given label."""
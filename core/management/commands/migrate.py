@@ -1,10 +1,15 @@
+import copy
+import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 
 from django.apps import apps
 from django.core.checks import Tags, run_checks
-from django.core.management.base import BaseCommand, CommandError
+from django.core.management.base import (
+    BaseCommand, CommandError, OutputWrapper,
+)
 from django.core.management.sql import (
     emit_post_migrate_signal, emit_pre_migrate_signal,
 )
@@ -16,6 +21,41 @@ from django.db.migrations.state import ModelState, ProjectState
 from django.utils.module_loading import module_has_submodule
 
 
+class PrefixedOutputWrapper(OutputWrapper):
+    """
+    Write whole lines, prefixed with the given string, to another wrapper
+    shared with the threads migrating other databases.
+    """
+    def __init__(self, out, prefix, lock):
+        super().__init__(out)
+        self.prefix = prefix
+        self.lock = lock
+        self.buffer = ''
+
+    def write(self, msg, style_func=None, ending=None):
+        ending = self.ending if ending is None else ending
+        if ending and not msg.endswith(ending):
+            msg += ending
+        # Keep an unfinished line, e.g. "Applying ...", until it's completed.
+        lines = (self.buffer + msg).split('\n')
+        self.buffer = lines.pop()
+        with self.lock:
+            for line in lines:
+                self._out.write(self.prefix + line)
+
+    def finish(self):
+        """
+        Write the unfinished line, if any, e.g. the "Applying ..." line of a
+        migration that failed.
+        """
+        # Not flush(), which the progress callback calls after starting the
+        # line.
+        if self.buffer:
+            with self.lock:
+                self._out.write(self.prefix + self.buffer)
+            self.buffer = ''
+
+
 class Command(BaseCommand):
     help = "Updates database schema. Manages both apps with migrations and those without."
 
@@ -35,9 +75,17 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             '--database', action='store', dest='database',
-            default=DEFAULT_DB_ALIAS,
             help='Nominates a database to synchronize. Defaults to the "default" database.',
         )
+        parser.add_argument(
+            '--databases', nargs='+', dest='databases', metavar='DATABASE',
+            help='Nominates several databases to synchronize, e.g. shards sharing the same '
+                 'schema, instead of --database.',
+        )
+        parser.add_argument(
+            '--parallel', type=int, default=1, dest='parallel', metavar='N',
+            help='Synchronize up to N of the databases nominated by --databases at once.',
+        )
         parser.add_argument(
             '--fake', action='store_true', dest='fake',
             help='Mark migrations as run without actually running them.',
@@ -69,8 +117,67 @@ class Command(BaseCommand):
             if module_has_submodule(app_config.module, "management"):
                 import_module('.management', app_config.name)
 
+        if options['parallel'] < 1:
+            raise CommandError("--parallel must be a positive integer.")
+        if options['databases']:
+            if options['database'] is not None:
+                raise CommandError("--database and --databases can't be used together.")
+            self.migrate_databases(options['databases'], options['parallel'], options)
+        elif options['parallel'] > 1:
+            raise CommandError("--parallel requires several databases nominated by --databases.")
+        else:
+            self.migrate_database(options['database'] or DEFAULT_DB_ALIAS, options)
+
+    def migrate_databases(self, databases, parallel, options):
+        """
+        Migrate the databases with up to `parallel` of them at once, each one
+        in its own thread with its own connection. Their output is merged a
+        line at a time, each line prefixed by the database alias.
+        """
+        databases = list(OrderedDict.fromkeys(databases))
+        for db in databases:
+            if db not in connections:
+                raise CommandError("The database '%s' doesn't exist." % db)
+        lock = threading.Lock()
+
+        def migrate(db):
+            # Copy the command not to share the output and the timings of the
+            # progress callback between threads.
+            command = copy.copy(self)
+            command.stdout = PrefixedOutputWrapper(self.stdout, '[%s] ' % db, lock)
+            try:
+                command.migrate_database(db, options)
+            finally:
+                command.stdout.finish()
+
+        def migrate_in_thread(db):
+            try:
+                migrate(db)
+            finally:
+                connections[db].close()
+
+        if parallel == 1:
+            for db in databases:
+                migrate(db)
+            return
+        # A failure doesn't stop the migrations of the other databases.
+        errors = []
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            futures = [(db, pool.submit(migrate_in_thread, db)) for db in databases]
+            for db, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    if options['traceback']:
+                        raise
+                    errors.append('%s: %s' % (db, e))
+        if errors:
+            raise CommandError(
+                "Migrating %d of the databases failed:\n%s" % (len(errors), '\n'.join(errors))
+            )
+
+    def migrate_database(self, db, options):
         # Get the database we're operating from
-        db = options['database']
         connection = connections[db]
 
         # Hook for backends needing any database preparation
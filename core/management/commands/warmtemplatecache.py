@@ -0,0 +1,57 @@
+import os
+
+from django.core.management.base import BaseCommand
+from django.template import (
+    TemplateDoesNotExist, TemplateSyntaxError, engines,
+)
+from django.template.backends.django import DjangoTemplates
+from django.template.loaders.cached import Loader as CachedLoader
+
+
+class Command(BaseCommand):
+    help = (
+        "Parses the templates found by the cached template loaders that have "
+        "a persistent cache and stores them in it."
+    )
+
+    requires_system_checks = False
+
+    def handle(self, **options):
+        self.verbosity = options['verbosity']
+        stored = failed = 0
+        for engine in engines.all():
+            if not isinstance(engine, DjangoTemplates):
+                continue
+            for loader in engine.engine.template_loaders:
+                if not isinstance(loader, CachedLoader) or not loader.persistent_cache:
+                    continue
+                for template_name in self.find_template_names(loader):
+                    try:
+                        loader.get_template(template_name)
+                    except (TemplateDoesNotExist, TemplateSyntaxError, UnicodeDecodeError) as e:
+                        failed += 1
+                        if self.verbosity >= 2:
+                            self.stderr.write("Skipped template '%s': %s" % (template_name, e))
+                    else:
+                        stored += 1
+                        if self.verbosity >= 2:
+                            self.stdout.write("Stored template '%s'." % template_name)
+        if self.verbosity >= 1:
+            self.stdout.write("%d template(s) stored, %d skipped." % (stored, failed))
+
+    def find_template_names(self, loader):
+        """Return the names of the templates the loader's loaders can find."""
+        template_names = []
+        for child in loader.loaders:
+            if hasattr(child, 'templates_dict'):
+                template_names.extend(child.templates_dict)
+            if not hasattr(child, 'get_dirs'):
+                continue
+            for template_dir in child.get_dirs():
+                for root, dirs, files in os.walk(template_dir):
+                    dirs.sort()
+                    for filename in sorted(files):
+                        path = os.path.relpath(os.path.join(root, filename), template_dir)
+                        template_names.append(path.replace(os.sep, '/'))
+        # Remove duplicates while preserving the order.
+        return list(dict.fromkeys(template_names))
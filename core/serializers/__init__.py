@@ -27,6 +27,7 @@ BUILTIN_SERIALIZERS = {
     "xml": "django.core.serializers.xml_serializer",
     "python": "django.core.serializers.python",
     "json": "django.core.serializers.json",
+    "jsonl": "django.core.serializers.jsonl",
     "yaml": "django.core.serializers.pyyaml",
 }
 
@@ -203,14 +203,19 @@ class DeserializedObject:
         # model-defined save. The save is also forced to be raw.
         # raw=True is passed to any pre/post_save signals.
         models.Model.save_base(self.object, using=using, raw=True, **kwargs)
-        if self.m2m_data and save_m2m:
-            for accessor_name, object_list in self.m2m_data.items():
-                getattr(self.object, accessor_name).set(object_list)
-
+        if save_m2m:
+            self.save_m2m()
         # prevent a second (possibly accidental) call to save() from saving
         # the m2m data twice.
         self.m2m_data = None
 
+    def save_m2m(self):
+        """Save the many-to-many data of an object that's already saved."""
+        if self.m2m_data:
+            for accessor_name, object_list in self.m2m_data.items():
+                getattr(self.object, accessor_name).set(object_list)
+        self.m2m_data = None
+
 
 def build_instance(Model, data, db):
     """
@@ -2,6 +2,7 @@
 Serialize data to/from JSON
 """
 
+import codecs
 import datetime
 import decimal
 import json
@@ -60,12 +61,13 @@ class Serializer(PythonSerializer):
 
 def Deserializer(stream_or_string, **options):
     """Deserialize a stream or string of JSON data."""
-    if not isinstance(stream_or_string, (bytes, str)):
-        stream_or_string = stream_or_string.read()
-    if isinstance(stream_or_string, bytes):
-        stream_or_string = stream_or_string.decode()
     try:
-        objects = json.loads(stream_or_string)
+        if isinstance(stream_or_string, (bytes, str)):
+            if isinstance(stream_or_string, bytes):
+                stream_or_string = stream_or_string.decode()
+            objects = json.loads(stream_or_string)
+        else:
+            objects = _iter_array(stream_or_string)
         yield from PythonDeserializer(objects, **options)
     except (GeneratorExit, DeserializationError):
         raise
@@ -73,6 +75,66 @@ def Deserializer(stream_or_string, **options):
         raise DeserializationError() from exc
 
 
+def _iter_array(stream, chunk_size=64 * 1024):
+    """
+    Incrementally parse a JSON array read from a file-like object and yield
+    its items one at a time, so that only one item has to be held in memory.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def fill(buf, pos):
+        # Drop the consumed part of the buffer and append the next chunk.
+        data = stream.read(chunk_size)
+        if isinstance(data, bytes):
+            data = text_decoder.decode(data, final=not data)
+        return buf[pos:] + data, 0, not data
+
+    def skip_whitespace(buf, pos, eof):
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\n\r':
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf, pos, eof
+            buf, pos, eof = fill(buf, pos)
+
+    buf, pos, eof = skip_whitespace(buf, pos, eof)
+    if buf[pos:pos + 1] != '[':
+        raise ValueError('Expected a JSON array.')
+    pos += 1
+    first = True
+    while True:
+        buf, pos, eof = skip_whitespace(buf, pos, eof)
+        if buf[pos:pos + 1] == ']':
+            pos += 1
+            break
+        if not first:
+            if buf[pos:pos + 1] != ',':
+                raise ValueError("Expected ',' or ']' between the array items.")
+            buf, pos, eof = skip_whitespace(buf, pos + 1, eof)
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+            else:
+                # A value ending at the end of the buffer (e.g. a number) may
+                # continue in the next chunk.
+                if end < len(buf) or eof:
+                    break
+            buf, pos, eof = fill(buf, pos)
+        pos = end
+        first = False
+        yield item
+    buf, pos, eof = skip_whitespace(buf, pos, eof)
+    if pos < len(buf):
+        raise ValueError('Extra data after the JSON array.')
+
+
 class DjangoJSONEncoder(json.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time, decimal types, and
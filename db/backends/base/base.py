@@ -1,4 +1,5 @@
 import copy
+import threading
 import time
 import warnings
 from collections import deque
@@ -11,6 +12,7 @@ from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import DEFAULT_DB_ALIAS
 from django.db.backends import utils
+from django.db.backends.base.pool import ConnectionPool
 from django.db.backends.base.validation import BaseDatabaseValidation
 from django.db.backends.signals import connection_created
 from django.db.transaction import TransactionManagementError
@@ -40,14 +42,21 @@ class BaseDatabaseWrapper:
     introspection_class = None
     ops_class = None
     validation_class = BaseDatabaseValidation
+    pool_class = ConnectionPool
 
     queries_limit = 9000
 
+    # Connection pools shared by the wrappers of all threads, keyed by alias.
+    _connection_pools = {}
+    _connection_pools_lock = threading.Lock()
+
     def __init__(self, settings_dict, alias=DEFAULT_DB_ALIAS,
                  allow_thread_sharing=False):
         # Connection related attributes.
         # The underlying database connection.
         self.connection = None
+        # The pool the connection was taken from, if pooling is enabled.
+        self._connection_pool = None
         # `settings_dict` should be a dictionary containing keys such as
         # NAME, USER, etc. It's called `settings_dict` instead of `settings`
         # to disambiguate it from Django settings modules.
@@ -191,7 +200,12 @@ class BaseDatabaseWrapper:
         self.errors_occurred = False
         # Establish the connection
         conn_params = self.get_connection_params()
-        self.connection = self.get_new_connection(conn_params)
+        if self.pool_options is not None:
+            self._connection_pool = self.get_pool(conn_params)
+            self.connection = self._connection_pool.getconn()
+        else:
+            self._connection_pool = None
+            self.connection = self.get_new_connection(conn_params)
         self.set_autocommit(self.settings_dict['AUTOCOMMIT'])
         self.init_connection_state()
         connection_created.send(sender=self.__class__, connection=self)
@@ -199,6 +213,10 @@ class BaseDatabaseWrapper:
         self.run_on_commit = []
 
     def check_settings(self):
+        if self.pool_options is not None and self.settings_dict['CONN_MAX_AGE'] != 0:
+            raise ImproperlyConfigured(
+                "Connection '%s' cannot set CONN_MAX_AGE because connection "
+                "pooling is enabled." % self.alias)
         if self.settings_dict['TIME_ZONE'] is not None:
             if not settings.USE_TZ:
                 raise ImproperlyConfigured(
@@ -215,6 +233,71 @@ class BaseDatabaseWrapper:
             with self.wrap_database_errors:
                 self.connect()
 
+    # ##### Connection pooling #####
+
+    @property
+    def pool_options(self):
+        """
+        Return the keyword arguments for pool_class from the 'pool' key of
+        OPTIONS, or None if connection pooling is disabled.
+        """
+        options = self.settings_dict['OPTIONS'].get('pool')
+        if not options:
+            return None
+        return {} if options is True else dict(options)
+
+    @property
+    def pool(self):
+        """The connection pool of this alias, or None if there's none yet."""
+        conn_params, pool = self._connection_pools.get(self.alias, (None, None))
+        return pool
+
+    def get_pool(self, conn_params):
+        """
+        Return the connection pool of this alias, creating it on first use.
+        A pool created with different connection parameters (e.g. before the
+        test database was set up) is closed and replaced.
+        """
+        with self._connection_pools_lock:
+            pool_params, pool = self._connection_pools.get(self.alias, (None, None))
+            if pool is not None and not pool.closed and pool_params == conn_params:
+                return pool
+            if pool is not None:
+                pool.close()
+            options = self.pool_options
+            check = options.pop('check', False)
+            pool = self.pool_class(
+                connect=lambda: self.get_new_connection(conn_params),
+                check=self.check_pooled_connection if check else None,
+                name=self.alias,
+                **options
+            )
+            self._connection_pools[self.alias] = (conn_params, pool)
+        pool.open()
+        return pool
+
+    def check_pooled_connection(self, connection):
+        """
+        Health check run on connections taken from the pool when the 'check'
+        pool option is enabled. Return whether the connection is usable.
+        """
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute('SELECT 1' + self.features.bare_select_suffix)
+            finally:
+                cursor.close()
+        except Exception:
+            return False
+        return True
+
+    def close_pool(self):
+        """Close the connection pool of this alias, if any."""
+        with self._connection_pools_lock:
+            conn_params, pool = self._connection_pools.pop(self.alias, (None, None))
+        if pool is not None:
+            pool.close()
+
     # ##### Backend-specific wrappers for PEP-249 connection methods #####
 
     def _prepare_cursor(self, cursor):
@@ -246,6 +329,11 @@ class BaseDatabaseWrapper:
     def _close(self):
         if self.connection is not None:
             with self.wrap_database_errors:
+                if self._connection_pool is not None:
+                    # Hand the connection back to the pool unless it's in an
+                    # unknown state.
+                    discard = self.in_atomic_block or (self.errors_occurred and not self.is_usable())
+                    return self._connection_pool.putconn(self.connection, discard=discard)
                 return self.connection.close()
 
     # ##### Generic wrappers for PEP-249 connection methods #####
@@ -26,6 +26,15 @@ class BaseDatabaseFeatures:
     can_return_id_from_insert = False
     can_return_ids_from_bulk_insert = False
     has_bulk_insert = True
+    # Can INSERT statements skip rows that fail a constraint check?
+    supports_ignore_conflicts = True
+    # Can INSERT statements update existing rows that fail a unique check?
+    supports_update_conflicts = False
+    # Does the ON CONFLICT clause require the conflicting columns to be named?
+    supports_update_conflicts_with_target = False
+    # Does the backend require the CASE expressions built by
+    # QuerySet.bulk_update() to be cast to the type of the updated column?
+    requires_casted_case_in_updates = False
     uses_savepoints = False
     can_release_savepoints = False
 
@@ -584,6 +584,21 @@ class BaseDatabaseOperations:
         """
         return '%s'
 
+    def insert_statement(self, on_conflict=None):
+        """
+        Return the statement used to start an INSERT query. The on_conflict
+        argument is an OnConflict member (or None) that some backends express
+        in the INSERT keyword itself, e.g. MySQL's INSERT IGNORE.
+        """
+        return 'INSERT INTO'
+
+    def on_conflict_suffix_sql(self, fields, on_conflict, update_fields, unique_fields):
+        """
+        Return the SQL appended to an INSERT query to handle rows that
+        conflict with existing ones, or an empty string.
+        """
+        return ''
+
     def modify_insert_params(self, placeholder, params):
         """
         Allow modification of insert parameters. Needed for Oracle Spatial
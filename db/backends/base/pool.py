@@ -0,0 +1,243 @@
+import os
+import threading
+import time
+from collections import deque
+
+from django.db.utils import OperationalError
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of DB-API connections shared by all the
+    DatabaseWrapper instances of a database alias in a process.
+
+    Connections are created on demand with the `connect` callable, up to
+    `max_size` connections, and handed back to the pool when the
+    DatabaseWrapper closes them. Idle connections above `min_size` are closed
+    once they have been idle for `max_idle` seconds and any connection is
+    recycled once it's older than `max_lifetime` seconds. If `check` is given,
+    it's called with each connection taken from the pool and must return
+    whether the connection is still usable.
+    """
+
+    def __init__(self, connect, check=None, min_size=0, max_size=10, timeout=30,
+                 max_lifetime=None, max_idle=None, name=None):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(
+                'The connection pool sizes must satisfy '
+                '0 <= min_size <= max_size and max_size >= 1.'
+            )
+        self.connect = connect
+        self.check = check
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.name = name
+        self.closed = False
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        # Idle connections as (connection, returned at) pairs, the most
+        # recently returned last.
+        self._idle = deque()
+        # Creation time of every open connection, keyed by id().
+        self._created_at = {}
+        # Number of open connections plus slots reserved for connections
+        # being opened.
+        self._size = 0
+        self.stats = {
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'checkouts': 0,
+            'checkout_waits': 0,
+            'checkout_timeouts': 0,
+            'failed_checks': 0,
+        }
+
+    def __repr__(self):
+        return '<%s: %s (%d open, %d idle)>' % (
+            self.__class__.__name__, self.name, self._size, len(self._idle),
+        )
+
+    def open(self):
+        """Open connections until the pool holds `min_size` of them."""
+        while True:
+            with self._cond:
+                self._reset_after_fork()
+                if self.closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            connection = self._new_connection()
+            self.putconn(connection)
+
+    def getconn(self):
+        """
+        Return a connection from the pool, opening a new one if there's no
+        idle connection and the pool isn't full. Wait up to `timeout` seconds
+        for a connection to be returned otherwise.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            connection, is_new = self._acquire(deadline)
+            if is_new or self.check is None or self.check(connection):
+                return connection
+            with self._cond:
+                self.stats['failed_checks'] += 1
+            self._discard(connection)
+
+    def putconn(self, connection, discard=False):
+        """
+        Give a connection back to the pool. Any transaction in progress is
+        rolled back. Close the connection instead if `discard` is True, if it
+        has outlived `max_lifetime`, or if the pool is closed.
+        """
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        with self._cond:
+            if self._reset_after_fork():
+                # The connection belongs to the parent process.
+                return
+            if not (discard or self.closed or self._is_expired(connection)):
+                self._idle.append((connection, time.monotonic()))
+                self._cond.notify()
+                return
+        self._discard(connection)
+
+    def close(self):
+        """
+        Close all the idle connections. Connections in use are closed when
+        they are returned.
+        """
+        with self._cond:
+            self.closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._cond.notify_all()
+        for connection in idle:
+            self._discard(connection)
+
+    def get_stats(self):
+        """Return a dict of the pool's sizes and usage counters."""
+        with self._cond:
+            stats = dict(self.stats)
+            stats['pool_size'] = self._size
+            stats['pool_available'] = len(self._idle)
+        return stats
+
+    def _acquire(self, deadline):
+        stale = []
+        try:
+            with self._cond:
+                self._reset_after_fork()
+                waited = False
+                while True:
+                    if self.closed:
+                        raise OperationalError("The connection pool '%s' is closed." % self.name)
+                    stale.extend(self._pop_stale())
+                    if self._idle:
+                        connection, _ = self._idle.pop()
+                        self.stats['checkouts'] += 1
+                        return connection, False
+                    if self._size < self.max_size:
+                        # Reserve a slot; the connection is opened below
+                        # without holding the lock.
+                        self._size += 1
+                        self.stats['checkouts'] += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stats['checkout_timeouts'] += 1
+                        raise OperationalError(
+                            "Couldn't get a connection from the pool '%s' "
+                            "within %s seconds." % (self.name, self.timeout)
+                        )
+                    if not waited:
+                        self.stats['checkout_waits'] += 1
+                        waited = True
+                    self._cond.wait(remaining)
+        finally:
+            self._close_connections(stale)
+        return self._new_connection(), True
+
+    def _pop_stale(self):
+        """
+        Remove from the idle connections those that are too old or that have
+        been idle too long and return them. Must be called with the lock held.
+        """
+        stale = []
+        if self.max_idle is None and self.max_lifetime is None:
+            return stale
+        now = time.monotonic()
+        kept = deque()
+        for connection, idle_since in self._idle:
+            idle_too_long = (
+                self.max_idle is not None and
+                self._size > self.min_size and
+                now - idle_since > self.max_idle
+            )
+            if idle_too_long or self._is_expired(connection, now):
+                stale.append(connection)
+                self._forget(connection)
+            else:
+                kept.append((connection, idle_since))
+        self._idle = kept
+        return stale
+
+    def _is_expired(self, connection, now=None):
+        if self.max_lifetime is None:
+            return False
+        created_at = self._created_at.get(id(connection))
+        if created_at is None:
+            return True
+        return (now or time.monotonic()) - created_at > self.max_lifetime
+
+    def _new_connection(self):
+        try:
+            connection = self.connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created_at[id(connection)] = time.monotonic()
+            self.stats['connections_opened'] += 1
+        return connection
+
+    def _forget(self, connection):
+        """Release a connection's slot. Must be called with the lock held."""
+        if self._created_at.pop(id(connection), None) is not None:
+            self._size -= 1
+            self.stats['connections_closed'] += 1
+        self._cond.notify()
+
+    def _discard(self, connection):
+        with self._cond:
+            self._forget(connection)
+        self._close_connections([connection])
+
+    def _close_connections(self, connections):
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _reset_after_fork(self):
+        """
+        Drop all the connections inherited from a parent process without
+        closing them since the parent may still be using them. Must be called
+        with the lock held. Return True if the pool was reset.
+        """
+        pid = os.getpid()
+        if pid == self._pid:
+            return False
+        self._pid = pid
+        self._idle = deque()
+        self._created_at = {}
+        self._size = 0
+        return True
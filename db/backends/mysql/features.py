@@ -27,6 +27,7 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     supports_column_check_constraints = False
     can_clone_databases = True
     supports_temporal_subtraction = True
+    supports_update_conflicts = True
     supports_select_intersection = False
     supports_select_difference = False
     supports_slicing_ordering_in_compound = True
@@ -2,6 +2,7 @@ import uuid
 
 from django.conf import settings
 from django.db.backends.base.operations import BaseDatabaseOperations
+from django.db.models.constants import OnConflict
 from django.utils import timezone
 from django.utils.encoding import force_text
 
@@ -206,6 +207,21 @@ class DatabaseOperations(BaseDatabaseOperations):
         values_sql = ", ".join("(%s)" % sql for sql in placeholder_rows_sql)
         return "VALUES " + values_sql
 
+    def insert_statement(self, on_conflict=None):
+        if on_conflict == OnConflict.IGNORE:
+            return 'INSERT IGNORE INTO'
+        return super().insert_statement(on_conflict=on_conflict)
+
+    def on_conflict_suffix_sql(self, fields, on_conflict, update_fields, unique_fields):
+        if on_conflict == OnConflict.UPDATE:
+            # MySQL doesn't accept a conflict target; any unique index that
+            # matches triggers the update.
+            return 'ON DUPLICATE KEY UPDATE %s' % ', '.join(
+                '%s = VALUES(%s)' % (field, field)
+                for field in map(self.quote_name, update_fields)
+            )
+        return super().on_conflict_suffix_sql(fields, on_conflict, update_fields, unique_fields)
+
     def combine_expression(self, connector, sub_expressions):
         if connector == '^':
             return 'POW(%s)' % ','.join(sub_expressions)
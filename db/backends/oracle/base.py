@@ -202,6 +202,7 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         conn_params = self.settings_dict['OPTIONS'].copy()
         if 'use_returning_into' in conn_params:
             del conn_params['use_returning_into']
+        conn_params.pop('pool', None)
         return conn_params
 
     def get_new_connection(self, conn_params):
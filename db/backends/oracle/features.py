@@ -12,6 +12,7 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     has_select_for_update_of = True
     select_for_update_of_column = True
     can_return_id_from_insert = True
+    supports_ignore_conflicts = False
     allow_sliced_subqueries = False
     can_introspect_autofield = True
     supports_subqueries_in_group_by = False
@@ -154,6 +154,7 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         }
         conn_params.update(settings_dict['OPTIONS'])
         conn_params.pop('isolation_level', None)
+        conn_params.pop('pool', None)
         if settings_dict['USER']:
             conn_params['user'] = settings_dict['USER']
         if settings_dict['PASSWORD']:
@@ -7,6 +7,9 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     allows_group_by_selected_pks = True
     can_return_id_from_insert = True
     can_return_ids_from_bulk_insert = True
+    requires_casted_case_in_updates = True
+    supports_update_conflicts = True
+    supports_update_conflicts_with_target = True
     has_real_datatype = True
     has_native_uuid_field = True
     has_native_duration_field = True
@@ -3,6 +3,7 @@ from psycopg2.extras import Inet
 from django.conf import settings
 from django.db import NotSupportedError
 from django.db.backends.base.operations import BaseDatabaseOperations
+from django.db.models.constants import OnConflict
 
 
 class DatabaseOperations(BaseDatabaseOperations):
@@ -230,6 +231,19 @@ class DatabaseOperations(BaseDatabaseOperations):
         values_sql = ", ".join("(%s)" % sql for sql in placeholder_rows_sql)
         return "VALUES " + values_sql
 
+    def on_conflict_suffix_sql(self, fields, on_conflict, update_fields, unique_fields):
+        if on_conflict == OnConflict.IGNORE:
+            return 'ON CONFLICT DO NOTHING'
+        if on_conflict == OnConflict.UPDATE:
+            return 'ON CONFLICT(%s) DO UPDATE SET %s' % (
+                ', '.join(map(self.quote_name, unique_fields)),
+                ', '.join(
+                    '%s = EXCLUDED.%s' % (field, field)
+                    for field in map(self.quote_name, update_fields)
+                ),
+            )
+        return super().on_conflict_suffix_sql(fields, on_conflict, update_fields, unique_fields)
+
     def adapt_datefield_value(self, value):
         return value
 
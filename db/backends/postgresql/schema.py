@@ -1,6 +1,8 @@
 import psycopg2
 
 from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.backends.ddl_references import Statement
+from django.db.transaction import atomic
 
 
 class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
@@ -15,6 +17,23 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
     sql_create_varchar_index = "CREATE INDEX %(name)s ON %(table)s (%(columns)s varchar_pattern_ops)%(extra)s"
     sql_create_text_index = "CREATE INDEX %(name)s ON %(table)s (%(columns)s text_pattern_ops)%(extra)s"
     sql_delete_index = "DROP INDEX IF EXISTS %(name)s"
+    sql_delete_index_concurrently = "DROP INDEX CONCURRENTLY IF EXISTS %(name)s"
+    sql_create_unique_index_concurrently = "CREATE UNIQUE INDEX CONCURRENTLY %(name)s ON %(table)s (%(columns)s)"
+    sql_create_unique_using_index = "ALTER TABLE %(table)s ADD CONSTRAINT %(name)s UNIQUE USING INDEX %(name)s"
+
+    # Constraints added NOT VALID are only checked for new and updated rows
+    # until they're validated, which doesn't block writes to the table.
+    sql_create_fk_not_valid = BaseDatabaseSchemaEditor.sql_create_fk + " NOT VALID"
+    sql_create_check_not_valid = BaseDatabaseSchemaEditor.sql_create_check + " NOT VALID"
+    sql_validate_constraint = "ALTER TABLE %(table)s VALIDATE CONSTRAINT %(name)s"
+
+    # Update a batch of rows and return the last primary key of the batch.
+    sql_update_batch_with_default = (
+        "WITH batch AS (SELECT %(pk)s FROM %(table)s%(where)s ORDER BY %(pk)s LIMIT %(size)d), "
+        "updated AS (UPDATE %(table)s SET %(column)s = %(default)s FROM batch "
+        "WHERE %(table)s.%(pk)s = batch.%(pk)s AND %(table)s.%(column)s IS NULL) "
+        "SELECT MAX(%(pk)s) FROM batch"
+    )
 
     # Setting the constraint to IMMEDIATE runs any deferred checks to allow
     # dropping it in the same transaction.
@@ -25,6 +44,140 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
     def quote_value(self, value):
         return psycopg2.extensions.adapt(value)
 
+    def add_index(self, model, index, concurrently=False):
+        """
+        Add an index on a model. If concurrently is True, build it without
+        blocking writes to the table, which can't be done in a transaction.
+        """
+        if concurrently:
+            self.execute(index.create_sql(model, self, concurrently=True))
+        else:
+            super().add_index(model, index)
+
+    def remove_index(self, model, index, concurrently=False):
+        if concurrently:
+            self.execute(self._delete_constraint_sql(self.sql_delete_index_concurrently, model, index.name))
+        else:
+            super().remove_index(model, index)
+
+    def add_field_concurrently(self, model, field, batch_size=1000):
+        """
+        Create a field on a model like add_field(), without locking the table
+        for longer than catalog changes, which can't be done in a transaction:
+
+        - the column is added as nullable, with its default set in the
+          database for the rows inserted meanwhile, and the existing rows are
+          filled in batches of batch_size rows, each in its own transaction;
+        - the foreign key and check constraints are added NOT VALID, then
+          validated;
+        - NOT NULL is set once a validated check constraint proves it, which
+          saves PostgreSQL 12+ from scanning the table again;
+        - the indexes are built concurrently.
+        """
+        # Creating a table or a primary key is done as usual.
+        if field.many_to_many or field.primary_key:
+            return self.add_field(model, field)
+        db_params = field.db_parameters(connection=self.connection)
+        if db_params['type'] is None:
+            return
+        table = model._meta.db_table
+        self.execute(self.sql_create_column % {
+            "table": self.quote_name(table),
+            "column": self.quote_name(field.column),
+            "definition": db_params['type'],
+        })
+        default = self.effective_default(field)
+        if default is not None:
+            changes_sql, params = self._alter_column_default_sql(model, None, field)
+            self.execute(self.sql_alter_column % {"table": self.quote_name(table), "changes": changes_sql}, params)
+        constraint_names = []
+        if field.remote_field and field.db_constraint:
+            fk = self._create_fk_sql(model, field, "_fk_%(to_table)s_%(to_column)s")
+            self.execute(Statement(self.sql_create_fk_not_valid, **fk.parts))
+            constraint_names.append(str(fk.parts['name']))
+        if db_params['check']:
+            check_name = self.quote_name(self._create_index_name(table, [field.column], suffix='_check'))
+            self.execute(self.sql_create_check_not_valid % {
+                "table": self.quote_name(table),
+                "name": check_name,
+                "check": db_params['check'],
+            })
+            constraint_names.append(check_name)
+        if default is not None:
+            self.update_with_default_in_batches(model, field, default, batch_size)
+        for name in constraint_names:
+            self.execute(self.sql_validate_constraint % {"table": self.quote_name(table), "name": name})
+        if not field.null:
+            self._set_not_null_validated(model, field)
+        if default is not None and not self.skip_default(field):
+            changes_sql, params = self._alter_column_default_sql(model, None, field, drop=True)
+            self.execute(self.sql_alter_column % {"table": self.quote_name(table), "changes": changes_sql}, params)
+        # Build the indexes.
+        if field.unique:
+            name = self.quote_name(self._create_index_name(table, [field.column], suffix='_uniq'))
+            self.execute(self.sql_create_unique_index_concurrently % {
+                "table": self.quote_name(table),
+                "name": name,
+                "columns": self.quote_name(field.column),
+            })
+            self.execute(self.sql_create_unique_using_index % {"table": self.quote_name(table), "name": name})
+        elif self._field_should_be_indexed(model, field):
+            self.execute(self._create_index_sql(model, [field], concurrently=True))
+        like_index_statement = self._create_like_index_sql(model, field, concurrently=True)
+        if like_index_statement is not None:
+            self.execute(like_index_statement)
+
+    def update_with_default_in_batches(self, model, field, default, batch_size):
+        """
+        Set the column of the field to default in the rows where it's NULL,
+        batch_size rows at a time in primary key order, committing each batch.
+        """
+        sql_params = {
+            "table": self.quote_name(model._meta.db_table),
+            "column": self.quote_name(field.column),
+            "pk": self.quote_name(model._meta.pk.column),
+            "default": "%s",
+            "size": batch_size,
+        }
+        if self.collect_sql:
+            # The batches depend on the data, show a single statement instead.
+            self.execute(self.sql_update_with_default % sql_params, [default])
+            return
+        last_pk = None
+        while True:
+            if last_pk is None:
+                sql = self.sql_update_batch_with_default % dict(sql_params, where="")
+                params = [default]
+            else:
+                sql = self.sql_update_batch_with_default % dict(sql_params, where=" WHERE %s > %%s" % sql_params["pk"])
+                params = [last_pk, default]
+            with atomic(self.connection.alias), self.connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                last_pk = cursor.fetchone()[0]
+            if last_pk is None:
+                break
+
+    def _set_not_null_validated(self, model, field):
+        table = model._meta.db_table
+        name = self.quote_name(self._create_index_name(table, [field.column], suffix='_notnull'))
+        self.execute(self.sql_create_check_not_valid % {
+            "table": self.quote_name(table),
+            "name": name,
+            "check": "%s IS NOT NULL" % self.quote_name(field.column),
+        })
+        self.execute(self.sql_validate_constraint % {"table": self.quote_name(table), "name": name})
+        self.execute(self.sql_alter_column % {
+            "table": self.quote_name(table),
+            "changes": self.sql_alter_column_not_null % {"column": self.quote_name(field.column)},
+        })
+        self.execute(self.sql_delete_check % {"table": self.quote_name(table), "name": name})
+
+    def _create_index_sql(self, model, fields, *, sql=None, concurrently=False, **kwargs):
+        if concurrently:
+            # All the CREATE INDEX templates, e.g. with operator classes.
+            sql = (sql or self.sql_create_index).replace('CREATE INDEX', 'CREATE INDEX CONCURRENTLY', 1)
+        return super()._create_index_sql(model, fields, sql=sql, **kwargs)
+
     def _field_indexes_sql(self, model, field):
         output = super()._field_indexes_sql(model, field)
         like_index_statement = self._create_like_index_sql(model, field)
@@ -32,7 +185,7 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
             output.append(like_index_statement)
         return output
 
-    def _create_like_index_sql(self, model, field):
+    def _create_like_index_sql(self, model, field, concurrently=False):
         """
         Return the statement to create an index with varchar operator pattern
         when the column type is 'varchar' or 'text', otherwise return None.
@@ -49,9 +202,13 @@ class DatabaseSchemaEditor(BaseDatabaseSchemaEditor):
             if '[' in db_type:
                 return None
             if db_type.startswith('varchar'):
-                return self._create_index_sql(model, [field], suffix='_like', sql=self.sql_create_varchar_index)
+                return self._create_index_sql(
+                    model, [field], suffix='_like', sql=self.sql_create_varchar_index, concurrently=concurrently,
+                )
             elif db_type.startswith('text'):
-                return self._create_index_sql(model, [field], suffix='_like', sql=self.sql_create_text_index)
+                return self._create_index_sql(
+                    model, [field], suffix='_like', sql=self.sql_create_text_index, concurrently=concurrently,
+                )
         return None
 
     def _alter_column_type_sql(self, model, old_field, new_field, new_type):
@@ -139,6 +139,7 @@ class DatabaseWrapper(BaseDatabaseWrapper):
             'detect_types': Database.PARSE_DECLTYPES | Database.PARSE_COLNAMES,
         }
         kwargs.update(settings_dict['OPTIONS'])
+        kwargs.pop('pool', None)
         # Always allow the underlying SQLite connection to be shareable
         # between multiple threads. The safe-guarding will be handled at a
         # higher level by the `BaseDatabaseWrapper.allow_thread_sharing`
@@ -34,6 +34,8 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     uses_savepoints = Database.sqlite_version_info >= (3, 6, 8)
     supports_index_column_ordering = Database.sqlite_version_info >= (3, 3, 0)
     can_release_savepoints = uses_savepoints
+    supports_update_conflicts = Database.sqlite_version_info >= (3, 24, 0)
+    supports_update_conflicts_with_target = supports_update_conflicts
     can_share_in_memory_db = (
         Database.__name__ == 'sqlite3.dbapi2' and
         Database.sqlite_version_info >= (3, 7, 13)
@@ -74,6 +74,13 @@ class MigrationExecutor:
                 self.loader.graph.nodes[key] for key in self.loader.applied_migrations
                 if key in self.loader.graph.nodes
             }
+            if self.loader.state_snapshots is not None:
+                return self.loader.state_snapshots.make_state(
+                    self.loader.graph,
+                    [(migration.app_label, migration.name) for migration, _ in full_plan
+                     if migration in applied_migrations],
+                    real_apps=state.real_apps,
+                )
             for migration, _ in full_plan:
                 if migration in applied_migrations:
                     migration.mutate_state(state, preserve=False)
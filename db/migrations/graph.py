@@ -257,8 +257,11 @@ class MigrationGraph:
         """
         if target not in self.nodes:
             raise NodeNotFoundError("Node %r not a valid node" % (target, ), target)
-        # Use parent.key instead of parent to speed up the frequent hashing in ensure_not_cyclic
-        self.ensure_not_cyclic(target, lambda x: (parent.key for parent in self.node_map[x].parents))
+        # The graph was already checked if it hasn't changed since a plan was
+        # computed, see clear_cache().
+        if not self.cached:
+            # Use parent.key instead of parent to speed up the frequent hashing in ensure_not_cyclic
+            self.ensure_not_cyclic(target, lambda x: (parent.key for parent in self.node_map[x].parents))
         self.cached = True
         node = self.node_map[target]
         try:
@@ -276,8 +279,9 @@ class MigrationGraph:
         """
         if target not in self.nodes:
             raise NodeNotFoundError("Node %r not a valid node" % (target, ), target)
-        # Use child.key instead of child to speed up the frequent hashing in ensure_not_cyclic
-        self.ensure_not_cyclic(target, lambda x: (child.key for child in self.node_map[x].children))
+        if not self.cached:
+            # Use child.key instead of child to speed up the frequent hashing in ensure_not_cyclic
+            self.ensure_not_cyclic(target, lambda x: (child.key for child in self.node_map[x].children))
         self.cached = True
         node = self.node_map[target]
         try:
@@ -352,12 +356,15 @@ class MigrationGraph:
     def _nodes_and_edges(self):
         return len(self.nodes), sum(len(node.parents) for node in self.node_map.values())
 
-    def make_state(self, nodes=None, at_end=True, real_apps=None):
+    def make_state(self, nodes=None, at_end=True, real_apps=None, snapshots=None):
         """
         Given a migration node or nodes, return a complete ProjectState for it.
         If at_end is False, return the state before the migration has run.
         If nodes is not provided, return the overall most current project state.
+        If snapshots, a StateSnapshotStore, is provided, start from the state of
+        the migrations it has a snapshot of.
         """
+        save_snapshot = nodes is None
         if nodes is None:
             nodes = list(self.leaf_nodes())
         if len(nodes) == 0:
@@ -365,12 +372,16 @@ class MigrationGraph:
         if not isinstance(nodes[0], tuple):
             nodes = [nodes]
         plan = []
+        planned = set()
         for node in nodes:
             for migration in self.forwards_plan(node):
-                if migration not in plan:
+                if migration not in planned:
                     if not at_end and migration in nodes:
                         continue
                     plan.append(migration)
+                    planned.add(migration)
+        if snapshots is not None:
+            return snapshots.make_state(self, plan, real_apps=real_apps, save=save_snapshot)
         project_state = ProjectState(real_apps=real_apps)
         for node in plan:
             project_state = self.nodes[node].mutate_state(project_state, preserve=False)
@@ -6,6 +6,7 @@ from django.apps import apps
 from django.conf import settings
 from django.db.migrations.graph import MigrationGraph
 from django.db.migrations.recorder import MigrationRecorder
+from django.db.migrations.snapshot import StateSnapshotStore
 
 from .exceptions import (
     AmbiguityError, BadMigrationError, InconsistentMigrationHistory,
@@ -45,6 +46,10 @@ class MigrationLoader:
         self.disk_migrations = None
         self.applied_migrations = None
         self.ignore_no_migrations = ignore_no_migrations
+        if settings.MIGRATION_STATE_CACHE_DIR:
+            self.state_snapshots = StateSnapshotStore(settings.MIGRATION_STATE_CACHE_DIR)
+        else:
+            self.state_snapshots = None
         if load:
             self.build_graph()
 
@@ -313,4 +318,7 @@ class MigrationLoader:
 
         See graph.make_state() for the meaning of "nodes" and "at_end".
         """
-        return self.graph.make_state(nodes=nodes, at_end=at_end, real_apps=list(self.unmigrated_apps))
+        return self.graph.make_state(
+            nodes=nodes, at_end=at_end, real_apps=list(self.unmigrated_apps),
+            snapshots=self.state_snapshots,
+        )
@@ -4,12 +4,14 @@ from .models import (
     AlterModelTable, AlterOrderWithRespectTo, AlterUniqueTogether, CreateModel,
     DeleteModel, RemoveIndex, RenameModel,
 )
-from .special import RunPython, RunSQL, SeparateDatabaseAndState
+from .special import (
+    RunPython, RunPythonInBatches, RunSQL, SeparateDatabaseAndState,
+)
 
 __all__ = [
     'CreateModel', 'DeleteModel', 'AlterModelTable', 'AlterUniqueTogether',
     'RenameModel', 'AlterIndexTogether', 'AlterModelOptions', 'AddIndex',
     'RemoveIndex', 'AddField', 'RemoveField', 'AlterField', 'RenameField',
-    'SeparateDatabaseAndState', 'RunSQL', 'RunPython',
+    'SeparateDatabaseAndState', 'RunSQL', 'RunPython', 'RunPythonInBatches',
     'AlterOrderWithRespectTo', 'AlterModelManagers',
 ]
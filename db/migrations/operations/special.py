@@ -1,4 +1,6 @@
-from django.db import router
+import time
+
+from django.db import NotSupportedError, router, transaction
 
 from .base import Operation
 
@@ -201,3 +203,98 @@ class RunPython(Operation):
     @staticmethod
     def noop(apps, schema_editor):
         return None
+
+
+class RunPythonInBatches(RunPython):
+    """
+    Run Python code on the rows of a model in batches of batch_size rows, in
+    primary key order, e.g. to backfill a column of a large table.
+
+    The code is called as code(apps, schema_editor, batch), where batch is a
+    QuerySet of the rows of a primary key range, once for each batch, each
+    time in its own transaction, optionally pausing for pause seconds in
+    between. The last primary key of the batches is recorded by the
+    MigrationRecorder in the same transaction, hence a migration that was
+    interrupted resumes after the last batch committed.
+
+    The batches can't be committed inside a transaction, so the migration
+    must set atomic = False.
+    """
+
+    def __init__(self, model_name, code, reverse_code=None, batch_size=1000, pause=0, hints=None, elidable=False):
+        super().__init__(code, reverse_code, atomic=False, hints=hints, elidable=elidable)
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def deconstruct(self):
+        kwargs = {
+            'model_name': self.model_name,
+            'code': self.code,
+        }
+        if self.reverse_code is not None:
+            kwargs['reverse_code'] = self.reverse_code
+        if self.batch_size != 1000:
+            kwargs['batch_size'] = self.batch_size
+        if self.pause:
+            kwargs['pause'] = self.pause
+        if self.hints:
+            kwargs['hints'] = self.hints
+        return (
+            self.__class__.__qualname__,
+            [],
+            kwargs
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        # RunPython has access to all models. Ensure that all models are
+        # reloaded in case any are delayed.
+        from_state.clear_delayed_apps_cache()
+        if router.allow_migrate(schema_editor.connection.alias, app_label, **self.hints):
+            self._run_in_batches(app_label, schema_editor, from_state, self.code)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self.reverse_code is None:
+            raise NotImplementedError("You cannot reverse this operation")
+        if self.reverse_code in (RunPython.noop, self.noop):
+            return
+        if router.allow_migrate(schema_editor.connection.alias, app_label, **self.hints):
+            self._run_in_batches(app_label, schema_editor, from_state, self.reverse_code)
+
+    def describe(self):
+        return "Raw Python operation on %s in batches of %d rows" % (self.model_name, self.batch_size)
+
+    def _run_in_batches(self, app_label, schema_editor, from_state, code):
+        from django.db.migrations.recorder import MigrationRecorder
+        connection = schema_editor.connection
+        if connection.in_atomic_block:
+            raise NotSupportedError(
+                "The %s operation cannot be executed inside a transaction "
+                "(set atomic = False on the migration)." % self.__class__.__name__
+            )
+        recorder = MigrationRecorder(connection)
+        # The name of the code includes the module of the migration.
+        progress_name = '%s.%s' % (code.__module__, code.__qualname__)
+        apps = from_state.apps
+        model = apps.get_model(app_label, self.model_name)
+        queryset = model._base_manager.using(connection.alias).order_by('pk')
+        last_pk = recorder.progress(app_label, progress_name)
+        if last_pk is not None:
+            last_pk = model._meta.pk.to_python(last_pk)
+        while True:
+            rows = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            bound = list(rows.values_list('pk', flat=True)[self.batch_size - 1:self.batch_size])
+            batch_last_pk = bound[0] if bound else None
+            with transaction.atomic(using=connection.alias):
+                code(apps, schema_editor, rows if batch_last_pk is None else rows.filter(pk__lte=batch_last_pk))
+                # Remove the progress after the last batch.
+                recorder.record_progress(app_label, progress_name, batch_last_pk)
+            if batch_last_pk is None:
+                break
+            last_pk = batch_last_pk
+            if self.pause:
+                time.sleep(self.pause)
+
+    @staticmethod
+    def noop(apps, schema_editor, batch):
+        return None
@@ -16,8 +16,11 @@ class MigrationRecorder:
     and then have a floating model to do queries with.
 
     If a migration is unapplied its row is removed from the table. Having
-    a row in the table always means a migration is applied.
+    a row in the table always means a migration is applied, except for the
+    rows recording the progress of an operation, e.g. RunPythonInBatches,
+    whose names contain a colon, which can't be in the name of a migration.
     """
+    progress_separator = ':'
 
     class Migration(models.Model):
         app = models.CharField(max_length=255)
@@ -59,7 +62,10 @@ class MigrationRecorder:
     def applied_migrations(self):
         """Return a set of (app, name) of applied migrations."""
         if self.has_table():
-            return {tuple(x) for x in self.migration_qs.values_list('app', 'name')}
+            return {
+                tuple(x) for x in
+                self.migration_qs.exclude(name__contains=self.progress_separator).values_list('app', 'name')
+            }
         else:
             # If the django_migrations table doesn't exist, then no migrations
             # are applied.
@@ -75,6 +81,30 @@ class MigrationRecorder:
         self.ensure_schema()
         self.migration_qs.filter(app=app, name=name).delete()
 
+    def progress(self, app, name):
+        """
+        Return the progress recorded for the operation with the given name,
+        as a string, or None if there's none.
+        """
+        if not self.has_table():
+            return None
+        prefix = name + self.progress_separator
+        names = self.migration_qs.filter(app=app, name__startswith=prefix).values_list('name', flat=True)
+        for recorded_name in names:
+            return recorded_name[len(prefix):]
+        return None
+
+    def record_progress(self, app, name, progress):
+        """
+        Record the progress of the operation with the given name, replacing
+        the previous one, or remove it if progress is None.
+        """
+        self.ensure_schema()
+        prefix = name + self.progress_separator
+        self.migration_qs.filter(app=app, name__startswith=prefix).delete()
+        if progress is not None:
+            self.migration_qs.create(app=app, name='%s%s' % (prefix, progress))
+
     def flush(self):
         """Delete all migration records. Useful for testing migrations."""
         self.migration_qs.all().delete()
@@ -0,0 +1,175 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+
+import django
+
+from .state import ProjectState
+
+logger = logging.getLogger('django.db.migrations')
+
+
+class StateSnapshotStore:
+    """
+    Keep the project states built by replaying migrations in a directory, so
+    that building the state of a set of migrations starts from the snapshot
+    of the largest subset of them and only replays the others.
+
+    A snapshot is keyed by a hash of the migrations it includes along with the
+    modification times and sizes of their files, hence changing a migration
+    file invalidates the snapshots including the migration.
+    """
+    # The maximum number of snapshots kept in the directory. The least
+    # recently used ones are removed first.
+    max_snapshots = 10
+    index_name = 'index.pickle'
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.fingerprints = {}
+
+    def fingerprint(self, migration):
+        """
+        Return the modification time and size of the file of the migration,
+        or None if it isn't loaded from a file.
+        """
+        path = getattr(sys.modules.get(migration.__class__.__module__), '__file__', None)
+        if path is None:
+            return None
+        if path not in self.fingerprints:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self.fingerprints[path] = None
+            else:
+                self.fingerprints[path] = '%s:%s' % (stat.st_mtime, stat.st_size)
+        return self.fingerprints[path]
+
+    def make_state(self, graph, plan, real_apps=None, save=True):
+        """
+        Return the ProjectState resulting from applying the migrations of the
+        plan, a list of graph nodes in the order they're applied. If save is
+        True, keep a snapshot of this state unless there's already one.
+        """
+        state = ProjectState(real_apps=real_apps)
+        entries = set()
+        for node in plan:
+            fingerprint = self.fingerprint(graph.nodes[node])
+            if fingerprint is None:
+                return self.replay(graph, plan, state)
+            entries.add((node, fingerprint))
+        entries = frozenset(entries)
+        key = self.generate_key(entries, state.real_apps)
+
+        real_apps = frozenset(state.real_apps)
+        index = self.read_index()
+        for snapshot_key in self.find_snapshots(graph, index, entries, real_apps):
+            models = self.read_snapshot(snapshot_key)
+            if models is None:
+                del index[snapshot_key]
+                continue
+            state.models = models
+            replayed = {node for node, fingerprint in index[snapshot_key][0]}
+            index.move_to_end(snapshot_key)
+            self.write_index(index)
+            if snapshot_key == key:
+                return state
+            plan = [node for node in plan if node not in replayed]
+            break
+        state = self.replay(graph, plan, state)
+        if save and self.write_snapshot(key, state.models):
+            index[key] = (entries, real_apps)
+            while len(index) > self.max_snapshots:
+                self.remove_snapshot(index.popitem(last=False)[0])
+            self.write_index(index)
+        return state
+
+    def replay(self, graph, plan, state):
+        for node in plan:
+            state = graph.nodes[node].mutate_state(state, preserve=False)
+        return state
+
+    def generate_key(self, entries, real_apps):
+        values = [django.__version__, sys.version] + sorted(real_apps)
+        values.extend('%s.%s:%s' % (node[0], node[1], fingerprint) for node, fingerprint in sorted(entries))
+        return hashlib.sha1('\n'.join(values).encode()).hexdigest()
+
+    def find_snapshots(self, graph, index, entries, real_apps):
+        """
+        Yield the keys of the snapshots of subsets of the entries, largest
+        first, from which the state of the entries can be built by replaying
+        the other migrations.
+        """
+        candidates = [
+            (snapshot_key, snapshot_entries) for snapshot_key, (snapshot_entries, snapshot_real_apps) in index.items()
+            if snapshot_real_apps == real_apps and snapshot_entries <= entries
+        ]
+        candidates.sort(key=lambda candidate: len(candidate[1]), reverse=True)
+        for snapshot_key, snapshot_entries in candidates:
+            replayed = {node for node, fingerprint in snapshot_entries}
+            # A migration that isn't in the snapshot mustn't be a dependency
+            # of one that is, e.g. through a run_before of a new migration.
+            if all(
+                child not in replayed
+                for node, fingerprint in entries - snapshot_entries
+                for child in graph.node_map[node].children
+            ):
+                yield snapshot_key
+
+    def read_index(self):
+        try:
+            with open(os.path.join(self.directory, self.index_name), 'rb') as f:
+                index = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return OrderedDict()
+        return index if isinstance(index, OrderedDict) else OrderedDict()
+
+    def write_index(self, index):
+        self.write_file(self.index_name, pickle.dumps(index, pickle.HIGHEST_PROTOCOL))
+
+    def read_snapshot(self, key):
+        """Return the models of the snapshot or None if it can't be loaded."""
+        try:
+            with open(os.path.join(self.directory, key + '.pickle'), 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # The file may be missing or reference classes that moved.
+            logger.debug("Couldn't load the migration state snapshot %s.", key, exc_info=True)
+            return None
+
+    def write_snapshot(self, key, models):
+        try:
+            data = pickle.dumps(models, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # For example, a field whose options include a lambda.
+            logger.debug("Couldn't pickle the migration state.", exc_info=True)
+            return False
+        return self.write_file(key + '.pickle', data)
+
+    def remove_snapshot(self, key):
+        try:
+            os.remove(os.path.join(self.directory, key + '.pickle'))
+        except OSError:
+            pass
+
+    def write_file(self, name, data):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file and move it into place so that other
+            # processes never read a partially written file.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            try:
+                with open(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, os.path.join(self.directory, name))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError:
+            logger.debug("Couldn't write to the migration state directory '%s'.", self.directory, exc_info=True)
+            return False
+        return True
@@ -1,4 +1,5 @@
 import copy
+import functools
 from collections import OrderedDict
 from contextlib import contextmanager
 
@@ -108,6 +109,10 @@ class ProjectState:
         if delay:
             self.is_delayed = True
 
+        with self.apps.deferred_rendering():
+            return self._find_reload_model_deferred(app_label, model_name, delay)
+
+    def _find_reload_model_deferred(self, app_label, model_name, delay):
         related_models = set()
 
         try:
@@ -165,30 +170,8 @@ class ProjectState:
             self._reload(related_models)
 
     def _reload(self, related_models):
-        # Unregister all related models
-        with self.apps.bulk_update():
-            for rel_app_label, rel_model_name in related_models:
-                self.apps.unregister_model(rel_app_label, rel_model_name)
-
-        states_to_be_rendered = []
-        # Gather all models states of those models that will be rerendered.
-        # This includes:
-        # 1. All related models of unmigrated apps
-        for model_state in self.apps.real_models:
-            if (model_state.app_label, model_state.name_lower) in related_models:
-                states_to_be_rendered.append(model_state)
-
-        # 2. All related models of migrated apps
-        for rel_app_label, rel_model_name in related_models:
-            try:
-                model_state = self.models[rel_app_label, rel_model_name]
-            except KeyError:
-                pass
-            else:
-                states_to_be_rendered.append(model_state)
-
-        # Render all models
-        self.apps.render_multiple(states_to_be_rendered)
+        # The models are rendered when they're looked up, see StateApps.
+        self.apps.mark_dirty(related_models)
 
     def clone(self):
         """Return an exact copy of this ProjectState."""
@@ -198,6 +181,7 @@ class ProjectState:
         )
         if 'apps' in self.__dict__:
             new_state.apps = self.apps.clone()
+            new_state.apps.model_states = new_state.models
         new_state.is_delayed = self.is_delayed
         return new_state
 
@@ -247,8 +231,16 @@ class StateApps(Apps):
     """
     Subclass of the global Apps registry class to better handle dynamic model
     additions and removals.
+
+    The models to render again after changes to the project state are marked
+    dirty and rendered together when the registry is next looked up, e.g. by
+    an operation's database_forwards() or a RunPython function, or cloned.
+    Until then, the registry holds the classes as they were last rendered.
     """
     def __init__(self, real_apps, models, ignore_swappable=False):
+        self.model_states = models
+        self.dirty_models = set()
+        self._rendering_deferred = False
         # Any apps in self.real_apps should have all their models included
         # in the render. We don't use the original model instances as there
         # are some variables that refer to the Apps object.
@@ -289,6 +281,60 @@ class StateApps(Apps):
             self.ready = ready
             self.clear_cache()
 
+    @contextmanager
+    def deferred_rendering(self):
+        """Look up the dirty models as they were last rendered."""
+        rendering_deferred = self._rendering_deferred
+        self._rendering_deferred = True
+        try:
+            yield
+        finally:
+            self._rendering_deferred = rendering_deferred
+
+    def mark_dirty(self, model_keys):
+        """
+        Mark the models with the given (app_label, model_name) keys to be
+        rendered again before they're looked up.
+        """
+        self.dirty_models.update(model_keys)
+        self.get_models.cache_clear()
+
+    def render_dirty_models(self):
+        """Render the dirty models unless rendering is deferred."""
+        if self._rendering_deferred or not self.dirty_models:
+            return
+        model_keys, self.dirty_models = self.dirty_models, set()
+        with self.deferred_rendering():
+            with self.bulk_update():
+                for app_label, model_name in model_keys:
+                    self.unregister_model(app_label, model_name)
+            # Models of unmigrated apps first.
+            model_states = [
+                model_state for model_state in self.real_models
+                if (model_state.app_label, model_state.name_lower) in model_keys
+            ]
+            model_states.extend(self.model_states[key] for key in model_keys if key in self.model_states)
+            self.render_multiple(model_states)
+
+    def get_app_configs(self):
+        self.render_dirty_models()
+        return super().get_app_configs()
+
+    def get_app_config(self, app_label):
+        self.render_dirty_models()
+        return super().get_app_config(app_label)
+
+    @functools.lru_cache(maxsize=None)
+    def get_models(self, include_auto_created=False, include_swapped=False):
+        self.render_dirty_models()
+        # Bypass the cache of Apps.get_models(), which clear_cache() doesn't
+        # clear on this subclass.
+        return Apps.get_models.__wrapped__(self, include_auto_created, include_swapped)
+
+    def get_model(self, app_label, model_name=None, require_ready=True):
+        self.render_dirty_models()
+        return super().get_model(app_label, model_name, require_ready)
+
     def render_multiple(self, model_states):
         # We keep trying to render the models in a loop, ignoring invalid
         # base errors, until the size of the unrendered models doesn't
@@ -296,6 +342,8 @@ class StateApps(Apps):
         # missing base.
         if not model_states:
             return
+        # Render the dirty models first, not to render them over these later.
+        self.render_dirty_models()
         # Prevent that all model caches are expired for each render.
         with self.bulk_update():
             unrendered_models = model_states
@@ -317,12 +365,13 @@ class StateApps(Apps):
 
     def clone(self):
         """Return a clone of this registry."""
+        # Render the dirty models once rather than in both registries.
+        self.render_dirty_models()
         clone = StateApps([], {})
         clone.all_models = copy.deepcopy(self.all_models)
-        clone.app_configs = copy.deepcopy(self.app_configs)
-        # Set the pointer to the correct app registry.
-        for app_config in clone.app_configs.values():
-            app_config.apps = clone
+        # Point the copies of the app configs to the clone rather than to a
+        # copy of this registry.
+        clone.app_configs = copy.deepcopy(self.app_configs, {id(self): clone})
         # No need to actually clone them, they'll never change
         clone.real_models = self.real_models
         return clone
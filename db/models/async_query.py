@@ -0,0 +1,119 @@
+"""
+Run the queries of the awaitable QuerySet methods, such as aget() or
+acount(), in a pool of threads so that they don't block the event loop.
+
+The threads get their own connections from django.db.connections, which are
+closed after each query unless they're persistent (CONN_MAX_AGE), and the
+queries are compiled and run by the synchronous QuerySet methods, hence by the
+same SQLCompiler.
+
+Queries are run in the calling thread instead if its connection is in a
+transaction, whose changes other connections can't see, or to an in-memory
+SQLite database, which isn't shared between connections.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the thread pool running the queries, creating it if needed."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=settings.DATABASE_ASYNC_MAX_WORKERS)
+    return _executor
+
+
+def _run_in_thread(func, args, kwargs):
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # Close the connections of this thread unless they're persistent.
+        close_old_connections()
+
+
+def run_query(using, func, *args, **kwargs):
+    """
+    Return an asyncio future resolving to the result of func(*args, **kwargs),
+    which runs queries on the database with the alias using.
+    """
+    connection = connections[using]
+    if connection.in_atomic_block or getattr(connection, 'is_in_memory_db', lambda: False)():
+        future = asyncio.Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    return asyncio.wrap_future(get_executor().submit(_run_in_thread, func, args, kwargs))
+
+
+class AsyncQuerySetIterator:
+    """
+    Asynchronous iterator over the results of a QuerySet, which are fetched
+    at once in a thread of the pool and cached on the QuerySet as when it's
+    iterated synchronously.
+    """
+    def __init__(self, queryset):
+        self.queryset = queryset
+        self.iterator = None
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        if self.iterator is not None:
+            future = asyncio.Future()
+            self._set_next(future)
+            return future
+        future = asyncio.Future()
+        fetch = run_query(self.queryset.db, self.queryset._fetch_all)
+
+        def done(fetch):
+            if future.cancelled():
+                return
+            if fetch.cancelled():
+                future.cancel()
+                return
+            if fetch.exception() is not None:
+                future.set_exception(fetch.exception())
+                return
+            self.iterator = iter(self.queryset._result_cache)
+            self._set_next(future)
+        fetch.add_done_callback(done)
+        return future
+
+    def _set_next(self, future):
+        try:
+            future.set_result(next(self.iterator))
+        except StopIteration:
+            future.set_exception(StopAsyncIteration())
+
+
+def _fetch_queryset(queryset):
+    queryset._fetch_all()
+    return queryset._result_cache
+
+
+def gather_querysets(*querysets):
+    """
+    Return an asyncio future resolving to the list of the results of the
+    querysets, whose queries run concurrently. The results of a QuerySet are
+    a list of its results; other arguments, e.g. the futures returned by
+    aget() or acount(), are awaited and resolve to their result. The wall time
+    is that of the slowest query rather than the sum of their times.
+    """
+    from django.db.models.query import QuerySet
+    futures = [
+        run_query(queryset.db, _fetch_queryset, queryset) if isinstance(queryset, QuerySet) else queryset
+        for queryset in querysets
+    ]
+    return asyncio.gather(*futures)
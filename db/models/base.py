@@ -509,6 +509,58 @@ class Model(metaclass=ModelBase):
         new._state.db = db
         return new
 
+    @classmethod
+    def _get_row_constructor(cls, db, field_names):
+        """
+        Return a function that builds an instance from a row of values for
+        field_names like from_db() does, but without going through
+        __init__(). Return None if that wouldn't be equivalent: if __init__()
+        or from_db() is overridden or if pre_init or post_init have receivers
+        for this model.
+        """
+        if (cls.from_db.__func__ is not Model.from_db.__func__ or
+                pre_init.has_listeners(cls) or post_init.has_listeners(cls)):
+            return None
+        if [klass for klass in cls.__mro__ if '__init__' in klass.__dict__] != [Model, object]:
+            return None
+        key = tuple(field_names)
+        try:
+            attnames, descriptor_attnames = cls._meta._row_constructors[key]
+        except KeyError:
+            attnames, descriptor_attnames = [], []
+            for attname in field_names:
+                # Attributes managed by a data descriptor (e.g. FileField's)
+                # must go through setattr() as in __init__().
+                for klass in cls.__mro__:
+                    if attname in klass.__dict__:
+                        is_descriptor = hasattr(type(klass.__dict__[attname]), '__set__')
+                        break
+                else:
+                    is_descriptor = False
+                attnames.append(None if is_descriptor else attname)
+                descriptor_attnames.append(attname if is_descriptor else None)
+            if not any(descriptor_attnames):
+                descriptor_attnames = None
+            cls._meta._row_constructors[key] = attnames, descriptor_attnames
+
+        new = object.__new__
+
+        def from_row(values):
+            obj = new(cls)
+            state = obj.__dict__['_state'] = ModelState()
+            state.adding = False
+            state.db = db
+            if descriptor_attnames is None:
+                obj.__dict__.update(zip(attnames, values))
+            else:
+                for attname, descriptor_attname, value in zip(attnames, descriptor_attnames, values):
+                    if attname is None:
+                        setattr(obj, descriptor_attname, value)
+                    else:
+                        obj.__dict__[attname] = value
+            return obj
+        return from_row
+
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self)
 
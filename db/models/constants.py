@@ -1,6 +1,13 @@
 """
 Constants used across the ORM in general.
 """
+from enum import Enum
 
 # Separator used to split filter strings apart.
 LOOKUP_SEP = '__'
+
+
+class OnConflict(Enum):
+    """How INSERT statements should handle rows that violate a constraint."""
+    IGNORE = 'ignore'
+    UPDATE = 'update'
@@ -670,6 +670,52 @@ class Value(Expression):
         return []
 
 
+class Param(Expression):
+    """
+    A named placeholder for a value given when a prepared QuerySet is called.
+    See QuerySet.prepared().
+    """
+    def __init__(self, name, output_field=None):
+        super().__init__(output_field=output_field)
+        self.name = name
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.name)
+
+    def _prepare(self, field):
+        # Called by Lookup.get_prep_lookup(); the value is prepared for the
+        # lookup's field when it's bound.
+        c = self.copy()
+        c.output_field = field
+        return c
+
+    def get_db_prep_value(self, value, connection):
+        if value is None:
+            # The SQL is compiled without the values, so "= %s" can't become
+            # "IS NULL" as it would in an exact lookup against None, and
+            # would match no rows.
+            raise ValueError("Cannot use None as the value of %r; filter with isnull instead." % self)
+        output_field = self._output_field_or_none
+        if output_field is None:
+            return value
+        return output_field.get_db_prep_value(value, connection=connection)
+
+    def as_sql(self, compiler, connection):
+        # While a prepared query is compiled, the placeholder itself is
+        # returned as the parameter so that its position can be recorded.
+        param_slots = getattr(compiler, 'param_slots', None)
+        if param_slots is not None:
+            param_slots.append(self)
+            return '%s', [self]
+        param_values = compiler.query.param_values
+        if param_values is None or self.name not in param_values:
+            raise ValueError("No value was given for %r." % self)
+        return '%s', [self.get_db_prep_value(param_values[self.name], connection)]
+
+    def get_group_by_cols(self):
+        return []
+
+
 class DurationValue(Value):
     def as_sql(self, compiler, connection):
         connection.ops.check_expression_support(self)
@@ -132,6 +132,10 @@ class Options:
 
         self.default_related_name = None
 
+        # Row constructors built by Model._get_row_constructor(), keyed by
+        # the tuple of loaded field names. Internal use only.
+        self._row_constructors = {}
+
     @property
     def label(self):
         return '%s.%s' % (self.app_label, self.object_name)
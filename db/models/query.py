@@ -6,21 +6,24 @@ import copy
 import operator
 import warnings
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from itertools import chain
 
 from django.conf import settings
 from django.core import exceptions
 from django.db import (
-    DJANGO_VERSION_PICKLE_KEY, IntegrityError, connections, router,
-    transaction,
+    DJANGO_VERSION_PICKLE_KEY, IntegrityError, NotSupportedError, connections,
+    router, transaction,
 )
 from django.db.models import DateField, DateTimeField, sql
-from django.db.models.constants import LOOKUP_SEP
+from django.db.models.constants import LOOKUP_SEP, OnConflict
 from django.db.models.deletion import Collector
-from django.db.models.expressions import F
+from django.db.models.expressions import (
+    Case, Expression, F, Param, Value, When,
+)
 from django.db.models.fields import AutoField
-from django.db.models.functions import Trunc
+from django.db.models.functions import Cast, Trunc
 from django.db.models.query_utils import FilteredRelation, InvalidQuery, Q
 from django.db.models.sql.constants import CURSOR, GET_ITERATOR_CHUNK_SIZE
 from django.utils import timezone
@@ -60,8 +63,19 @@ class ModelIterable(BaseIterable):
         init_list = [f[0].target.attname
                      for f in select[model_fields_start:model_fields_end]]
         related_populators = get_related_populators(klass_info, select, db)
-        for row in compiler.results_iter(results):
-            obj = model_cls.from_db(db, init_list, row[model_fields_start:model_fields_end])
+        # Build the instances without going through Model.__init__() when
+        # that's equivalent, and convert the values of each fetched chunk a
+        # column at a time.
+        from_row = model_cls._get_row_constructor(db, init_list)
+        if from_row is None:
+            rows = compiler.results_iter(results)
+        else:
+            rows = compiler.results_iter(results, columnwise=True)
+        for row in rows:
+            if from_row is None:
+                obj = model_cls.from_db(db, init_list, row[model_fields_start:model_fields_end])
+            else:
+                obj = from_row(row[model_fields_start:model_fields_end])
             if related_populators:
                 for rel_populator in related_populators:
                     rel_populator.populate(row, obj)
@@ -191,6 +205,7 @@ class QuerySet:
         self._sticky_filter = False
         self._for_write = False
         self._prefetch_related_lookups = ()
+        self._prefetch_related_parallel = False
         self._prefetch_done = False
         self._known_related_objects = {}  # {rel_field: {pk: rel_obj}}
         self._iterable_class = ModelIterable
@@ -272,6 +287,14 @@ class QuerySet:
         self._fetch_all()
         return iter(self._result_cache)
 
+    def __aiter__(self):
+        """
+        Asynchronous iteration, e.g. `async for obj in queryset`. The results
+        are fetched in a thread, see django.db.models.async_query.
+        """
+        from django.db.models.async_query import AsyncQuerySetIterator
+        return AsyncQuerySetIterator(self)
+
     def __bool__(self):
         self._fetch_all()
         return bool(self._result_cache)
@@ -386,6 +409,11 @@ class QuerySet:
 
         return self.query.get_count(using=self.db)
 
+    def acount(self):
+        """Awaitable counterpart of count(), run in a thread."""
+        from django.db.models.async_query import run_query
+        return run_query(self.db, self.count)
+
     def get(self, *args, **kwargs):
         """
         Perform the query and return a single object matching the given
@@ -407,6 +435,11 @@ class QuerySet:
             (self.model._meta.object_name, num)
         )
 
+    def aget(self, *args, **kwargs):
+        """Awaitable counterpart of get(), run in a thread."""
+        from django.db.models.async_query import run_query
+        return run_query(self.db, self.get, *args, **kwargs)
+
     def create(self, **kwargs):
         """
         Create a new object with the given kwargs, saving it to the database
@@ -422,13 +455,56 @@ class QuerySet:
             if obj.pk is None:
                 obj.pk = obj._meta.pk.get_pk_value_on_save(obj)
 
-    def bulk_create(self, objs, batch_size=None):
+    def _check_bulk_create_options(self, ignore_conflicts, update_conflicts, update_fields, unique_fields):
+        """
+        Validate the conflict handling options of bulk_create() and return
+        the matching OnConflict member, or None for a plain INSERT.
+        """
+        if ignore_conflicts and update_conflicts:
+            raise ValueError('ignore_conflicts and update_conflicts are mutually exclusive.')
+        db_features = connections[self.db].features
+        if ignore_conflicts:
+            if not db_features.supports_ignore_conflicts:
+                raise NotSupportedError('This database backend does not support ignoring conflicts.')
+            return OnConflict.IGNORE
+        elif update_conflicts:
+            if not db_features.supports_update_conflicts:
+                raise NotSupportedError('This database backend does not support updating conflicts.')
+            if not update_fields:
+                raise ValueError(
+                    'Fields that will be updated when a row insertion fails '
+                    'on conflicts must be provided.'
+                )
+            if unique_fields and not db_features.supports_update_conflicts_with_target:
+                raise NotSupportedError(
+                    'This database backend does not support updating conflicts with specifying '
+                    'unique fields that can trigger the upsert.'
+                )
+            if not unique_fields and db_features.supports_update_conflicts_with_target:
+                raise ValueError('Unique fields that can trigger the upsert must be provided.')
+            # Updating primary keys and non-concrete fields is forbidden.
+            if any(not f.concrete or f.many_to_many for f in update_fields):
+                raise ValueError('bulk_create() can only be used with concrete fields in update_fields.')
+            if any(f.primary_key for f in update_fields):
+                raise ValueError('bulk_create() cannot be used with primary keys in update_fields.')
+            if unique_fields and any(not f.concrete or f.many_to_many for f in unique_fields):
+                raise ValueError('bulk_create() can only be used with concrete fields in unique_fields.')
+            return OnConflict.UPDATE
+        return None
+
+    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False,
+                    update_conflicts=False, update_fields=None, unique_fields=None):
         """
         Insert each of the instances into the database. Do *not* call
         save() on each of the instances, do not send any pre/post_save
         signals, and do not set the primary key attribute if it is an
         autoincrement field (except if features.can_return_ids_from_bulk_insert=True).
         Multi-table models are not supported.
+
+        With ignore_conflicts=True, rows that fail a constraint check are
+        skipped. With update_conflicts=True, rows that conflict on
+        unique_fields have their update_fields overwritten instead. Primary
+        keys are never set on the instances in either mode.
         """
         # When you bulk insert you don't get the primary keys back (if it's an
         # autoincrement, except if can_return_ids_from_bulk_insert=True), so
@@ -452,19 +528,33 @@ class QuerySet:
                 raise ValueError("Can't bulk create a multi-table inherited model")
         if not objs:
             return objs
+        opts = self.model._meta
+        if update_fields:
+            update_fields = [opts.get_field(name) for name in update_fields]
+        if unique_fields:
+            unique_fields = [opts.pk if name == 'pk' else opts.get_field(name) for name in unique_fields]
+        on_conflict = self._check_bulk_create_options(
+            ignore_conflicts, update_conflicts, update_fields, unique_fields,
+        )
         self._for_write = True
         connection = connections[self.db]
-        fields = self.model._meta.concrete_fields
+        fields = opts.concrete_fields
         objs = list(objs)
         self._populate_pk_values(objs)
         with transaction.atomic(using=self.db, savepoint=False):
             objs_with_pk, objs_without_pk = partition(lambda o: o.pk is None, objs)
             if objs_with_pk:
-                self._batched_insert(objs_with_pk, fields, batch_size)
+                self._batched_insert(
+                    objs_with_pk, fields, batch_size, on_conflict=on_conflict,
+                    update_fields=update_fields, unique_fields=unique_fields,
+                )
             if objs_without_pk:
                 fields = [f for f in fields if not isinstance(f, AutoField)]
-                ids = self._batched_insert(objs_without_pk, fields, batch_size)
-                if connection.features.can_return_ids_from_bulk_insert:
+                ids = self._batched_insert(
+                    objs_without_pk, fields, batch_size, on_conflict=on_conflict,
+                    update_fields=update_fields, unique_fields=unique_fields,
+                )
+                if connection.features.can_return_ids_from_bulk_insert and on_conflict is None:
                     assert len(ids) == len(objs_without_pk)
                 for obj_without_pk, pk in zip(objs_without_pk, ids):
                     obj_without_pk.pk = pk
@@ -473,6 +563,67 @@ class QuerySet:
 
         return objs
 
+    def abulk_create(self, objs, batch_size=None, ignore_conflicts=False,
+                     update_conflicts=False, update_fields=None, unique_fields=None):
+        """Awaitable counterpart of bulk_create(), run in a thread."""
+        from django.db.models.async_query import run_query
+        return run_query(
+            self._db or router.db_for_write(self.model, **self._hints), self.bulk_create, objs,
+            batch_size=batch_size, ignore_conflicts=ignore_conflicts,
+            update_conflicts=update_conflicts, update_fields=update_fields,
+            unique_fields=unique_fields,
+        )
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        """
+        Update the given fields in each of the given objects in the database.
+        Each batch is written with a single UPDATE statement that uses a
+        CASE expression over the primary key to select each row's value. Do
+        *not* call save() on each of the instances and do not send any
+        pre/post_save signals.
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError('Batch size must be a positive integer.')
+        if not fields:
+            raise ValueError('Field names must be given to bulk_update().')
+        objs = tuple(objs)
+        if any(obj.pk is None for obj in objs):
+            raise ValueError('All bulk_update() objects must have a primary key set.')
+        fields = [self.model._meta.get_field(name) for name in fields]
+        if any(not f.concrete or f.many_to_many for f in fields):
+            raise ValueError('bulk_update() can only be used with concrete fields.')
+        if any(f.primary_key for f in fields):
+            raise ValueError('bulk_update() cannot be used with primary key fields.')
+        if not objs:
+            return
+        self._for_write = True
+        connection = connections[self.db]
+        # The primary key is used twice in the resulting query, once in the
+        # WHERE ... IN clause and once in each WHEN.
+        max_batch_size = max(connection.ops.bulk_batch_size(['pk', 'pk'] + fields, objs), 1)
+        batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+        requires_casting = connection.features.requires_casted_case_in_updates
+        batches = (objs[i:i + batch_size] for i in range(0, len(objs), batch_size))
+        updates = []
+        for batch_objs in batches:
+            update_kwargs = {}
+            for field in fields:
+                when_statements = []
+                for obj in batch_objs:
+                    attr = getattr(obj, field.attname)
+                    if not isinstance(attr, Expression):
+                        attr = Value(attr, output_field=field)
+                    when_statements.append(When(pk=obj.pk, then=attr))
+                case_statement = Case(*when_statements, output_field=field)
+                if requires_casting:
+                    case_statement = Cast(case_statement, output_field=field)
+                update_kwargs[field.attname] = case_statement
+            updates.append(([obj.pk for obj in batch_objs], update_kwargs))
+        with transaction.atomic(using=self.db, savepoint=False):
+            for pks, update_kwargs in updates:
+                self.filter(pk__in=pks).update(**update_kwargs)
+    bulk_update.alters_data = True
+
     def get_or_create(self, defaults=None, **kwargs):
         """
         Look up an object with the given kwargs, creating one if necessary.
@@ -715,9 +866,27 @@ class QuerySet:
             return self.query.has_results(using=self.db)
         return bool(self._result_cache)
 
+    def prepared(self):
+        """
+        Return a PreparedQuery for this QuerySet. Its SQL is generated once
+        per database and reused each time it's called with values for the
+        Param() placeholders used in the filters.
+        """
+        return PreparedQuery(self)
+
+    def compiled(self, *args, **kwargs):
+        """
+        Shortcut for filter(*args, **kwargs).prepared(), e.g.
+        Model.objects.compiled(pk=Param('pk')).
+        """
+        return self.filter(*args, **kwargs).prepared()
+
     def _prefetch_related_objects(self):
         # This method can only be called once the result cache has been filled.
-        prefetch_related_objects(self._result_cache, *self._prefetch_related_lookups)
+        prefetch_related_objects(
+            self._result_cache, *self._prefetch_related_lookups,
+            parallel=self._prefetch_related_parallel
+        )
         self._prefetch_done = True
 
     ##################################################
@@ -941,7 +1110,7 @@ class QuerySet:
             obj.query.select_related = True
         return obj
 
-    def prefetch_related(self, *lookups):
+    def prefetch_related(self, *lookups, parallel=None):
         """
         Return a new QuerySet instance that will prefetch the specified
         Many-To-One and Many-To-Many related objects when the QuerySet is
@@ -949,8 +1118,13 @@ class QuerySet:
 
         When prefetch_related() is called more than once, append to the list of
         prefetch lookups. If prefetch_related(None) is called, clear the list.
+
+        If parallel is True, run the queries of the first level of the lookups
+        concurrently; see prefetch_related_objects().
         """
         clone = self._chain()
+        if parallel is not None:
+            clone._prefetch_related_parallel = parallel
         if lookups == (None,):
             clone._prefetch_related_lookups = ()
         else:
@@ -1112,7 +1286,8 @@ class QuerySet:
     # PRIVATE METHODS #
     ###################
 
-    def _insert(self, objs, fields, return_id=False, raw=False, using=None):
+    def _insert(self, objs, fields, return_id=False, raw=False, using=None,
+                on_conflict=None, update_fields=None, unique_fields=None):
         """
         Insert a new record for the given model. This provides an interface to
         the InsertQuery class and is how Model.save() is implemented.
@@ -1120,13 +1295,17 @@ class QuerySet:
         self._for_write = True
         if using is None:
             using = self.db
-        query = sql.InsertQuery(self.model)
+        query = sql.InsertQuery(
+            self.model, on_conflict=on_conflict, update_fields=update_fields,
+            unique_fields=unique_fields,
+        )
         query.insert_values(fields, objs, raw=raw)
         return query.get_compiler(using=using).execute_sql(return_id)
     _insert.alters_data = True
     _insert.queryset_only = False
 
-    def _batched_insert(self, objs, fields, batch_size):
+    def _batched_insert(self, objs, fields, batch_size, on_conflict=None,
+                        update_fields=None, unique_fields=None, raw=False):
         """
         A helper method for bulk_create() to insert the bulk one batch at a
         time. Insert recursively a batch from the front of the bulk and then
@@ -1137,15 +1316,19 @@ class QuerySet:
         ops = connections[self.db].ops
         batch_size = (batch_size or max(ops.bulk_batch_size(fields, objs), 1))
         inserted_ids = []
+        bulk_return = connections[self.db].features.can_return_ids_from_bulk_insert
         for item in [objs[i:i + batch_size] for i in range(0, len(objs), batch_size)]:
-            if connections[self.db].features.can_return_ids_from_bulk_insert:
-                inserted_id = self._insert(item, fields=fields, using=self.db, return_id=True)
+            if bulk_return and on_conflict is None:
+                inserted_id = self._insert(item, fields=fields, using=self.db, return_id=True, raw=raw)
                 if isinstance(inserted_id, list):
                     inserted_ids.extend(inserted_id)
                 else:
                     inserted_ids.append(inserted_id)
             else:
-                self._insert(item, fields=fields, using=self.db)
+                self._insert(
+                    item, fields=fields, using=self.db, raw=raw, on_conflict=on_conflict,
+                    update_fields=update_fields, unique_fields=unique_fields,
+                )
         return inserted_ids
 
     def _chain(self, **kwargs):
@@ -1169,6 +1352,7 @@ class QuerySet:
         c._sticky_filter = self._sticky_filter
         c._for_write = self._for_write
         c._prefetch_related_lookups = self._prefetch_related_lookups[:]
+        c._prefetch_related_parallel = self._prefetch_related_parallel
         c._known_related_objects = self._known_related_objects
         c._iterable_class = self._iterable_class
         c._fields = self._fields
@@ -1249,6 +1433,85 @@ class QuerySet:
             )
 
 
+class PreparedQuery:
+    """
+    A QuerySet template whose SQL is compiled at most once per database and
+    set of compiler options, and then reused by all the QuerySets it returns.
+
+    Build it once (e.g. at module level) with QuerySet.prepared() and call it
+    with a value for each Param() placeholder to get a QuerySet:
+
+        by_author = Book.objects.filter(author_id=Param('author')).prepared()
+        books = list(by_author(author=1))
+
+    Only evaluating the returned QuerySet directly (iterating, len(), etc.)
+    uses the compiled SQL; chaining it (e.g. get(), count(), or filter())
+    builds and compiles a new query as usual. Placeholders must be used with
+    lookups that pass their value to the database unchanged, such as exact,
+    gt, gte, lt, and lte, and can't be used in subqueries. They can't be
+    given None either, since an exact lookup against None needs different SQL
+    (IS NULL); use a separate query filtering with isnull instead.
+    """
+    # The compiler attributes filled by pre_sql_setup() that are needed to
+    # process the results.
+    compiler_state = ('select', 'klass_info', 'annotation_col_map', 'col_count', 'has_extra_select')
+
+    def __init__(self, queryset):
+        self.queryset = queryset._chain()
+        self._compiled = {}
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self.queryset.query)
+
+    def __call__(self, **params):
+        queryset = self.queryset._chain()
+        queryset.query.param_values = params
+        queryset.query.prepared_query = self
+        return queryset
+
+    def compile(self, connection, with_limits, with_col_aliases):
+        """
+        Compile the template query and return the SQL, its parameters with
+        the positions of the placeholders, and the compiler state.
+        """
+        query = self.queryset.query.chain()
+        compiler = query.get_compiler(connection=connection)
+        compiler.param_slots = []
+        sql, params = compiler.as_sql(with_limits=with_limits, with_col_aliases=with_col_aliases)
+        params = list(params)
+        slots = [(pos, param) for pos, param in enumerate(params) if isinstance(param, Param)]
+        if [param for pos, param in slots] != compiler.param_slots:
+            raise ValueError(
+                'Param() can only be used with lookups that pass their value '
+                'to the database unchanged, such as exact, gt, gte, lt, and lte.'
+            )
+        state = {attr: getattr(compiler, attr) for attr in self.compiler_state}
+        return sql, params, slots, state
+
+    def as_sql(self, compiler, with_limits=True, with_col_aliases=False):
+        """
+        Return the compiled SQL with the values bound to compiler.query and
+        set up the compiler as SQLCompiler.as_sql() would.
+        """
+        connection = compiler.connection
+        key = (connection.alias, with_limits, with_col_aliases)
+        try:
+            sql, params, slots, state = self._compiled[key]
+        except KeyError:
+            sql, params, slots, state = self._compiled[key] = self.compile(
+                connection, with_limits, with_col_aliases,
+            )
+        compiler.__dict__.update(state)
+        if slots:
+            values = compiler.query.param_values
+            params = params[:]
+            for pos, param in slots:
+                if param.name not in values:
+                    raise ValueError("No value was given for %r." % param)
+                params[pos] = param.get_db_prep_value(values[param.name], connection)
+        return sql, tuple(params)
+
+
 class InstanceCheckMeta(type):
     def __instancecheck__(self, instance):
         return isinstance(instance, QuerySet) and instance.query.is_empty()
@@ -1434,10 +1697,16 @@ def normalize_prefetch_lookups(lookups, prefix=None):
     return ret
 
 
-def prefetch_related_objects(model_instances, *related_lookups):
+def prefetch_related_objects(model_instances, *related_lookups, parallel=False):
     """
     Populate prefetched object caches for a list of model instances based on
     the lookups/Prefetch instances given.
+
+    If parallel is True, run the queries of the first level of the lookups,
+    e.g. those of 'tags' and 'comments' for the lookups 'tags' and
+    'comments__author', in threads, each on its own database connection.
+    Since these connections can't see the changes made by the current
+    transaction, the queries are run one after the other in atomic blocks.
     """
     if len(model_instances) == 0:
         return  # nothing to do
@@ -1451,6 +1720,8 @@ def prefetch_related_objects(model_instances, *related_lookups):
     followed_descriptors = set()  # recursion protection
 
     all_lookups = normalize_prefetch_lookups(reversed(related_lookups))
+    # Results of the first level of the lookups, keyed by prefetch_to.
+    fetched = prefetch_first_level_in_parallel(model_instances, all_lookups[::-1]) if parallel else {}
     while all_lookups:
         lookup = all_lookups.pop()
         if lookup.prefetch_to in done_queries:
@@ -1518,7 +1789,9 @@ def prefetch_related_objects(model_instances, *related_lookups):
                                  "prefetch_related()." % lookup.prefetch_through)
 
             if prefetcher is not None and not is_fetched:
-                obj_list, additional_lookups = prefetch_one_level(obj_list, prefetcher, lookup, level)
+                obj_list, additional_lookups = prefetch_one_level(
+                    obj_list, prefetcher, lookup, level, fetched.pop(prefetch_to, None),
+                )
                 # We need to ensure we don't keep adding lookups from the
                 # same relationships to stop infinite recursion. So, if we
                 # are already on an automatically added lookup, don't add
@@ -1607,15 +1880,37 @@ def get_prefetcher(instance, through_attr, to_attr):
     return prefetcher, rel_obj_descriptor, attr_found, is_fetched
 
 
-def prefetch_one_level(instances, prefetcher, lookup, level):
+def get_prefetch_batch_size(instances, queryset=None):
     """
-    Helper function for prefetch_related_objects().
+    Return the number of instances whose related objects can be fetched with
+    one query, or None if there isn't a limit. The parameters of queryset,
+    the queryset of a Prefetch, count toward the limit.
+    """
+    instance = instances[0]
+    connection = connections[router.db_for_read(instance.__class__, instance=instance)]
+    max_query_params = connection.features.max_query_params
+    if max_query_params and queryset is not None:
+        try:
+            params = queryset.query.get_compiler(connection=connection).as_sql()[1]
+        except EmptyResultSet:
+            params = ()
+        max_query_params = max(max_query_params - len(params), 1)
+    limits = [max_query_params, connection.ops.max_in_list_size()]
+    limits = [limit for limit in limits if limit]
+    return min(limits) if limits else None
 
-    Run prefetches on all instances using the prefetcher object,
-    assigning results to relevant caches in instance.
 
-    Return the prefetched objects along with any additional prefetches that
-    must be done due to prefetch_related lookups found from default managers.
+def fetch_one_level(instances, prefetcher, lookup, level):
+    """
+    Helper function for prefetch_one_level().
+
+    Run the queries fetching the related objects of all instances, in
+    batches if the database limits the number of query parameters or the
+    size of IN lists.
+
+    Return the related objects, the additional prefetches that must be done
+    due to prefetch_related lookups found from default managers and the rest
+    of the tuple returned by get_prefetch_queryset().
     """
     # prefetcher must have a method get_prefetch_queryset() which takes a list
     # of instances, and returns a tuple:
@@ -1629,26 +1924,119 @@ def prefetch_one_level(instances, prefetcher, lookup, level):
 
     # The 'values to be matched' must be hashable as they will be used
     # in a dictionary.
+    queryset = lookup.get_current_queryset(level)
+    batch_size = get_prefetch_batch_size(instances, queryset) or len(instances)
+    all_related_objects = []
+    additional_lookups = None
+
+    def fetch_batch(batch):
+        nonlocal additional_lookups
+        prefetch = prefetcher.get_prefetch_queryset(batch, queryset)
+        rel_qs = prefetch[0]
+        # We have to handle the possibility that the QuerySet we just got back
+        # contains some prefetch_related lookups. We don't want to trigger the
+        # prefetch_related functionality by evaluating the query. Rather, we need
+        # to merge in the prefetch_related lookups.
+        # Copy the lookups in case it is a Prefetch object which could be reused
+        # later (happens in nested prefetch_related).
+        if additional_lookups is None:
+            additional_lookups = [
+                copy.copy(additional_lookup) for additional_lookup
+                in getattr(rel_qs, '_prefetch_related_lookups', ())
+            ]
+        if additional_lookups:
+            # Don't need to clone because the manager should have given us a fresh
+            # instance, so we access an internal instead of using public interface
+            # for performance reasons.
+            rel_qs._prefetch_related_lookups = ()
+        all_related_objects.extend(rel_qs)
+        return prefetch[1:]
+
+    rel_obj_attr, instance_attr, single, cache_name, is_descriptor = fetch_batch(instances[:batch_size])
+    # Instances of the later batches sharing the value to be matched with an
+    # instance already fetched for, e.g. the same foreign key, would fetch
+    # the same related objects again.
+    if len(instances) > batch_size:
+        seen = {instance_attr(obj) for obj in instances[:batch_size]}
+        batch = []
+        for obj in instances[batch_size:]:
+            instance_attr_val = instance_attr(obj)
+            if instance_attr_val in seen:
+                continue
+            seen.add(instance_attr_val)
+            batch.append(obj)
+            if len(batch) == batch_size:
+                fetch_batch(batch)
+                batch = []
+        if batch:
+            fetch_batch(batch)
+    return all_related_objects, additional_lookups, rel_obj_attr, instance_attr, single, cache_name, is_descriptor
+
+
+def prefetch_first_level_in_parallel(instances, lookups):
+    """
+    Helper function for prefetch_related_objects().
+
+    Run fetch_one_level() for the first level of the lookups in threads,
+    each on its own database connection. Return a dictionary mapping the
+    prefetch_to of the first level of the lookups to the results, which is
+    empty if the queries can't be run concurrently.
+    """
+    instance = instances[0]
+    connection = connections[router.db_for_read(instance.__class__, instance=instance)]
+    # Other connections can't see the changes made in a transaction, nor an
+    # in-memory SQLite database.
+    if connection.in_atomic_block or getattr(connection, 'is_in_memory_db', lambda: False)():
+        return {}
+    for obj in instances:
+        if not hasattr(obj, '_prefetched_objects_cache'):
+            try:
+                obj._prefetched_objects_cache = {}
+            except (AttributeError, TypeError):
+                # Not model instances; prefetch_related_objects() will stop.
+                return {}
+    jobs = OrderedDict()
+    for lookup in lookups:
+        prefetch_to = lookup.get_current_prefetch_to(0)
+        if prefetch_to in jobs:
+            continue
+        through_attr = lookup.prefetch_through.split(LOOKUP_SEP)[0]
+        to_attr = lookup.get_current_to_attr(0)[0]
+        prefetcher, descriptor, attr_found, is_fetched = get_prefetcher(instance, through_attr, to_attr)
+        if prefetcher is not None and not is_fetched:
+            jobs[prefetch_to] = (prefetcher, lookup)
+    if len(jobs) < 2:
+        return {}
+
+    def fetch(prefetcher, lookup):
+        try:
+            return fetch_one_level(instances, prefetcher, lookup, 0)
+        finally:
+            # Close the connections of this thread.
+            connections.close_all()
 
-    rel_qs, rel_obj_attr, instance_attr, single, cache_name, is_descriptor = (
-        prefetcher.get_prefetch_queryset(instances, lookup.get_current_queryset(level)))
-    # We have to handle the possibility that the QuerySet we just got back
-    # contains some prefetch_related lookups. We don't want to trigger the
-    # prefetch_related functionality by evaluating the query. Rather, we need
-    # to merge in the prefetch_related lookups.
-    # Copy the lookups in case it is a Prefetch object which could be reused
-    # later (happens in nested prefetch_related).
-    additional_lookups = [
-        copy.copy(additional_lookup) for additional_lookup
-        in getattr(rel_qs, '_prefetch_related_lookups', ())
-    ]
-    if additional_lookups:
-        # Don't need to clone because the manager should have given us a fresh
-        # instance, so we access an internal instead of using public interface
-        # for performance reasons.
-        rel_qs._prefetch_related_lookups = ()
-
-    all_related_objects = list(rel_qs)
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [
+            (prefetch_to, executor.submit(fetch, prefetcher, lookup))
+            for prefetch_to, (prefetcher, lookup) in jobs.items()
+        ]
+        return {prefetch_to: future.result() for prefetch_to, future in futures}
+
+
+def prefetch_one_level(instances, prefetcher, lookup, level, fetched=None):
+    """
+    Helper function for prefetch_related_objects().
+
+    Run prefetches on all instances using the prefetcher object,
+    assigning results to relevant caches in instance. fetched is the result
+    of fetch_one_level() if it was already called.
+
+    Return the prefetched objects along with any additional prefetches that
+    must be done due to prefetch_related lookups found from default managers.
+    """
+    if fetched is None:
+        fetched = fetch_one_level(instances, prefetcher, lookup, level)
+    all_related_objects, additional_lookups, rel_obj_attr, instance_attr, single, cache_name, is_descriptor = fetched
 
     rel_obj_cache = {}
     for rel_obj in all_related_objects:
@@ -440,6 +440,8 @@ class SQLCompiler:
         If 'with_limits' is False, any limit/offset information is not included
         in the query.
         """
+        if self.query.prepared_query is not None:
+            return self.query.prepared_query.as_sql(self, with_limits, with_col_aliases)
         refcounts_before = self.query.alias_refcount.copy()
         try:
             extra_select, order_by, group_by = self.pre_sql_setup()
@@ -1007,13 +1009,38 @@ class SQLCompiler:
                 row[pos] = value
             yield row
 
+    def apply_converters_columnwise(self, chunks, converters):
+        """
+        Like apply_converters() but take an iterable of chunks of rows, as
+        returned by execute_sql(MULTI), and convert each chunk one column at a
+        time. Yield tuples.
+        """
+        connection = self.connection
+        converters = list(converters.items())
+        for chunk in chunks:
+            if not chunk:
+                continue
+            columns = list(zip(*chunk))
+            for pos, (convs, expression) in converters:
+                values = columns[pos]
+                for converter in convs:
+                    values = [converter(value, expression, connection) for value in values]
+                columns[pos] = values
+            yield from zip(*columns)
+
     def results_iter(self, results=None, tuple_expected=False, chunked_fetch=False,
-                     chunk_size=GET_ITERATOR_CHUNK_SIZE):
-        """Return an iterator over the results from executing this query."""
+                     chunk_size=GET_ITERATOR_CHUNK_SIZE, columnwise=False):
+        """
+        Return an iterator over the results from executing this query. If
+        columnwise is True, apply the converters with
+        apply_converters_columnwise() and yield tuples.
+        """
         if results is None:
             results = self.execute_sql(MULTI, chunked_fetch=chunked_fetch, chunk_size=chunk_size)
         fields = [s[0] for s in self.select[0:self.col_count]]
         converters = self.get_converters(fields)
+        if converters and columnwise:
+            return self.apply_converters_columnwise(results, converters)
         rows = chain.from_iterable(results)
         if converters:
             rows = self.apply_converters(rows, converters)
@@ -1220,7 +1247,8 @@ class SQLInsertCompiler(SQLCompiler):
         # going to be column names (so we can avoid the extra overhead).
         qn = self.connection.ops.quote_name
         opts = self.query.get_meta()
-        result = ['INSERT INTO %s' % qn(opts.db_table)]
+        insert_statement = self.connection.ops.insert_statement(on_conflict=self.query.on_conflict)
+        result = ['%s %s' % (insert_statement, qn(opts.db_table))]
 
         has_fields = bool(self.query.fields)
         fields = self.query.fields if has_fields else [opts.pk]
@@ -1244,6 +1272,12 @@ class SQLInsertCompiler(SQLCompiler):
 
         placeholder_rows, param_rows = self.assemble_as_sql(fields, value_rows)
 
+        on_conflict_suffix_sql = self.connection.ops.on_conflict_suffix_sql(
+            fields,
+            self.query.on_conflict,
+            (f.column for f in self.query.update_fields),
+            (f.column for f in self.query.unique_fields),
+        )
         if self.return_id and self.connection.features.can_return_id_from_insert:
             if self.connection.features.can_return_ids_from_bulk_insert:
                 result.append(self.connection.ops.bulk_insert_sql(fields, placeholder_rows))
@@ -1251,6 +1285,8 @@ class SQLInsertCompiler(SQLCompiler):
             else:
                 result.append("VALUES (%s)" % ", ".join(placeholder_rows[0]))
                 params = [param_rows[0]]
+            if on_conflict_suffix_sql:
+                result.append(on_conflict_suffix_sql)
             col = "%s.%s" % (qn(opts.db_table), qn(opts.pk.column))
             r_fmt, r_params = self.connection.ops.return_insert_id()
             # Skip empty r_fmt to allow subclasses to customize behavior for
@@ -1262,10 +1298,13 @@ class SQLInsertCompiler(SQLCompiler):
 
         if can_bulk:
             result.append(self.connection.ops.bulk_insert_sql(fields, placeholder_rows))
+            if on_conflict_suffix_sql:
+                result.append(on_conflict_suffix_sql)
             return [(" ".join(result), tuple(p for ps in param_rows for p in ps))]
         else:
+            suffix = [on_conflict_suffix_sql] if on_conflict_suffix_sql else []
             return [
-                (" ".join(result + ["VALUES (%s)" % ", ".join(p)]), vals)
+                (" ".join(result + ["VALUES (%s)" % ", ".join(p)] + suffix), vals)
                 for p, vals in zip(placeholder_rows, param_rows)
             ]
 
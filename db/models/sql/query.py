@@ -220,6 +220,11 @@ class Query:
 
         self._filtered_relations = {}
 
+        # Values of the Param() placeholders of a prepared query and the
+        # PreparedQuery that holds its compiled SQL, see QuerySet.prepared().
+        self.param_values = None
+        self.prepared_query = None
+
     @property
     def extra(self):
         if self._extra is None:
@@ -322,6 +327,8 @@ class Query:
             obj.subq_aliases = self.subq_aliases.copy()
         obj.used_aliases = self.used_aliases.copy()
         obj._filtered_relations = self._filtered_relations.copy()
+        # The compiled SQL can't be reused once the clone is altered.
+        obj.prepared_query = None
         # Clear the cached_property
         try:
             del obj.base_table
@@ -224,6 +224,11 @@ class ConnectionHandler:
                 continue
             connection.close()
 
+    def close_pools(self):
+        """Close the connection pools of all the aliases that use one."""
+        for connection in self.all():
+            connection.close_pool()
+
 
 class ConnectionRouter:
     def __init__(self, routers=None):
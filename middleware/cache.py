@@ -41,7 +41,21 @@ More details about how the caching works:
 * This middleware also sets ETag, Last-Modified, Expires and Cache-Control
   headers on the response object.
 
+* If CACHE_MIDDLEWARE_STALE_SECONDS is set, pages are kept in the cache for
+  that many seconds after their timeout. The first request for a stale page
+  regenerates it, while the requests that come meanwhile are served the stale
+  page. The regenerating request is elected with the cache's add() method.
+
+* If CACHE_MIDDLEWARE_EARLY_EXPIRATION is set, a request may regenerate a page
+  before it goes stale. The closer the page is to going stale and the longer
+  it took to generate, the likelier it is. This spreads the regeneration of
+  pages that went in the cache at the same time, e.g. after it was cleared.
+
 """
+import math
+import random
+import time
+from collections import namedtuple
 
 from django.conf import settings
 from django.core.cache import DEFAULT_CACHE_ALIAS, caches
@@ -51,6 +65,15 @@ from django.utils.cache import (
 )
 from django.utils.deprecation import MiddlewareMixin
 
+# A cached response with the time after which it's stale and the number of
+# seconds it took to generate. Responses are cached in this form only when
+# stale pages are served or regenerated early.
+CacheEntry = namedtuple('CacheEntry', ['response', 'stale_after', 'generation_time'])
+
+
+def get_regeneration_lock_key(cache_key):
+    return '%s.regenerating' % cache_key
+
 
 class UpdateCacheMiddleware(MiddlewareMixin):
     """
@@ -63,6 +86,8 @@ class UpdateCacheMiddleware(MiddlewareMixin):
     """
     def __init__(self, get_response=None):
         self.cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
+        self.cache_stale_timeout = settings.CACHE_MIDDLEWARE_STALE_SECONDS
+        self.cache_early_expiration = settings.CACHE_MIDDLEWARE_EARLY_EXPIRATION
         self.key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
         self.cache_alias = settings.CACHE_MIDDLEWARE_ALIAS
         self.cache = caches[self.cache_alias]
@@ -77,13 +102,20 @@ class UpdateCacheMiddleware(MiddlewareMixin):
             # We don't need to update the cache, just return.
             return response
 
+        if not self._update_cache(request, response):
+            # Let another request regenerate the page.
+            self._release_regeneration_lock(request)
+        return response
+
+    def _update_cache(self, request, response):
+        """Cache the response if it's cacheable and return whether it was."""
         if response.streaming or response.status_code not in (200, 304):
-            return response
+            return False
 
         # Don't cache responses that set a user-specific (and maybe security
         # sensitive) cookie in response to a cookie-less request.
         if not request.COOKIES and response.cookies and has_vary_header(response, 'Cookie'):
-            return response
+            return False
 
         # Try to get the timeout from the "max-age" section of the "Cache-
         # Control" header before reverting to using the default cache_timeout
@@ -93,17 +125,37 @@ class UpdateCacheMiddleware(MiddlewareMixin):
             timeout = self.cache_timeout
         elif timeout == 0:
             # max-age was set to 0, don't bother caching.
-            return response
+            return False
         patch_response_headers(response, timeout)
-        if timeout and response.status_code == 200:
-            cache_key = learn_cache_key(request, response, timeout, self.key_prefix, cache=self.cache)
-            if hasattr(response, 'render') and callable(response.render):
-                response.add_post_render_callback(
-                    lambda r: self.cache.set(cache_key, r, timeout)
-                )
-            else:
-                self.cache.set(cache_key, response, timeout)
-        return response
+        if not timeout or response.status_code != 200:
+            return False
+        cache_timeout = timeout
+        if self.cache_stale_timeout or self.cache_early_expiration:
+            cache_timeout += self.cache_stale_timeout
+        cache_key = learn_cache_key(request, response, cache_timeout, self.key_prefix, cache=self.cache)
+        if hasattr(response, 'render') and callable(response.render):
+            response.add_post_render_callback(
+                lambda r: self._set_cache(request, cache_key, r, timeout)
+            )
+        else:
+            self._set_cache(request, cache_key, response, timeout)
+        return True
+
+    def _set_cache(self, request, cache_key, response, timeout):
+        if self.cache_stale_timeout or self.cache_early_expiration:
+            now = time.time()
+            generation_time = now - getattr(request, '_cache_generation_start', now)
+            entry = CacheEntry(response, now + timeout, generation_time)
+            self.cache.set(cache_key, entry, timeout + self.cache_stale_timeout)
+            self._release_regeneration_lock(request)
+        else:
+            self.cache.set(cache_key, response, timeout)
+
+    def _release_regeneration_lock(self, request):
+        lock_key = getattr(request, '_cache_regeneration_lock_key', None)
+        if lock_key is not None:
+            self.cache.delete(lock_key)
+            del request._cache_regeneration_lock_key
 
 
 class FetchFromCacheMiddleware(MiddlewareMixin):
@@ -115,6 +167,8 @@ class FetchFromCacheMiddleware(MiddlewareMixin):
     so that it'll get called last during the request phase.
     """
     def __init__(self, get_response=None):
+        self.cache_stale_timeout = settings.CACHE_MIDDLEWARE_STALE_SECONDS
+        self.cache_early_expiration = settings.CACHE_MIDDLEWARE_EARLY_EXPIRATION
         self.key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
         self.cache_alias = settings.CACHE_MIDDLEWARE_ALIAS
         self.cache = caches[self.cache_alias]
@@ -142,12 +196,36 @@ class FetchFromCacheMiddleware(MiddlewareMixin):
 
         if response is None:
             request._cache_update_cache = True
+            request._cache_generation_start = time.time()
             return None  # No cache information available, need to rebuild.
 
+        if isinstance(response, CacheEntry):
+            entry = response
+            if self._should_regenerate(entry):
+                lock_key = get_regeneration_lock_key(cache_key)
+                lock_timeout = max(int(entry.stale_after - time.time()) + self.cache_stale_timeout, 1)
+                if self.cache.add(lock_key, True, lock_timeout):
+                    request._cache_update_cache = True
+                    request._cache_generation_start = time.time()
+                    request._cache_regeneration_lock_key = lock_key
+                    return None  # Regenerate the page, others get the stale one.
+            response = entry.response
+
         # hit, return cached response
         request._cache_update_cache = False
         return response
 
+    def _should_regenerate(self, entry):
+        now = time.time()
+        if now >= entry.stale_after:
+            return True
+        if self.cache_early_expiration and entry.generation_time:
+            # Probabilistic early expiration, see "Optimal Probabilistic Cache
+            # Stampede Prevention" by Vattani, Chierichetti and Lowenstein.
+            delta = entry.generation_time * self.cache_early_expiration * -math.log(1.0 - random.random())
+            return now + delta >= entry.stale_after
+        return False
+
 
 class CacheMiddleware(UpdateCacheMiddleware, FetchFromCacheMiddleware):
     """
@@ -156,7 +234,7 @@ class CacheMiddleware(UpdateCacheMiddleware, FetchFromCacheMiddleware):
     Also used as the hook point for the cache decorator, which is generated
     using the decorator-from-middleware utility.
     """
-    def __init__(self, get_response=None, cache_timeout=None, **kwargs):
+    def __init__(self, get_response=None, cache_timeout=None, stale_timeout=None, early_expiration=None, **kwargs):
         self.get_response = get_response
         # We need to differentiate between "provided, but using default value",
         # and "not provided". If the value is provided using a default, then
@@ -182,4 +260,12 @@ class CacheMiddleware(UpdateCacheMiddleware, FetchFromCacheMiddleware):
         if cache_timeout is None:
             cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
         self.cache_timeout = cache_timeout
+
+        if stale_timeout is None:
+            stale_timeout = settings.CACHE_MIDDLEWARE_STALE_SECONDS
+        self.cache_stale_timeout = stale_timeout
+
+        if early_expiration is None:
+            early_expiration = settings.CACHE_MIDDLEWARE_EARLY_EXPIRATION
+        self.cache_early_expiration = early_expiration
         self.cache = caches[self.cache_alias]
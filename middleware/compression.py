@@ -0,0 +1,245 @@
+"""
+Compression middleware negotiating the content coding of responses with the
+Accept-Encoding header of requests. gzip and deflate are always available, br
+and zstd if the brotli and zstandard modules are installed.
+
+The middleware is configured with these settings:
+
+* COMPRESSION_ENCODINGS: the content codings to use, preferred first, among
+  those the client accepts with the same quality value.
+
+* COMPRESSION_LEVELS: the compression level of each content coding, which
+  defaults to 4 for br, 3 for zstd and 6 for gzip and deflate.
+
+* COMPRESSION_MIN_LENGTH: the length in bytes under which responses aren't
+  compressed.
+
+* COMPRESSION_STREAMING_BUFFER_SIZE: the number of bytes of a streaming
+  response that may be buffered by the compressor before it's flushed.
+  Flushing after each chunk would give poor compression ratios.
+
+* COMPRESSION_CACHE_ALIAS: if set, the alias of the cache in which the
+  compressed contents of the responses of the cache middleware or of
+  cache_page() are kept, so that identical pages aren't compressed again.
+"""
+import hashlib
+import zlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class ZlibStreamCompressor:
+    def __init__(self, level, wbits):
+        self.compressobj = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data):
+        return self.compressobj.compress(data)
+
+    def flush(self):
+        return self.compressobj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self.compressobj.flush(zlib.Z_FINISH)
+
+
+class BrotliStreamCompressor:
+    def __init__(self, level):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self.compressor.process(data)
+
+    def flush(self):
+        return self.compressor.flush()
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+class ZstdStreamCompressor:
+    def __init__(self, level):
+        self.compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self.compressobj.compress(data)
+
+    def flush(self):
+        return self.compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self.compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def _zlib_compressor(wbits):
+    def compressor(level):
+        return ZlibStreamCompressor(level, wbits)
+    return compressor
+
+
+# Map content codings to their default level and a function returning a
+# stream compressor for a level.
+ENCODINGS = {
+    # The gzip format is selected by adding 16 to the window bits.
+    'gzip': (6, _zlib_compressor(16 + zlib.MAX_WBITS)),
+    # HTTP's deflate is the zlib format, RFC 7230 section 4.2.2.
+    'deflate': (6, _zlib_compressor(zlib.MAX_WBITS)),
+}
+if brotli is not None:
+    ENCODINGS['br'] = (4, BrotliStreamCompressor)
+if zstandard is not None:
+    ENCODINGS['zstd'] = (3, ZstdStreamCompressor)
+
+
+def parse_accept_encoding(header):
+    """
+    Return a dictionary mapping the content codings of an Accept-Encoding
+    header to their quality value.
+    """
+    qualities = {}
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def compress_sequence(sequence, compressor, buffer_size):
+    """
+    Compress an iterator of bytestrings, flushing the compressor only once
+    buffer_size bytes have been given to it since the last output.
+    """
+    buffered = 0
+    for item in sequence:
+        data = compressor.compress(item)
+        buffered += len(item)
+        if not data and buffered >= buffer_size:
+            data = compressor.flush()
+        if data:
+            buffered = 0
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress content with the best content coding the client accepts. Set
+    the Vary header accordingly, so that caches will base their storage on the
+    Accept-Encoding header.
+    """
+    def __init__(self, get_response=None):
+        self.encodings = [
+            encoding for encoding in settings.COMPRESSION_ENCODINGS
+            if encoding in ENCODINGS
+        ]
+        self.levels = {
+            encoding: settings.COMPRESSION_LEVELS.get(encoding, ENCODINGS[encoding][0])
+            for encoding in self.encodings
+        }
+        self.min_length = settings.COMPRESSION_MIN_LENGTH
+        self.buffer_size = settings.COMPRESSION_STREAMING_BUFFER_SIZE
+        self.cache_alias = settings.COMPRESSION_CACHE_ALIAS
+        self.cache = None if self.cache_alias is None else caches[self.cache_alias]
+        self.get_response = get_response
+
+    def select_encoding(self, request):
+        """
+        Return the content coding to use for the response to the request, or
+        None if it shouldn't be compressed.
+        """
+        qualities = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        default = qualities.get('*', 0.0)
+        best, best_quality = None, 0.0
+        for encoding in self.encodings:
+            quality = qualities.get(encoding, default)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def compress(self, encoding, content):
+        level = self.levels[encoding]
+        compressor = ENCODINGS[encoding][1](level)
+        return compressor.compress(content) + compressor.finish()
+
+    def compress_cached(self, encoding, content):
+        """
+        Like compress(), but keep the compressed content in the cache, keyed
+        by a digest of the content.
+        """
+        key = 'compression.%s.%s.%s' % (
+            encoding, self.levels[encoding], hashlib.sha1(content).hexdigest(),
+        )
+        compressed_content = self.cache.get(key)
+        if compressed_content is None:
+            compressed_content = self.compress(encoding, content)
+            self.cache.set(key, compressed_content)
+        return compressed_content
+
+    def process_response(self, request, response):
+        # It's not worth attempting to compress really short responses.
+        if not response.streaming and len(response.content) < self.min_length:
+            return response
+
+        # Avoid compressing if we've already got a content-encoding.
+        if response.has_header('Content-Encoding'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = self.select_encoding(request)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            # Delete the `Content-Length` header for streaming content, because
+            # we won't know the compressed size until we stream it.
+            compressor = ENCODINGS[encoding][1](self.levels[encoding])
+            response.streaming_content = compress_sequence(
+                response.streaming_content, compressor, self.buffer_size,
+            )
+            del response['Content-Length']
+        else:
+            # Only the responses of the cache middleware are likely to be
+            # served again with identical contents.
+            if (self.cache is not None and request.method in ('GET', 'HEAD') and
+                    hasattr(request, '_cache_update_cache')):
+                compressed_content = self.compress_cached(encoding, response.content)
+            else:
+                compressed_content = self.compress(encoding, response.content)
+            # Return the compressed content only if it's actually shorter.
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response['Content-Length'] = str(len(response.content))
+
+        # If there is a strong ETag, make it weak to fulfill the requirements
+        # of RFC 7232 section-2.1 while also allowing conditional request
+        # matches on ETags.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+
+        return response
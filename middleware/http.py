@@ -1,5 +1,12 @@
+import uuid
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.http import HttpResponse
 from django.utils.cache import (
-    cc_delim_re, get_conditional_response, set_response_etag,
+    cc_delim_re, get_cache_validators, get_conditional_response,
+    has_vary_header, learn_cache_validators, set_response_etag,
 )
 from django.utils.deprecation import MiddlewareMixin
 from django.utils.http import parse_http_date_safe
@@ -40,3 +47,134 @@ class ConditionalGetMiddleware(MiddlewareMixin):
         """Return True if an ETag header should be added to response."""
         cache_control_headers = cc_delim_re.split(response.get('Cache-Control', ''))
         return all(header.lower() != 'no-store' for header in cache_control_headers)
+
+
+def _generation_key(model):
+    return 'django.middleware.http.validators_generation.%s' % model._meta.label_lower
+
+
+def bump_validators_generation(sender, cache_alias=DEFAULT_CACHE_ALIAS, **kwargs):
+    """
+    Invalidate the validators cached by CachedConditionalGetMiddleware for
+    the pages depending on the sender model. Connected to the post_save and
+    post_delete signals of these models.
+    """
+    # A new random value rather than an incremented one, so that the
+    # generation can't go back to a previous value if it's evicted.
+    caches[cache_alias].set(_generation_key(sender), uuid.uuid4().hex, None)
+
+
+class CachedConditionalGetMiddleware(ConditionalGetMiddleware):
+    """
+    Like ConditionalGetMiddleware, but keep the validators of the responses
+    to GET requests in the cache, keyed like the pages of the cache
+    middleware, and answer conditional requests matching them with a 304
+    response without running the view.
+
+    The validators of pages depending on models are invalidated when an
+    instance of the models is saved or deleted.
+    """
+    def __init__(self, get_response=None, cache_timeout=None, models=(), **kwargs):
+        self.get_response = get_response
+        # Like CacheMiddleware, None key_prefix and cache_alias arguments
+        # fall back to defaults, and missing ones to the settings.
+        try:
+            key_prefix = kwargs['key_prefix']
+            if key_prefix is None:
+                key_prefix = ''
+        except KeyError:
+            key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
+        self.key_prefix = key_prefix
+
+        try:
+            cache_alias = kwargs['cache_alias']
+            if cache_alias is None:
+                cache_alias = DEFAULT_CACHE_ALIAS
+        except KeyError:
+            cache_alias = settings.CACHE_MIDDLEWARE_ALIAS
+        self.cache_alias = cache_alias
+
+        if cache_timeout is None:
+            cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
+        self.cache_timeout = cache_timeout
+        self.cache = caches[self.cache_alias]
+
+        self.models = tuple(models)
+        if self.models:
+            from django.db.models.signals import post_delete, post_save
+            receiver = partial(bump_validators_generation, cache_alias=self.cache_alias)
+            for model in self.models:
+                for signal in (post_save, post_delete):
+                    signal.connect(
+                        receiver, sender=model, weak=False,
+                        dispatch_uid=('cache_validators', self.cache_alias),
+                    )
+
+    def get_generations(self):
+        """Return the current generation of the models the pages depend on."""
+        if not self.models:
+            return None
+        keys = [_generation_key(model) for model in self.models]
+        generations = self.cache.get_many(keys)
+        missing = {key: uuid.uuid4().hex for key in keys if key not in generations}
+        if missing:
+            for key, generation in missing.items():
+                self.cache.add(key, generation, None)
+            generations = self.cache.get_many(keys)
+        return [generations.get(key) for key in keys]
+
+    def process_request(self, request):
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        # Read the generations before the view runs, so that the validators
+        # of its response are invalidated by saves made meanwhile.
+        request._cache_validators_generations = self.get_generations()
+        if 'HTTP_IF_NONE_MATCH' not in request.META and 'HTTP_IF_MODIFIED_SINCE' not in request.META:
+            return None
+        validators = get_cache_validators(request, self.key_prefix, cache=self.cache)
+        if validators is None:
+            return None
+        headers, generations = validators
+        if generations != request._cache_validators_generations:
+            return None
+        response = HttpResponse()
+        for header, value in headers:
+            response[header] = value
+        last_modified = response.get('Last-Modified')
+        if last_modified:
+            last_modified = parse_http_date_safe(last_modified)
+        conditional_response = get_conditional_response(
+            request,
+            etag=response.get('ETag'),
+            last_modified=last_modified,
+            response=response,
+        )
+        if conditional_response is response:
+            # The validators don't match, build the response.
+            return None
+        request._cache_validators_hit = True
+        return conditional_response
+
+    def process_response(self, request, response):
+        response = super().process_response(request, response)
+        if (request.method == 'GET' and response.status_code in (200, 304) and
+                hasattr(request, '_cache_validators_generations') and
+                not getattr(request, '_cache_validators_hit', False) and
+                self._should_learn_validators(request, response)):
+            learn_cache_validators(
+                request, response, self.cache_timeout, self.key_prefix,
+                cache=self.cache, extra=request._cache_validators_generations,
+            )
+        return response
+
+    def _should_learn_validators(self, request, response):
+        if not (response.has_header('ETag') or response.has_header('Last-Modified')):
+            return False
+        # Don't keep the validators of responses that mustn't be stored or
+        # that set a user-specific cookie in response to a cookie-less
+        # request, as UpdateCacheMiddleware does.
+        if not self.needs_etag(response):
+            return False
+        if not request.COOKIES and response.cookies and has_vary_header(response, 'Cookie'):
+            return False
+        return True
@@ -62,6 +62,13 @@ class Template:
         except TemplateDoesNotExist as exc:
             reraise(exc, self.backend)
 
+    def render_iter(self, context=None, request=None):
+        context = make_context(context, request, autoescape=self.backend.engine.autoescape)
+        try:
+            yield from self.template.render_iter(context)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self.backend)
+
 
 def copy_exception(exc, backend=None):
     """
@@ -59,6 +59,12 @@ class Template:
         )
 
     def render(self, context=None, request=None):
+        return self.template.render(self.make_context(context, request))
+
+    def render_iter(self, context=None, request=None):
+        return self.template.generate(self.make_context(context, request))
+
+    def make_context(self, context, request):
         from .utils import csrf_input_lazy, csrf_token_lazy
         if context is None:
             context = {}
@@ -68,7 +74,7 @@ class Template:
             context['csrf_token'] = csrf_token_lazy(request)
             for context_processor in self.backend.template_context_processors:
                 context.update(context_processor(request))
-        return self.template.render(context)
+        return context
 
 
 class Origin:
@@ -158,6 +158,9 @@ class Template:
         self.engine = engine
         self.source = template_string
         self.nodelist = self.compile_nodelist()
+        if engine.compile_templates:
+            from .compiler import compile_nodelist
+            compile_nodelist(self.nodelist)
 
     def __iter__(self):
         for node in self.nodelist:
@@ -176,6 +179,23 @@ class Template:
             else:
                 return self._render(context)
 
+    def _render_iter(self, context):
+        return self.nodelist.render_iter(context)
+
+    def render_iter(self, context):
+        """
+        Like render() but return a generator yielding the output in chunks as
+        the nodes are rendered. The context mustn't be used elsewhere until
+        the generator is exhausted or closed.
+        """
+        with context.render_context.push_state(self):
+            if context.template is None:
+                with context.bind_template(self):
+                    context.template_name = self.name
+                    yield from self._render_iter(context)
+            else:
+                yield from self._render_iter(context)
+
     def compile_nodelist(self):
         """
         Parse and compile the template source into a nodelist. If debug
@@ -913,6 +933,25 @@ class Node:
                 e.template_debug = context.render_context.template.get_exception_info(e, self.token)
             raise
 
+    def render_iter(self, context):
+        """
+        Return an iterable of the chunks of the node's output. Nodes that
+        render nodelists of their own override this to stream their output.
+        """
+        yield self.render(context)
+
+    def render_annotated_iter(self, context):
+        """
+        Like render_annotated() but return an iterable of the chunks of the
+        node's output as render_iter() does.
+        """
+        try:
+            yield from self.render_iter(context)
+        except Exception as e:
+            if context.template.engine.debug and not hasattr(e, 'template_debug'):
+                e.template_debug = context.render_context.template.get_exception_info(e, self.token)
+            raise
+
     def __iter__(self):
         yield self
 
@@ -936,6 +975,12 @@ class NodeList(list):
     # extend_nodelist().
     contains_nontext = False
 
+    def __getstate__(self):
+        # The functions generated by the template compiler can't be pickled.
+        state = self.__dict__.copy()
+        state.pop('render', None)
+        return state
+
     def render(self, context):
         bits = []
         for node in self:
@@ -946,6 +991,18 @@ class NodeList(list):
             bits.append(str(bit))
         return mark_safe(''.join(bits))
 
+    def render_iter(self, context):
+        for node in self:
+            if isinstance(node, Node):
+                for bit in node.render_annotated_iter(context):
+                    bit = str(bit)
+                    if bit:
+                        yield bit
+            else:
+                bit = str(node)
+                if bit:
+                    yield bit
+
     def get_nodes_by_type(self, nodetype):
         "Return a list of all nodes of the given type"
         nodes = []
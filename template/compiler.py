@@ -0,0 +1,398 @@
+"""
+Compile template nodelists to Python functions.
+
+When an Engine is created with compile_templates=True, the render() method of
+each parsed NodeList is replaced with a function generated from its nodes:
+
+* adjacent text nodes are joined into a single constant,
+* variables are resolved with lookup chains specialized for their bits and
+  filters applied without going through FilterExpression.resolve(),
+* {% for %} and {% if %} tags are inlined,
+* any other node is rendered by calling its render_annotated() method; its
+  own nodelists are compiled in turn.
+
+The generated code mirrors the implementations in django.template.base and
+django.template.defaulttags so that the output is the same as rendering the
+nodes one by one. Keep them in sync.
+"""
+import sys
+from inspect import getcallargs
+
+from django.utils.functional import Promise
+from django.utils.safestring import SafeData, SafeText, mark_safe
+from django.utils.timezone import template_localtime
+
+from .base import (
+    Node, NodeList, TextNode, Variable, VariableDoesNotExist, VariableNode,
+    logger, render_value_in_context,
+)
+from .context import BaseContext
+from .defaulttags import ForNode, IfNode, TemplateLiteral
+
+
+def _escape(text):
+    """Same as django.utils.html.escape() for str, without the lazy check."""
+    return (
+        text.replace('&', '&amp;').replace('<', '&lt;')
+        .replace('>', '&gt;').replace('"', '&quot;').replace("'", '&#39;')
+    )
+
+
+def _lookup(current, bit):
+    """Perform one step of Variable._resolve_lookup()."""
+    if type(current) is dict:
+        try:
+            return current[bit]
+        except KeyError:
+            pass
+    elif not hasattr(type(current), '__getitem__') and not isinstance(current, type):
+        # current[bit] would raise a TypeError, skip to the attribute lookup.
+        try:
+            return getattr(current, bit)
+        except (TypeError, AttributeError):
+            if bit in dir(current):
+                raise
+            raise VariableDoesNotExist("Failed lookup for key [%s] in %r", (bit, current))
+    try:  # dictionary lookup
+        return current[bit]
+    except (TypeError, AttributeError, KeyError, ValueError, IndexError):
+        try:  # attribute lookup
+            # Don't return class attributes if the class is the context:
+            if isinstance(current, BaseContext) and getattr(type(current), bit):
+                raise AttributeError
+            return getattr(current, bit)
+        except (TypeError, AttributeError):
+            # Reraise if the exception was raised by a @property
+            if not isinstance(current, BaseContext) and bit in dir(current):
+                raise
+            try:  # list-index lookup
+                return current[int(bit)]
+            except (IndexError, ValueError, KeyError, TypeError):
+                raise VariableDoesNotExist("Failed lookup for key [%s] in %r", (bit, current))
+
+
+def _call(current, context):
+    """Call a callable found by a variable lookup, as in _resolve_lookup()."""
+    if getattr(current, 'do_not_call_in_templates', False):
+        return current
+    if getattr(current, 'alters_data', False):
+        return context.template.engine.string_if_invalid
+    try:  # method call (assuming no args required)
+        return current()
+    except TypeError:
+        try:
+            getcallargs(current)
+        except TypeError:  # arguments *were* required
+            return context.template.engine.string_if_invalid  # invalid method call
+        else:
+            raise
+
+
+def _lookup_failed(context, bit):
+    """Handle the exception being raised while resolving a variable."""
+    template_name = getattr(context, 'template_name', None) or 'unknown'
+    logger.debug(
+        "Exception while resolving variable '%s' in template '%s'.",
+        bit,
+        template_name,
+        exc_info=True,
+    )
+    if getattr(sys.exc_info()[1], 'silent_variable_failure', False):
+        return context.template.engine.string_if_invalid
+    raise
+
+
+def _annotate(exc, context, node):
+    """Annotate an exception raised by a node as Node.render_annotated() does."""
+    if context.template.engine.debug and not hasattr(exc, 'template_debug'):
+        exc.template_debug = context.render_context.template.get_exception_info(exc, node.token)
+
+
+class NodeListCompiler:
+    """Generate the source of a render(context) function for a NodeList."""
+
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+        self.lines = []
+        self.nodes = []
+        self.namespace = {
+            '_annotate': _annotate,
+            '_call': _call,
+            '_escape': _escape,
+            '_lookup': _lookup,
+            '_lookup_failed': _lookup_failed,
+            '_mark_safe': mark_safe,
+            '_nodes': self.nodes,
+            '_render_value': render_value_in_context,
+            '_SafeData': SafeData,
+            '_SafeText': SafeText,
+            '_template_localtime': template_localtime,
+            '_VariableDoesNotExist': VariableDoesNotExist,
+        }
+        self.counter = 0
+
+    def compile(self):
+        self.emit(0, 'def render(context):')
+        self.emit(1, 'bits = []')
+        self.emit(1, 'append = bits.append')
+        self.emit(1, 'n = None')
+        self.emit(1, 'try:')
+        self.emit(2, 'pass')
+        self.nodelist_code(self.nodelist, 'append', True, None, 2)
+        self.emit(1, 'except Exception as e:')
+        self.emit(2, 'if n is not None:')
+        self.emit(3, '_annotate(e, context, _nodes[n])')
+        self.emit(2, 'raise')
+        self.emit(1, "return _mark_safe(''.join(bits))")
+        source = '\n'.join(self.lines)
+        code = compile(source, '<compiled template nodelist>', 'exec')
+        exec(code, self.namespace)
+        render = self.namespace['render']
+        render.source = source
+        return render
+
+    def emit(self, depth, line):
+        self.lines.append('    ' * depth + line)
+
+    def constant(self, value):
+        name = '_c%d' % len(self.namespace)
+        self.namespace[name] = value
+        return name
+
+    def node_index(self, node):
+        self.nodes.append(node)
+        return len(self.nodes) - 1
+
+    def unique(self, name):
+        self.counter += 1
+        return '%s_%d' % (name, self.counter)
+
+    def nodelist_code(self, nodelist, append, to_str, parent, depth):
+        """
+        Emit the code rendering the nodes of a nodelist with the `append`
+        callable. If `to_str` is True, each node's output is converted to a
+        string as NodeList.render() does, otherwise it's appended as is as
+        ForNode.render() does. `parent` is the index of the inlined node whose
+        code encloses the nodelist, if any.
+        """
+        text = []
+        for node in nodelist:
+            if type(node) is TextNode:
+                text.append(node.s)
+                continue
+            if text:
+                self.emit(depth, '%s(%r)' % (append, ''.join(text)))
+                text = []
+            if type(node) is VariableNode:
+                self.variable_node_code(node, append, depth)
+            elif type(node) is ForNode:
+                self.for_node_code(node, append, depth)
+            elif type(node) is IfNode:
+                self.if_node_code(node, append, depth)
+            else:
+                self.emit(depth, 'n = %r' % parent)
+                if isinstance(node, Node):
+                    for attr in node.child_nodelists:
+                        child_nodelist = getattr(node, attr, None)
+                        if isinstance(child_nodelist, NodeList):
+                            compile_nodelist(child_nodelist)
+                    if to_str:
+                        self.emit(depth, '%s(str(%s.render_annotated(context)))' % (append, self.constant(node)))
+                    else:
+                        self.emit(depth, '%s(%s.render_annotated(context))' % (append, self.constant(node)))
+                elif to_str:
+                    self.emit(depth, '%s(str(%s))' % (append, self.constant(node)))
+                else:
+                    self.emit(depth, '%s(%s.render_annotated(context))' % (append, self.constant(node)))
+        if text:
+            self.emit(depth, '%s(%r)' % (append, ''.join(text)))
+
+    def variable_node_code(self, node, append, depth):
+        """Inline VariableNode.render() and render_value_in_context()."""
+        self.emit(depth, 'n = %d' % self.node_index(node))
+        self.emit(depth, 'try:')
+        self.filter_expression_code(node.filter_expression, 'v', False, depth + 1)
+        self.emit(depth, 'except UnicodeDecodeError:')
+        self.emit(depth + 1, 'pass')
+        self.emit(depth, 'else:')
+        # template_localtime() and localize() return strings unchanged.
+        self.emit(depth + 1, 'if type(v) is str:')
+        self.emit(depth + 2, 'if context.autoescape:')
+        self.emit(depth + 3, 'v = _escape(v)')
+        self.emit(depth + 1, 'elif type(v) is not _SafeText:')
+        self.emit(depth + 2, 'v = _render_value(v, context)')
+        self.emit(depth + 1, '%s(v)' % append)
+
+    def filter_expression_code(self, filter_expression, target, ignore_failures, depth):
+        """Inline FilterExpression.resolve(), assigning the result to target."""
+        var = filter_expression.var
+        if isinstance(var, Variable):
+            if var.translate or type(var) is not Variable:
+                self.emit(depth, '%s = %s.resolve(context, %r)' % (
+                    target, self.constant(filter_expression), ignore_failures,
+                ))
+                return
+            if var.lookups is None:
+                self.emit(depth, '%s = %s' % (target, self.constant(var.literal)))
+                self.filters_code(filter_expression.filters, target, depth)
+                return
+            self.emit(depth, 'try:')
+            self.lookups_code(var.lookups, target, depth + 1)
+            self.emit(depth, 'except _VariableDoesNotExist:')
+            if ignore_failures:
+                self.emit(depth + 1, '%s = None' % target)
+                self.filters_code(filter_expression.filters, target, depth)
+            elif filter_expression.filters:
+                valid = self.unique('valid')
+                self.emit(depth + 1, '%s = context.template.engine.string_if_invalid' % target)
+                self.emit(depth + 1, 'if %s:' % target)
+                self.emit(depth + 2, "if '%%s' in %s:" % target)
+                self.emit(depth + 3, '%s = %s %% %s' % (target, target, self.constant(var)))
+                self.emit(depth + 1, '%s = not %s' % (valid, target))
+                self.emit(depth, 'else:')
+                self.emit(depth + 1, '%s = True' % valid)
+                self.emit(depth, 'if %s:' % valid)
+                self.filters_code(filter_expression.filters, target, depth + 1)
+            else:
+                self.emit(depth + 1, '%s = context.template.engine.string_if_invalid' % target)
+                self.emit(depth + 1, "if %s and '%%s' in %s:" % (target, target))
+                self.emit(depth + 2, '%s = %s %% %s' % (target, target, self.constant(var)))
+        else:
+            self.emit(depth, '%s = %s' % (target, self.constant(var)))
+            self.filters_code(filter_expression.filters, target, depth)
+
+    def lookups_code(self, lookups, target, depth):
+        """Inline Variable._resolve_lookup() for the given lookups."""
+        self.emit(depth, 'b = %r' % lookups[0])
+        self.emit(depth, 'try:')
+        self.emit(depth + 1, 'try:')
+        self.emit(depth + 2, '%s = context[%r]' % (target, lookups[0]))
+        self.emit(depth + 1, 'except KeyError:')
+        self.emit(depth + 2, '%s = _lookup(context, %r)' % (target, lookups[0]))
+        self.emit(depth + 1, 'if callable(%s):' % target)
+        self.emit(depth + 2, '%s = _call(%s, context)' % (target, target))
+        for bit in lookups[1:]:
+            self.emit(depth + 1, 'b = %r' % bit)
+            self.emit(depth + 1, '%s = _lookup(%s, %r)' % (target, target, bit))
+            self.emit(depth + 1, 'if callable(%s):' % target)
+            self.emit(depth + 2, '%s = _call(%s, context)' % (target, target))
+        self.emit(depth, 'except Exception:')
+        self.emit(depth + 1, '%s = _lookup_failed(context, b)' % target)
+
+    def filters_code(self, filters, target, depth):
+        for func, args in filters:
+            arg_vals = []
+            for lookup, arg in args:
+                if not lookup:
+                    if isinstance(arg, Promise):
+                        arg_vals.append('_mark_safe(%s)' % self.constant(arg))
+                    else:
+                        arg_vals.append(self.constant(mark_safe(arg)))
+                else:
+                    arg_vals.append('%s.resolve(context)' % self.constant(arg))
+            if getattr(func, 'expects_localtime', False):
+                self.emit(depth, '%s = _template_localtime(%s, context.use_tz)' % (target, target))
+            call_args = [target] + arg_vals
+            if getattr(func, 'needs_autoescape', False):
+                call_args.append('autoescape=context.autoescape')
+            call = '%s(%s)' % (self.constant(func), ', '.join(call_args))
+            if getattr(func, 'is_safe', False):
+                new_value = self.unique('new')
+                self.emit(depth, '%s = %s' % (new_value, call))
+                self.emit(depth, '%s = _mark_safe(%s) if isinstance(%s, _SafeData) else %s' % (
+                    target, new_value, target, new_value,
+                ))
+            else:
+                self.emit(depth, '%s = %s' % (target, call))
+
+    def for_node_code(self, node, append, depth):
+        """Inline ForNode.render()."""
+        index = self.node_index(node)
+        parentloop, values, len_values = (self.unique(name) for name in ('parentloop', 'values', 'len'))
+        loop_bits, loop_dict, i, item = (self.unique(name) for name in ('bits', 'forloop', 'i', 'item'))
+        num_loopvars = len(node.loopvars)
+        self.emit(depth, 'n = %d' % index)
+        self.emit(depth, "if 'forloop' in context:")
+        self.emit(depth + 1, "%s = context['forloop']" % parentloop)
+        self.emit(depth, 'else:')
+        self.emit(depth + 1, '%s = {}' % parentloop)
+        self.emit(depth, 'with context.push():')
+        depth += 1
+        self.emit(depth, 'try:')
+        self.emit(depth + 1, '%s = %s.resolve(context, True)' % (values, self.constant(node.sequence)))
+        self.emit(depth, 'except _VariableDoesNotExist:')
+        self.emit(depth + 1, '%s = []' % values)
+        self.emit(depth, 'if %s is None:' % values)
+        self.emit(depth + 1, '%s = []' % values)
+        self.emit(depth, "if not hasattr(%s, '__len__'):" % values)
+        self.emit(depth + 1, '%s = list(%s)' % (values, values))
+        self.emit(depth, '%s = len(%s)' % (len_values, values))
+        self.emit(depth, 'if %s < 1:' % len_values)
+        self.emit(depth + 1, 'pass')
+        self.nodelist_code(node.nodelist_empty, append, True, index, depth + 1)
+        self.emit(depth + 1, 'n = %d' % index)
+        self.emit(depth, 'else:')
+        depth += 1
+        self.emit(depth, '%s = []' % loop_bits)
+        if node.is_reversed:
+            self.emit(depth, '%s = reversed(%s)' % (values, values))
+        self.emit(depth, "%s = context['forloop'] = {'parentloop': %s}" % (loop_dict, parentloop))
+        self.emit(depth, 'for %s, %s in enumerate(%s):' % (i, item, values))
+        depth += 1
+        self.emit(depth, "%s['counter0'] = %s" % (loop_dict, i))
+        self.emit(depth, "%s['counter'] = %s + 1" % (loop_dict, i))
+        self.emit(depth, "%s['revcounter'] = %s - %s" % (loop_dict, len_values, i))
+        self.emit(depth, "%s['revcounter0'] = %s - %s - 1" % (loop_dict, len_values, i))
+        self.emit(depth, "%s['first'] = (%s == 0)" % (loop_dict, i))
+        self.emit(depth, "%s['last'] = (%s == %s - 1)" % (loop_dict, i, len_values))
+        if num_loopvars > 1:
+            self.emit(depth, 'try:')
+            self.emit(depth + 1, 'len_item = len(%s)' % item)
+            self.emit(depth, 'except TypeError:  # not an iterable')
+            self.emit(depth + 1, 'len_item = 1')
+            self.emit(depth, 'if %d != len_item:' % num_loopvars)
+            self.emit(depth + 1, 'raise ValueError(')
+            self.emit(depth + 2, '"Need {} values to unpack in for loop; got {}. "')
+            self.emit(depth + 2, '.format(%d, len_item),' % num_loopvars)
+            self.emit(depth + 1, ')')
+            self.emit(depth, 'context.update(dict(zip(%s, %s)))' % (self.constant(node.loopvars), item))
+        else:
+            self.emit(depth, 'context[%r] = %s' % (node.loopvars[0], item))
+        self.nodelist_code(node.nodelist_loop, '%s.append' % loop_bits, False, index, depth)
+        self.emit(depth, 'n = %d' % index)
+        if num_loopvars > 1:
+            self.emit(depth, 'context.pop()')
+        depth -= 1
+        self.emit(depth, "%s(''.join(%s))" % (append, loop_bits))
+
+    def if_node_code(self, node, append, depth):
+        """Inline IfNode.render()."""
+        index = self.node_index(node)
+        for condition, nodelist in node.conditions_nodelists:
+            self.emit(depth, 'n = %d' % index)
+            if condition is None:  # else clause
+                self.emit(depth, 'pass')
+                self.nodelist_code(nodelist, append, True, index, depth)
+                return
+            self.emit(depth, 'try:')
+            if type(condition) is TemplateLiteral:
+                self.filter_expression_code(condition.value, 'm', True, depth + 1)
+            else:
+                self.emit(depth + 1, 'm = %s.eval(context)' % self.constant(condition))
+            self.emit(depth, 'except _VariableDoesNotExist:')
+            self.emit(depth + 1, 'm = None')
+            self.emit(depth, 'if m:')
+            self.emit(depth + 1, 'pass')
+            self.nodelist_code(nodelist, append, True, index, depth + 1)
+            self.emit(depth, 'else:')
+            depth += 1
+        self.emit(depth, 'pass')
+
+
+def compile_nodelist(nodelist):
+    """
+    Replace the render() method of a nodelist with a generated function that
+    renders its nodes.
+    """
+    nodelist.render = NodeListCompiler(nodelist).compile()
+    return nodelist
@@ -1,6 +1,12 @@
+import functools
+import logging
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from copy import copy
 
+logger = logging.getLogger('django.template')
+
 # Hard-coded processor for easier use of CSRF protection.
 _builtin_context_processors = ('django.template.context_processors.csrf',)
 
@@ -216,6 +222,76 @@ class RenderContext(BaseContext):
                 self.pop()
 
 
+class LazyContextDict:
+    """
+    A mapping of variable names to callables, whose values are computed by
+    calling the callables when they are first looked up. Context processors
+    can return one so that the variables a template doesn't use aren't
+    computed.
+    """
+    # This isn't a collections.abc.Mapping, which would make the isinstance()
+    # checks done on each render slow.
+    def __init__(self, *args, **kwargs):
+        self._callables = dict(*args, **kwargs)
+        self._values = {}
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._callables[key]()
+        return self._values[key]
+
+    def __contains__(self, key):
+        return key in self._callables
+
+    def __iter__(self):
+        return iter(self._callables)
+
+    def __len__(self):
+        return len(self._callables)
+
+    def get(self, key, default=None):
+        return self[key] if key in self._callables else default
+
+    def keys(self):
+        return self._callables.keys()
+
+    def items(self):
+        return [(key, self[key]) for key in self._callables]
+
+    def values(self):
+        return [self[key] for key in self._callables]
+
+    def __repr__(self):
+        return '<%s: %r>' % (self.__class__.__name__, list(self._callables))
+
+
+def _merge_processors_output(outputs):
+    """
+    Merge the dictionaries returned by context processors, the later ones
+    taking precedence, without evaluating the lazy ones.
+    """
+    updates = {}
+    for output in outputs:
+        if isinstance(output, LazyContextDict):
+            break
+        updates.update(output)
+    else:
+        return updates
+    callables = {}
+    for output in outputs:
+        for key in output:
+            callables[key] = functools.partial(output.__getitem__, key)
+    return LazyContextDict(callables)
+
+
+def _processor_name(processor):
+    module = getattr(processor, '__module__', None)
+    name = getattr(processor, '__qualname__', None)
+    if module is None or name is None:
+        return repr(processor)
+    return '%s.%s' % (module, name)
+
+
 class RequestContext(Context):
     """
     This subclass of template.Context automatically populates itself using
@@ -227,6 +303,8 @@ class RequestContext(Context):
         super().__init__(dict_, use_l10n=use_l10n, use_tz=use_tz, autoescape=autoescape)
         self.request = request
         self._processors = () if processors is None else tuple(processors)
+        # Seconds each context processor took during the last render.
+        self.processor_timings = OrderedDict()
         self._processors_index = len(self.dicts)
 
         # placeholder for context processors output
@@ -245,10 +323,9 @@ class RequestContext(Context):
         # Set context processors according to the template engine's settings.
         processors = (template.engine.template_context_processors +
                       self._processors)
-        updates = {}
-        for processor in processors:
-            updates.update(processor(self.request))
-        self.dicts[self._processors_index] = updates
+        self.dicts[self._processors_index] = _merge_processors_output(
+            self.run_processors(processors, template.engine)
+        )
 
         try:
             yield
@@ -257,6 +334,46 @@ class RequestContext(Context):
             # Unset context processors.
             self.dicts[self._processors_index] = {}
 
+    def run_processors(self, processors, engine):
+        """
+        Return the output of the context processors and record how long each
+        of them took in `processor_timings`. If the engine caches context
+        processors, reuse their output from previous renders for the same
+        request.
+        """
+        request = self.request
+        if engine.cache_context_processors:
+            try:
+                cache = request._context_processors_cache
+            except AttributeError:
+                cache = request._context_processors_cache = {}
+        else:
+            cache = None
+        timings = self.processor_timings = OrderedDict()
+        outputs = []
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        for processor in processors:
+            if cache is not None and processor in cache:
+                outputs.append(cache[processor])
+                start = perf_counter()
+                continue
+            output = processor(request)
+            end = perf_counter()
+            timings[processor] = end - start
+            start = end
+            if cache is not None:
+                cache[processor] = output
+            outputs.append(output)
+        if engine.debug:
+            for processor, duration in timings.items():
+                name = _processor_name(processor)
+                logger.debug(
+                    '(%.3f) context processor %s', duration, name,
+                    extra={'duration': duration, 'processor': name},
+                )
+        return outputs
+
     def new(self, values=None):
         new_context = super().new(values)
         # This is for backwards-compatibility: RequestContexts created via
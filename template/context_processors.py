@@ -1,7 +1,9 @@
 """
 A set of request processors that return dictionaries to be merged into a
 template context. Each function takes the request object as its only parameter
-and returns a dictionary to add to the context.
+and returns a dictionary to add to the context. Returning a
+django.template.context.LazyContextDict instead defers computing each variable
+until a template looks it up.
 
 These are referenced from the 'context_processors' option of the configuration
 of a DjangoTemplates backend and used by RequestContext.
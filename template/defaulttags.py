@@ -157,55 +157,18 @@ class ForNode(Node):
         else:
             parentloop = {}
         with context.push():
-            try:
-                values = self.sequence.resolve(context, True)
-            except VariableDoesNotExist:
-                values = []
-            if values is None:
-                values = []
-            if not hasattr(values, '__len__'):
-                values = list(values)
+            values = self.resolve_values(context)
             len_values = len(values)
             if len_values < 1:
                 return self.nodelist_empty.render(context)
             nodelist = []
             if self.is_reversed:
                 values = reversed(values)
-            num_loopvars = len(self.loopvars)
-            unpack = num_loopvars > 1
             # Create a forloop value in the context.  We'll update counters on each
             # iteration just below.
             loop_dict = context['forloop'] = {'parentloop': parentloop}
             for i, item in enumerate(values):
-                # Shortcuts for current loop iteration number.
-                loop_dict['counter0'] = i
-                loop_dict['counter'] = i + 1
-                # Reverse counter iteration numbers.
-                loop_dict['revcounter'] = len_values - i
-                loop_dict['revcounter0'] = len_values - i - 1
-                # Boolean values designating first and last times through loop.
-                loop_dict['first'] = (i == 0)
-                loop_dict['last'] = (i == len_values - 1)
-
-                pop_context = False
-                if unpack:
-                    # If there are multiple loop variables, unpack the item into
-                    # them.
-                    try:
-                        len_item = len(item)
-                    except TypeError:  # not an iterable
-                        len_item = 1
-                    # Check loop variable count before unpacking
-                    if num_loopvars != len_item:
-                        raise ValueError(
-                            "Need {} values to unpack in for loop; got {}. "
-                            .format(num_loopvars, len_item),
-                        )
-                    unpacked_vars = dict(zip(self.loopvars, item))
-                    pop_context = True
-                    context.update(unpacked_vars)
-                else:
-                    context[self.loopvars[0]] = item
+                pop_context = self.set_loop_variables(context, loop_dict, i, item, len_values)
 
                 for node in self.nodelist_loop:
                     nodelist.append(node.render_annotated(context))
@@ -217,6 +180,74 @@ class ForNode(Node):
                     context.pop()
         return mark_safe(''.join(nodelist))
 
+    def render_iter(self, context):
+        if 'forloop' in context:
+            parentloop = context['forloop']
+        else:
+            parentloop = {}
+        with context.push():
+            values = self.resolve_values(context)
+            len_values = len(values)
+            if len_values < 1:
+                yield from self.nodelist_empty.render_iter(context)
+                return
+            if self.is_reversed:
+                values = reversed(values)
+            loop_dict = context['forloop'] = {'parentloop': parentloop}
+            for i, item in enumerate(values):
+                pop_context = self.set_loop_variables(context, loop_dict, i, item, len_values)
+                yield from self.nodelist_loop.render_iter(context)
+                if pop_context:
+                    context.pop()
+
+    def resolve_values(self, context):
+        """Return the sequence to loop over, as a sized iterable."""
+        try:
+            values = self.sequence.resolve(context, True)
+        except VariableDoesNotExist:
+            values = []
+        if values is None:
+            values = []
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        return values
+
+    def set_loop_variables(self, context, loop_dict, i, item, len_values):
+        """
+        Update the forloop counters and set the loop variables for the item.
+        Return True if the variables were pushed on to the context and must
+        be popped after the iteration.
+        """
+        # Shortcuts for current loop iteration number.
+        loop_dict['counter0'] = i
+        loop_dict['counter'] = i + 1
+        # Reverse counter iteration numbers.
+        loop_dict['revcounter'] = len_values - i
+        loop_dict['revcounter0'] = len_values - i - 1
+        # Boolean values designating first and last times through loop.
+        loop_dict['first'] = (i == 0)
+        loop_dict['last'] = (i == len_values - 1)
+
+        num_loopvars = len(self.loopvars)
+        if num_loopvars > 1:
+            # If there are multiple loop variables, unpack the item into
+            # them.
+            try:
+                len_item = len(item)
+            except TypeError:  # not an iterable
+                len_item = 1
+            # Check loop variable count before unpacking
+            if num_loopvars != len_item:
+                raise ValueError(
+                    "Need {} values to unpack in for loop; got {}. "
+                    .format(num_loopvars, len_item),
+                )
+            unpacked_vars = dict(zip(self.loopvars, item))
+            context.update(unpacked_vars)
+            return True
+        context[self.loopvars[0]] = item
+        return False
+
 
 class IfChangedNode(Node):
     child_nodelists = ('nodelist_true', 'nodelist_false')
@@ -300,6 +331,18 @@ class IfNode(Node):
         return NodeList(node for _, nodelist in self.conditions_nodelists for node in nodelist)
 
     def render(self, context):
+        nodelist = self.get_matching_nodelist(context)
+        if nodelist is None:
+            return ''
+        return nodelist.render(context)
+
+    def render_iter(self, context):
+        nodelist = self.get_matching_nodelist(context)
+        if nodelist is not None:
+            yield from nodelist.render_iter(context)
+
+    def get_matching_nodelist(self, context):
+        """Return the nodelist of the first clause that matches, if any."""
         for condition, nodelist in self.conditions_nodelists:
 
             if condition is not None:           # if / elif clause
@@ -311,9 +354,8 @@ class IfNode(Node):
                 match = True
 
             if match:
-                return nodelist.render(context)
-
-        return ''
+                return nodelist
+        return None
 
 
 class LoremNode(Node):
@@ -516,6 +558,11 @@ class WithNode(Node):
         with context.push(**values):
             return self.nodelist.render(context)
 
+    def render_iter(self, context):
+        values = {key: val.resolve(context) for key, val in self.extra_context.items()}
+        with context.push(**values):
+            yield from self.nodelist.render_iter(context)
+
 
 @register.tag
 def autoescape(parser, token):
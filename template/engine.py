@@ -19,7 +19,8 @@ class Engine:
 
     def __init__(self, dirs=None, app_dirs=False, context_processors=None,
                  debug=False, loaders=None, string_if_invalid='',
-                 file_charset='utf-8', libraries=None, builtins=None, autoescape=True):
+                 file_charset='utf-8', libraries=None, builtins=None, autoescape=True,
+                 compile_templates=False, cache_context_processors=False):
         if dirs is None:
             dirs = []
         if context_processors is None:
@@ -51,6 +52,8 @@ class Engine:
         self.template_libraries = self.get_template_libraries(libraries)
         self.builtins = self.default_builtins + builtins
         self.template_builtins = self.get_template_builtins(self.builtins)
+        self.compile_templates = compile_templates
+        self.cache_context_processors = cache_context_processors
 
     @staticmethod
     @functools.lru_cache()
@@ -2,6 +2,7 @@ import logging
 import posixpath
 import warnings
 from collections import defaultdict
+from contextlib import contextmanager
 
 from django.utils.deprecation import RemovedInDjango21Warning
 from django.utils.safestring import mark_safe
@@ -51,11 +52,24 @@ class BlockNode(Node):
         return "<Block Node: %s. Contents: %r>" % (self.name, self.nodelist)
 
     def render(self, context):
+        with self.push_block(context) as block:
+            return block.nodelist.render(context)
+
+    def render_iter(self, context):
+        with self.push_block(context) as block:
+            yield from block.nodelist.render_iter(context)
+
+    @contextmanager
+    def push_block(self, context):
+        """
+        Push a context holding the block to render in place of this one, i.e.
+        the one defined by the most derived template, and yield it.
+        """
         block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
         with context.push():
             if block_context is None:
                 context['block'] = self
-                result = self.nodelist.render(context)
+                yield self
             else:
                 push = block = block_context.pop(self.name)
                 if block is None:
@@ -64,10 +78,9 @@ class BlockNode(Node):
                 block = type(self)(block.name, block.nodelist)
                 block.context = context
                 context['block'] = block
-                result = block.nodelist.render(context)
+                yield block
                 if push is not None:
                     block_context.push(self.name, push)
-        return result
 
     def super(self):
         if not hasattr(self, 'context'):
@@ -130,7 +143,20 @@ class ExtendsNode(Node):
 
     def render(self, context):
         compiled_parent = self.get_parent(context)
+        self.add_blocks(context, compiled_parent)
+        # Call Template._render explicitly so the parser context stays
+        # the same.
+        with context.render_context.push_state(compiled_parent, isolated_context=False):
+            return compiled_parent._render(context)
 
+    def render_iter(self, context):
+        compiled_parent = self.get_parent(context)
+        self.add_blocks(context, compiled_parent)
+        with context.render_context.push_state(compiled_parent, isolated_context=False):
+            yield from compiled_parent._render_iter(context)
+
+    def add_blocks(self, context, compiled_parent):
+        """Add the blocks of this template and its parent to the block context."""
         if BLOCK_CONTEXT_KEY not in context.render_context:
             context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
         block_context = context.render_context[BLOCK_CONTEXT_KEY]
@@ -149,11 +175,6 @@ class ExtendsNode(Node):
                     block_context.add_blocks(blocks)
                 break
 
-        # Call Template._render explicitly so the parser context stays
-        # the same.
-        with context.render_context.push_state(compiled_parent, isolated_context=False):
-            return compiled_parent._render(context)
-
 
 class IncludeNode(Node):
     context_key = '__include_context'
@@ -171,19 +192,7 @@ class IncludeNode(Node):
         loop.
         """
         try:
-            template = self.template.resolve(context)
-            # Does this quack like a Template?
-            if not callable(getattr(template, 'render', None)):
-                # If not, we'll try our cache, and get_template()
-                template_name = template
-                cache = context.render_context.dicts[0].setdefault(self, {})
-                template = cache.get(template_name)
-                if template is None:
-                    template = context.template.engine.get_template(template_name)
-                    cache[template_name] = template
-            # Use the base.Template of a backends.django.Template.
-            elif hasattr(template, 'template'):
-                template = template.template
+            template = self.get_template(context)
             values = {
                 name: var.resolve(context)
                 for name, var in self.extra_context.items()
@@ -193,24 +202,73 @@ class IncludeNode(Node):
             with context.push(**values):
                 return template.render(context)
         except Exception as e:
-            if context.template.engine.debug:
-                raise
-            template_name = getattr(context, 'template_name', None) or 'unknown'
-            warnings.warn(
-                "Rendering {%% include '%s' %%} raised %s. In Django 2.1, "
-                "this exception will be raised rather than silenced and "
-                "rendered as an empty string." %
-                (template_name, e.__class__.__name__),
-                RemovedInDjango21Warning,
-            )
-            logger.warning(
-                "Exception raised while rendering {%% include %%} for "
-                "template '%s'. Empty string rendered instead.",
-                template_name,
-                exc_info=True,
-            )
+            self.render_failed(context, e)
             return ''
 
+    def render_iter(self, context):
+        """
+        Like render() but stream the output of the included template. If the
+        rendering fails after some chunks have been yielded and debug is
+        False, the output of the included template is truncated.
+        """
+        try:
+            template = self.get_template(context)
+            values = {
+                name: var.resolve(context)
+                for name, var in self.extra_context.items()
+            }
+            if not hasattr(template, 'render_iter'):
+                if self.isolated_context:
+                    yield template.render(context.new(values))
+                else:
+                    with context.push(**values):
+                        yield template.render(context)
+            elif self.isolated_context:
+                yield from template.render_iter(context.new(values))
+            else:
+                with context.push(**values):
+                    yield from template.render_iter(context)
+        except Exception as e:
+            self.render_failed(context, e)
+
+    def get_template(self, context):
+        template = self.template.resolve(context)
+        # Does this quack like a Template?
+        if not callable(getattr(template, 'render', None)):
+            # If not, we'll try our cache, and get_template()
+            template_name = template
+            cache = context.render_context.dicts[0].setdefault(self, {})
+            template = cache.get(template_name)
+            if template is None:
+                template = context.template.engine.get_template(template_name)
+                cache[template_name] = template
+        # Use the base.Template of a backends.django.Template.
+        elif hasattr(template, 'template'):
+            template = template.template
+        return template
+
+    def render_failed(self, context, exception):
+        """
+        Handle an exception raised while rendering the included template.
+        Must be called from the except clause handling it.
+        """
+        if context.template.engine.debug:
+            raise
+        template_name = getattr(context, 'template_name', None) or 'unknown'
+        warnings.warn(
+            "Rendering {%% include '%s' %%} raised %s. In Django 2.1, "
+            "this exception will be raised rather than silenced and "
+            "rendered as an empty string." %
+            (template_name, exception.__class__.__name__),
+            RemovedInDjango21Warning,
+        )
+        logger.warning(
+            "Exception raised while rendering {%% include %%} for "
+            "template '%s'. Empty string rendered instead.",
+            template_name,
+            exc_info=True,
+        )
+
 
 @register.tag('block')
 def do_block(parser, token):
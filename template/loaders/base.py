@@ -26,12 +26,16 @@ class Loader:
                 tried.append((origin, 'Source does not exist'))
                 continue
             else:
-                return Template(
-                    contents, origin, origin.template_name, self.engine,
-                )
+                return self.create_template(contents, origin)
 
         raise TemplateDoesNotExist(template_name, tried=tried)
 
+    def create_template(self, contents, origin):
+        """Return a Template object for the contents loaded from origin."""
+        return Template(
+            contents, origin, origin.template_name, self.engine,
+        )
+
     def get_template_sources(self, template_name):
         """
         An iterator that yields possible matching template paths for a
@@ -4,20 +4,73 @@ to load templates from them in order, caching the result.
 """
 
 import hashlib
-
+import io
+import logging
+import os
+import pickle
+import sys
+import tempfile
+
+import django
+from django.core.cache import caches
 from django.template import TemplateDoesNotExist
 from django.template.backends.django import copy_exception
 from django.utils.encoding import force_bytes
+from django.utils.functional import cached_property
 
 from .base import Loader as BaseLoader
 
+logger = logging.getLogger('django.template')
+
+
+class TemplatePickler(pickle.Pickler):
+    """
+    Pickle templates, replacing the engine and the loaders they reference by
+    persistent IDs.
+    """
+    def __init__(self, file, loader):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.engine = loader.engine
+        self.loader_ids = {id(loader): 0}
+        self.loader_ids.update((id(child), i) for i, child in enumerate(loader.loaders, 1))
+
+    def persistent_id(self, obj):
+        if obj is self.engine:
+            return ('engine',)
+        if isinstance(obj, BaseLoader):
+            try:
+                return ('loader', self.loader_ids[id(obj)])
+            except KeyError:
+                raise pickle.PicklingError("Can't pickle a reference to %r." % obj)
+        return None
 
-class Loader(BaseLoader):
 
-    def __init__(self, engine, loaders):
+class TemplateUnpickler(pickle.Unpickler):
+    def __init__(self, file, loader):
+        super().__init__(file)
+        self.engine = loader.engine
+        self.loaders = [loader] + loader.loaders
+
+    def persistent_load(self, pid):
+        if pid[0] == 'engine':
+            return self.engine
+        return self.loaders[pid[1]]
+
+
+class Loader(BaseLoader):
+    """
+    If `persistent_cache` is given, parsed templates are also pickled to a
+    persistent cache shared between processes, so that new processes don't
+    have to parse them again. It's a dict with either a 'dir' key, the path
+    of a directory to store them in, or a 'cache' key, the alias of a cache in
+    the CACHES setting.
+    """
+
+    def __init__(self, engine, loaders, persistent_cache=None):
         self.template_cache = {}
         self.get_template_cache = {}
         self.loaders = engine.get_template_loaders(loaders)
+        self.persistent_cache = persistent_cache or {}
         super().__init__(engine)
 
     def get_contents(self, origin):
@@ -61,6 +114,83 @@ class Loader(BaseLoader):
 
         return template
 
+    def create_template(self, contents, origin):
+        if not self.persistent_cache:
+            return super().create_template(contents, origin)
+        key = self.persistent_cache_key(contents, origin)
+        data = self.read_persistent_cache(key)
+        if data is not None:
+            try:
+                template = TemplateUnpickler(io.BytesIO(data), self).load()
+            except Exception:
+                logger.debug("Couldn't unpickle the template '%s'.", origin.name, exc_info=True)
+            else:
+                if self.engine.compile_templates:
+                    from django.template.compiler import compile_nodelist
+                    compile_nodelist(template.nodelist)
+                return template
+        template = super().create_template(contents, origin)
+        data = io.BytesIO()
+        try:
+            TemplatePickler(data, self).dump(template)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug("Couldn't pickle the template '%s'.", origin.name, exc_info=True)
+        else:
+            self.write_persistent_cache(key, data.getvalue())
+        return template
+
+    def persistent_cache_key(self, contents, origin):
+        return self.generate_hash([
+            self.persistent_cache_version, origin.name, str(origin.template_name), contents,
+        ])
+
+    @cached_property
+    def persistent_cache_version(self):
+        """
+        Hash what parsed templates depend on besides their source: the Django
+        and Python versions, the debug option, which selects the lexer, and
+        the template tag libraries along with the modification times of their
+        modules.
+        """
+        values = [django.__version__, sys.version, str(self.engine.debug)]
+        for module_name in sorted(set(self.engine.builtins) | set(self.engine.libraries.values())):
+            path = getattr(sys.modules.get(module_name), '__file__', None)
+            try:
+                mtime = os.stat(path).st_mtime if path else None
+            except OSError:
+                mtime = None
+            values.append('%s:%s' % (module_name, mtime))
+        return self.generate_hash(values)
+
+    def read_persistent_cache(self, key):
+        if 'cache' in self.persistent_cache:
+            return caches[self.persistent_cache['cache']].get('template.%s' % key)
+        try:
+            with open(os.path.join(self.persistent_cache['dir'], key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write_persistent_cache(self, key, data):
+        if 'cache' in self.persistent_cache:
+            caches[self.persistent_cache['cache']].set('template.%s' % key, data, None)
+            return
+        cache_dir = self.persistent_cache['dir']
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file and move it into place so that other
+            # processes never read a partially written file.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            try:
+                with open(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, os.path.join(cache_dir, key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError:
+            logger.debug("Couldn't write to the template cache directory '%s'.", cache_dir, exc_info=True)
+
     def get_template_sources(self, template_name):
         for loader in self.loaders:
             yield from loader.get_template_sources(template_name)
@@ -1,4 +1,4 @@
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
 from .loader import get_template, select_template
 
@@ -143,3 +143,69 @@ class TemplateResponse(SimpleTemplateResponse):
                  status=None, charset=None, using=None):
         super().__init__(template, context, content_type, status, charset, using)
         self._request = request
+
+
+class StreamingTemplateResponse(StreamingHttpResponse):
+    """
+    A response that streams the output of a template while it's rendered.
+
+    As with TemplateResponse, the template and the context are resolved when
+    render() is called, so that template response middleware may still change
+    them. The output is streamed in chunks of at least `chunk_size`
+    characters, except for the last one.
+    """
+    chunk_size = 8192
+
+    def __init__(self, request, template, context=None, content_type=None,
+                 status=None, charset=None, using=None):
+        self.template_name = template
+        self.context_data = context
+        self.using = using
+        self._request = request
+        super().__init__((), content_type, status, charset=charset)
+        self._is_rendered = False
+
+    def resolve_template(self, template):
+        """Accept a template object, path-to-template, or list of paths."""
+        if isinstance(template, (list, tuple)):
+            return select_template(template, using=self.using)
+        elif isinstance(template, str):
+            return get_template(template, using=self.using)
+        else:
+            return template
+
+    def resolve_context(self, context):
+        return context
+
+    def render(self):
+        """
+        Set the streaming content of the response to the output of the
+        template. If the content has already been set, this is a no-op.
+        """
+        if not self._is_rendered:
+            template = self.resolve_template(self.template_name)
+            context = self.resolve_context(self.context_data)
+            if hasattr(template, 'render_iter'):
+                chunks = template.render_iter(context, self._request)
+            else:
+                chunks = [template.render(context, self._request)]
+            self.streaming_content = self._join_chunks(chunks)
+            self._is_rendered = True
+        return self
+
+    @property
+    def is_rendered(self):
+        return self._is_rendered
+
+    def _join_chunks(self, chunks):
+        buffer = []
+        size = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= self.chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield ''.join(buffer)
@@ -40,6 +40,14 @@ class TokenBase:
         return "(" + " ".join(out) + ")"
 
 
+def create_operator(op_id):
+    """
+    Return an instance of the operator class for op_id. Operator classes are
+    local to infix() and prefix(), this allows pickling their instances.
+    """
+    return OPERATORS[op_id]()
+
+
 def infix(bp, func):
     """
     Create an infix operator, given a binding power and a function that
@@ -62,6 +70,9 @@ def infix(bp, func):
                 # %} where 'bar' does not support 'in', so default to False
                 return False
 
+        def __reduce__(self):
+            return (create_operator, (self.id,), self.__dict__)
+
     return Operator
 
 
@@ -84,6 +95,9 @@ def prefix(bp, func):
             except Exception:
                 return False
 
+        def __reduce__(self):
+            return (create_operator, (self.id,), self.__dict__)
+
     return Operator
 
 
@@ -98,6 +98,15 @@ def instrumented_test_render(self, context):
     return self.nodelist.render(context)
 
 
+def instrumented_test_render_iter(self, context):
+    """
+    An instrumented Template render_iter method, providing a signal that can
+    be intercepted by the test Client.
+    """
+    template_rendered.send(sender=self, template=self, context=context)
+    return self.nodelist.render_iter(context)
+
+
 class _TestState:
     pass
 
@@ -132,6 +141,8 @@ def setup_test_environment(debug=None):
 
     saved_data.template_render = Template._render
     Template._render = instrumented_test_render
+    saved_data.template_render_iter = Template._render_iter
+    Template._render_iter = instrumented_test_render_iter
 
     mail.outbox = []
 
@@ -149,6 +160,7 @@ def teardown_test_environment():
     settings.DEBUG = saved_data.debug
     settings.EMAIL_BACKEND = saved_data.email_backend
     Template._render = saved_data.template_render
+    Template._render_iter = saved_data.template_render_iter
 
     del _TestState.saved_data
     del mail.outbox
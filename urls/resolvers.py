@@ -8,6 +8,7 @@ attributes of the resolved URL match.
 import functools
 import re
 import threading
+import uuid
 from importlib import import_module
 from urllib.parse import quote
 
@@ -21,7 +22,7 @@ from django.utils.http import RFC3986_SUBDELIMS
 from django.utils.regex_helper import normalize
 from django.utils.translation import get_language
 
-from .converters import get_converter
+from .converters import DEFAULT_CONVERTERS, get_converter
 from .exceptions import NoReverseMatch, Resolver404
 from .utils import get_callable
 
@@ -308,6 +309,48 @@ class LocalePrefixPattern:
         return self.language_prefix
 
 
+def _literal_prefix(pattern):
+    """
+    Return the literal text that every path matched by the pattern starts
+    with, or None if it can't be determined (e.g. translated or unanchored
+    patterns).
+    """
+    if type(pattern) is RoutePattern:
+        route = pattern._route
+        if not isinstance(route, str):
+            return None
+        match = _PATH_PARAMETER_COMPONENT_RE.search(route)
+        return route[:match.start()] if match else route
+    if type(pattern) is RegexPattern:
+        regex = pattern._regex
+        if not isinstance(regex, str) or not regex.startswith('^') or '|' in regex:
+            return None
+        # Inline flags such as (?i) apply to the whole expression.
+        if pattern.regex.flags != re.UNICODE:
+            return None
+        prefix = []
+        i = 1
+        while i < len(regex):
+            char = regex[i]
+            if char == '\\':
+                char = regex[i + 1:i + 2]
+                # Escapes such as \d or \1 aren't literals.
+                if not char or char.isalnum() or char == '_':
+                    break
+                step = 2
+            elif char in '.^$*+?{}[]()':
+                break
+            else:
+                step = 1
+            # A quantifier makes the character optional or repeated.
+            if regex[i + step:i + step + 1] in ('*', '+', '?', '{'):
+                break
+            prefix.append(char)
+            i += step
+        return ''.join(prefix)
+    return None
+
+
 class URLPattern:
     def __init__(self, pattern, callback, default_args=None, name=None):
         self.pattern = pattern
@@ -361,7 +404,16 @@ class URLPattern:
         return callback.__module__ + "." + callback.__qualname__
 
 
+# Types of reverse() arguments whose str() or built-in converter to_url()
+# output only depends on their value. URLs reversed from them are cached.
+_CACHEABLE_REVERSE_ARG_TYPES = {str, int, uuid.UUID}
+_CACHEABLE_REVERSE_CONVERTER_TYPES = {type(converter) for converter in DEFAULT_CONVERTERS.values()}
+
+
 class URLResolver:
+    # Maximum number of reversed URLs cached by each resolver.
+    reverse_cache_size = 1024
+
     def __init__(self, pattern, urlconf_name, default_kwargs=None, app_name=None, namespace=None):
         self.pattern = pattern
         # urlconf_name is the dotted Python path to the module defining
@@ -380,6 +432,13 @@ class URLResolver:
         self._callback_strs = set()
         self._populated = False
         self._local = threading.local()
+        # Index of url_patterns by the literal prefix of their pattern, see
+        # _build_resolve_index().
+        self._resolve_index = None
+        # Reverse candidates by (language, view, argument signature), see
+        # _reverse_candidates().
+        self._reverse_index = {}
+        self._cached_reverse = functools.lru_cache(maxsize=self.reverse_cache_size)(self._reverse_cached)
 
     def __repr__(self):
         if isinstance(self.urlconf_name, list) and len(self.urlconf_name):
@@ -413,6 +472,8 @@ class URLResolver:
             namespaces = {}
             apps = {}
             language_code = get_language()
+            if self._resolve_index is None:
+                self._resolve_index = self._build_resolve_index()
             for url_pattern in reversed(self.url_patterns):
                 p_pattern = url_pattern.pattern.regex.pattern
                 if p_pattern.startswith('^'):
@@ -485,21 +546,71 @@ class URLResolver:
             self._populate()
         return name in self._callback_strs
 
+    def _build_resolve_index(self):
+        """
+        Index url_patterns so that resolve() only tries the patterns that can
+        match a path. Patterns whose literal prefix is known are indexed by
+        that prefix up to and including its first '/' (which must equal the
+        first segment of the path) or, if the prefix has no '/', by the whole
+        prefix. The other patterns are always tried.
+        """
+        patterns = list(self.url_patterns)
+        always = []
+        by_segment = {}
+        by_prefix = {}
+        for index, url_pattern in enumerate(patterns):
+            prefix = None
+            if type(url_pattern) in (URLPattern, URLResolver):
+                prefix = _literal_prefix(url_pattern.pattern)
+            if not prefix:
+                always.append(index)
+            elif '/' in prefix:
+                by_segment.setdefault(prefix[:prefix.index('/') + 1], []).append(index)
+            else:
+                by_prefix.setdefault(prefix, []).append(index)
+        prefix_lengths = sorted({len(prefix) for prefix in by_prefix})
+        return patterns, always, by_segment, by_prefix, prefix_lengths
+
+    def _resolve_candidates(self, path):
+        """
+        Return url_patterns and the ordered indexes of those that may match
+        the path. The other patterns are certain not to match it.
+        """
+        if self._resolve_index is None and not self._populated:
+            self._populate()
+        if self._resolve_index is None:
+            # _populate() is in progress in this thread.
+            patterns = list(self.url_patterns)
+            return patterns, range(len(patterns))
+        patterns, always, by_segment, by_prefix, prefix_lengths = self._resolve_index
+        candidates = list(always)
+        slash = path.find('/')
+        if slash != -1:
+            candidates.extend(by_segment.get(path[:slash + 1], ()))
+        for length in prefix_lengths:
+            if length > len(path):
+                break
+            candidates.extend(by_prefix.get(path[:length], ()))
+        candidates.sort()
+        return patterns, candidates
+
     def resolve(self, path):
         path = str(path)  # path may be a reverse_lazy object
-        tried = []
+        tried = {}
         match = self.pattern.match(path)
         if match:
             new_path, args, kwargs = match
-            for pattern in self.url_patterns:
+            patterns, candidates = self._resolve_candidates(new_path)
+            for index in candidates:
+                pattern = patterns[index]
                 try:
                     sub_match = pattern.resolve(new_path)
                 except Resolver404 as e:
                     sub_tried = e.args[0].get('tried')
                     if sub_tried is not None:
-                        tried.extend([pattern] + t for t in sub_tried)
+                        tried[index] = [[pattern] + t for t in sub_tried]
                     else:
-                        tried.append([pattern])
+                        tried[index] = [[pattern]]
                 else:
                     if sub_match:
                         # Merge captured arguments in match with submatch
@@ -519,8 +630,16 @@ class URLResolver:
                             [self.app_name] + sub_match.app_names,
                             [self.namespace] + sub_match.namespaces,
                         )
-                    tried.append([pattern])
-            raise Resolver404({'tried': tried, 'path': new_path})
+                    tried[index] = [[pattern]]
+            # Patterns that weren't candidates didn't match the path, as if
+            # they had been tried.
+            tried_in_order = []
+            for index, pattern in enumerate(patterns):
+                if index in tried:
+                    tried_in_order.extend(tried[index])
+                else:
+                    tried_in_order.append([pattern])
+            raise Resolver404({'tried': tried_in_order, 'path': new_path})
         raise Resolver404({'path': path})
 
     @cached_property
@@ -557,6 +676,86 @@ class URLResolver:
     def reverse(self, lookup_view, *args, **kwargs):
         return self._reverse_with_prefix(lookup_view, '', *args, **kwargs)
 
+    def _reverse_candidates(self, language_code, lookup_view, args, kwargs):
+        """
+        Return the reverse_dict entries for lookup_view that accept the given
+        number of positional arguments or set of keyword arguments, and
+        whether URLs reversed from them may be cached. They may be if all
+        their converters are built-in converters, whose to_url() output only
+        depends on the value.
+        """
+        signature = len(args) if args else frozenset(kwargs)
+        key = (language_code, lookup_view, signature)
+        try:
+            return self._reverse_index[key]
+        except KeyError:
+            pass
+        candidates = []
+        cacheable = True
+        for possibility, pattern, defaults, converters in self.reverse_dict.getlist(lookup_view):
+            for result, params in possibility:
+                if args:
+                    if len(args) != len(params):
+                        continue
+                elif set(kwargs).symmetric_difference(params).difference(defaults):
+                    continue
+                # Regular expressions that validate the substitutions, by
+                # URL prefix.
+                checks = {}
+                candidates.append((result, params, defaults, converters, pattern, checks))
+                cacheable = cacheable and all(
+                    type(converter) in _CACHEABLE_REVERSE_CONVERTER_TYPES for converter in converters.values()
+                )
+        self._reverse_index[key] = candidates, cacheable
+        return candidates, cacheable
+
+    def _reverse_cached(self, language_code, lookup_view, _prefix, args, kwargs_items):
+        candidates, _ = self._reverse_candidates(language_code, lookup_view, args, dict(kwargs_items))
+        return self._reverse_from_candidates(candidates, _prefix, args, dict(kwargs_items))
+
+    def _reverse_from_candidates(self, candidates, _prefix, args, kwargs):
+        """
+        Return the URL built from the first candidate that matches the
+        arguments, or None if no candidate does.
+        """
+        for result, params, defaults, converters, pattern, checks in candidates:
+            if args:
+                candidate_subs = dict(zip(params, args))
+            else:
+                matches = True
+                for k, v in defaults.items():
+                    if kwargs.get(k, v) != v:
+                        matches = False
+                        break
+                if not matches:
+                    continue
+                candidate_subs = kwargs
+            # Convert the candidate subs to text using Converter.to_url().
+            text_candidate_subs = {}
+            for k, v in candidate_subs.items():
+                if k in converters:
+                    text_candidate_subs[k] = converters[k].to_url(v)
+                else:
+                    text_candidate_subs[k] = str(v)
+            # WSGI provides decoded URLs, without %xx escapes, and the URL
+            # resolver operates on such URLs. First substitute arguments
+            # without quoting to build a decoded URL and look for a match.
+            # Then, if we have a match, redo the substitution with quoted
+            # arguments in order to return a properly encoded URL.
+            candidate = _prefix + result % text_candidate_subs
+            try:
+                check = checks[_prefix]
+            except KeyError:
+                check = checks[_prefix] = re.compile('^%s%s' % (re.escape(_prefix), pattern))
+            if check.search(candidate):
+                # safe characters from `pchar` definition of RFC 3986
+                url = quote(candidate, safe=RFC3986_SUBDELIMS + '/~:@')
+                # Don't allow construction of scheme relative urls.
+                if url.startswith('//'):
+                    url = '/%%2F%s' % url[2:]
+                return url
+        return None
+
     def _reverse_with_prefix(self, lookup_view, _prefix, *args, **kwargs):
         if args and kwargs:
             raise ValueError("Don't mix *args and **kwargs in call to reverse()!")
@@ -564,45 +763,16 @@ class URLResolver:
         if not self._populated:
             self._populate()
 
-        possibilities = self.reverse_dict.getlist(lookup_view)
+        language_code = get_language()
+        candidates, cacheable = self._reverse_candidates(language_code, lookup_view, args, kwargs)
+        if cacheable and all(type(v) in _CACHEABLE_REVERSE_ARG_TYPES for v in args or kwargs.values()):
+            url = self._cached_reverse(language_code, lookup_view, _prefix, args, tuple(sorted(kwargs.items())))
+        else:
+            url = self._reverse_from_candidates(candidates, _prefix, args, kwargs)
+        if url is not None:
+            return url
 
-        for possibility, pattern, defaults, converters in possibilities:
-            for result, params in possibility:
-                if args:
-                    if len(args) != len(params):
-                        continue
-                    candidate_subs = dict(zip(params, args))
-                else:
-                    if set(kwargs).symmetric_difference(params).difference(defaults):
-                        continue
-                    matches = True
-                    for k, v in defaults.items():
-                        if kwargs.get(k, v) != v:
-                            matches = False
-                            break
-                    if not matches:
-                        continue
-                    candidate_subs = kwargs
-                # Convert the candidate subs to text using Converter.to_url().
-                text_candidate_subs = {}
-                for k, v in candidate_subs.items():
-                    if k in converters:
-                        text_candidate_subs[k] = converters[k].to_url(v)
-                    else:
-                        text_candidate_subs[k] = str(v)
-                # WSGI provides decoded URLs, without %xx escapes, and the URL
-                # resolver operates on such URLs. First substitute arguments
-                # without quoting to build a decoded URL and look for a match.
-                # Then, if we have a match, redo the substitution with quoted
-                # arguments in order to return a properly encoded URL.
-                candidate_pat = _prefix.replace('%', '%%') + result
-                if re.search('^%s%s' % (re.escape(_prefix), pattern), candidate_pat % text_candidate_subs):
-                    # safe characters from `pchar` definition of RFC 3986
-                    url = quote(candidate_pat % text_candidate_subs, safe=RFC3986_SUBDELIMS + '/~:@')
-                    # Don't allow construction of scheme relative urls.
-                    if url.startswith('//'):
-                        url = '/%%2F%s' % url[2:]
-                    return url
+        possibilities = self.reverse_dict.getlist(lookup_view)
         # lookup_view can be URL name or callable, but callables are not
         # friendly in error messages.
         m = getattr(lookup_view, '__module__', None)
@@ -406,6 +406,41 @@ def learn_cache_key(request, response, cache_timeout=None, key_prefix=None, cach
         return _generate_cache_key(request, request.method, [], key_prefix)
 
 
+# The headers of a response kept with its validators, so that 304 responses
+# built from them carry the headers required by section 4.1 of RFC 7232.
+VALIDATOR_HEADERS = ('Cache-Control', 'Content-Location', 'ETag', 'Expires', 'Last-Modified', 'Vary')
+
+
+def learn_cache_validators(request, response, cache_timeout=None, key_prefix=None, cache=None, extra=None):
+    """
+    Store the validators (ETag and Last-Modified headers) of the response to
+    a GET request, along with the other headers of a 304 response to it, so
+    that conditional requests can be answered without building the response.
+    The validators are keyed on the cache key of learn_cache_key(). extra is
+    any picklable value to store with them.
+    """
+    if cache_timeout is None:
+        cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
+    if cache is None:
+        cache = caches[settings.CACHE_MIDDLEWARE_ALIAS]
+    cache_key = learn_cache_key(request, response, cache_timeout, key_prefix, cache=cache)
+    headers = [(header, response[header]) for header in VALIDATOR_HEADERS if header in response]
+    cache.set('%s.validators' % cache_key, (headers, extra), cache_timeout)
+
+
+def get_cache_validators(request, key_prefix=None, cache=None):
+    """
+    Return the headers and the extra value stored by learn_cache_validators()
+    for the URL of the request, or None if there aren't any.
+    """
+    if cache is None:
+        cache = caches[settings.CACHE_MIDDLEWARE_ALIAS]
+    cache_key = get_cache_key(request, key_prefix, 'GET', cache=cache)
+    if cache_key is None:
+        return None
+    return cache.get('%s.validators' % cache_key)
+
+
 def _to_tuple(s):
     t = s.split('=', 1)
     if len(t) == 2:
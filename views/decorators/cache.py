@@ -5,7 +5,7 @@ from django.utils.cache import add_never_cache_headers, patch_cache_control
 from django.utils.decorators import decorator_from_middleware_with_args
 
 
-def cache_page(timeout, *, cache=None, key_prefix=None):
+def cache_page(timeout, *, cache=None, key_prefix=None, stale_timeout=None, early_expiration=None):
     """
     Decorator for views that tries getting the page from the cache and
     populates the cache if the page isn't in the cache yet.
@@ -18,9 +18,15 @@ def cache_page(timeout, *, cache=None, key_prefix=None):
 
     Additionally, all headers from the response's Vary header will be taken
     into account on caching -- just like the middleware does.
+
+    stale_timeout and early_expiration protect the view from being run by
+    many requests at once when the page expires; they default to the
+    CACHE_MIDDLEWARE_STALE_SECONDS and CACHE_MIDDLEWARE_EARLY_EXPIRATION
+    settings. See django.middleware.cache.
     """
     return decorator_from_middleware_with_args(CacheMiddleware)(
-        cache_timeout=timeout, cache_alias=cache, key_prefix=key_prefix
+        cache_timeout=timeout, cache_alias=cache, key_prefix=key_prefix,
+        stale_timeout=stale_timeout, early_expiration=early_expiration,
     )
 
 
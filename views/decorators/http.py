@@ -7,13 +7,30 @@ from calendar import timegm
 from functools import wraps
 
 from django.http import HttpResponseNotAllowed
-from django.middleware.http import ConditionalGetMiddleware
+from django.middleware.http import (
+    CachedConditionalGetMiddleware, ConditionalGetMiddleware,
+)
 from django.utils.cache import get_conditional_response
-from django.utils.decorators import decorator_from_middleware
+from django.utils.decorators import (
+    decorator_from_middleware, decorator_from_middleware_with_args,
+)
 from django.utils.http import http_date, quote_etag
 
 conditional_page = decorator_from_middleware(ConditionalGetMiddleware)
 
+
+def cache_validators(timeout=None, *, cache=None, key_prefix=None, models=()):
+    """
+    Decorator for views that answers conditional GET requests matching the
+    ETag or Last-Modified header of the view's previous response with a 304
+    response, without running the view. The validators are kept in the cache
+    for timeout seconds (CACHE_MIDDLEWARE_SECONDS by default) or until an
+    instance of one of the models is saved or deleted.
+    """
+    return decorator_from_middleware_with_args(CachedConditionalGetMiddleware)(
+        cache_timeout=timeout, cache_alias=cache, key_prefix=key_prefix, models=models,
+    )
+
 logger = logging.getLogger('django.request')
 
 